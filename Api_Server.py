@@ -0,0 +1,680 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program serves the clubs and events as JSON over HTTP, so other
+programs can use the data without reading the files. It only reads, and
+answers from the same in-memory indexes as the app:
+
+    GET /clubs?campus=&category=&keyword=&favourite=&from=&to=
+    GET /clubs/{id}
+    GET /events?from=YYYY-MM-DD&to=YYYY-MM-DD
+    GET /categories?campus=
+    GET /events.ics?campus=&category=&keyword=&favourite=&from=&to=
+    GET /favourites?user=&match=all|any
+
+Lists come a page at a time (limit=, at most MAX_PAGE_SIZE), and each page
+has the cursor to ask for the next one. Answers are gzipped if the client
+accepts it, and have an ETag made from the data version, so a client that
+sends If-None-Match gets an empty 304 answer until the data changes.
+/events.ics is an iCalendar file of the events of the matching clubs, which
+is sent in chunks while it is made instead of all at once. /favourites is
+the clubs that all (or any) of the users given favourited, from
+User_Favourites, with how many of them favourited each club.
+
+It is a small HTTP/1.1 server on asyncio, so no web framework has to be
+installed. Answers are worked out in worker threads, so a slow one (e.g.
+after the files changed) does not hold up the other connections. Start it
+from the project folder with:
+    python Api_Server.py --port 8452
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import argparse
+import asyncio
+import base64
+import bisect
+import datetime
+import gzip
+import hashlib
+import json
+import traceback
+import zlib
+from urllib.parse import parse_qs, unquote, urlsplit
+from Club_Store import club_store
+from Club_Query import find_clubs
+from Facet_Index import facet_index
+from Ics_Export import export_ics
+from Query_Cache import QueryCache
+from Snapshot import refresh_snapshot, source_digest
+from User_Favourites import user_favourites
+
+HOST = "127.0.0.1"
+PORT = 8452
+
+# how many items a page has when limit is not given, and at most
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# smaller answers are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+# the longest request line and headers that are read
+MAX_HEADER_BYTES = 16384
+
+REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    410: "Gone",
+    500: "Internal Server Error",
+}
+
+
+class ApiError(Exception):
+    """
+    An error to send back to the client.
+
+    Attributes:
+    status: The HTTP status code.
+    message: What went wrong.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def club_id(url: str) -> str:
+    """
+    Makes the id of a club for /clubs/{id}, the last part of its url.
+
+    :param url: The original url of the club.
+    :return: The id, e.g. 4nf-dance-club.
+    """
+    return url.rstrip("/").rsplit("/", 1)[-1]
+
+
+def club_summary(club) -> dict:
+    """
+    The fields of a club shown in a list, without the description and
+    events, which can be long.
+
+    :param club: The Club object.
+    :return: A dictionary.
+    """
+    return {
+        "id": club_id(club.get_original_url()),
+        "name": club.get_name(),
+        "campus": club.get_campus(),
+        "categories": club.get_categories(),
+        "is_favourited": club.get_is_favourited(),
+        "original_url": club.get_original_url(),
+    }
+
+
+def parse_date(value: str, name: str) -> datetime.date:
+    """
+    Reads a date parameter.
+
+    :param value: The value, YYYY-MM-DD, or None.
+    :param name: The name of the parameter, for the error.
+    :return: The date, or None if it was not given.
+    """
+    if value is None:
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be a date like 2024-10-31")
+
+
+def club_filters(params: dict) -> dict:
+    """
+    Reads the parameters that filter clubs.
+
+    :param params: The query parameters: campus, category (can be given
+    more than once, all have to match), keyword (any has to match),
+    favourite (true or false), from and to (dates of events).
+    :return: A dictionary of the find_clubs arguments.
+    """
+    favourite = params.get("favourite", [None])[0]
+    if favourite not in (None, "true", "false"):
+        raise ApiError(400, "favourite must be true or false")
+    return {
+        "campus": params.get("campus", [None])[0],
+        "all_categories": params.get("category", []),
+        "keywords": params.get("keyword", []),
+        "favourite": None if favourite is None else favourite == "true",
+        "events_from": parse_date(params.get("from", [None])[0], "from"),
+        "events_to": parse_date(params.get("to", [None])[0], "to"),
+    }
+
+
+def gzip_chunks(chunks):
+    """
+    Gzips a body that is sent in chunks, one chunk at a time.
+
+    :param chunks: An iterator of bytes.
+    :return: An iterator of gzipped bytes.
+    """
+    # wbits 31 makes a gzip header, like gzip.compress
+    compressor = zlib.compressobj(5, zlib.DEFLATED, 31)
+    try:
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+    finally:
+        chunks.close()
+
+
+class ClubApi:
+    """
+    The ClubApi class. It answers requests, without knowing about sockets.
+
+    Attributes:
+    store: The ClubStore with the clubs.
+    cache: The lists and answers already worked out for the data version.
+    loads: The store loads by_id was made for.
+    by_id: A dictionary of club id -> Club.
+    """
+
+    def __init__(self, store=club_store):
+        """
+        Constructor for the ClubApi class.
+        """
+        self.store = store
+        self.cache = QueryCache()
+        self.loads = None
+        self.by_id = {}
+
+    def data_version(self) -> str:
+        """
+        Gets the version of the data, which changes when the clubs or
+        events change, including favourites and the favourites of users.
+
+        :return: The version as text.
+        """
+        users = hashlib.blake2b(
+            repr(user_favourites.get_signature()).encode(), digest_size=8
+        )
+        return (
+            f"{self.store.get_version()}-{source_digest().hex()}"
+            f"-{users.hexdigest()}"
+        )
+
+    def handle(self, method: str, target: str, headers: dict) -> tuple:
+        """
+        Answers one request.
+
+        :param method: The HTTP method, e.g. GET.
+        :param target: The path and query, e.g. /clubs?campus=UTM.
+        :param headers: A dictionary of lowercase header name -> value.
+        :return: A tuple of the status code, a dictionary of headers and the
+        body, as bytes or as an iterator of bytes to send in chunks.
+        """
+        if method not in ("GET", "HEAD"):
+            return self.error(405, "only GET and HEAD are supported")
+
+        version = self.data_version()
+        compress = "gzip" in headers.get("accept-encoding", "")
+        etag = '"{}"'.format(
+            hashlib.blake2b(
+                f"{version} {target} {compress}".encode(), digest_size=12
+            ).hexdigest()
+        )
+        response_headers = {
+            "Content-Type": "application/json",
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+        }
+
+        # the client already has this answer
+        sent = headers.get("if-none-match", "")
+        if etag in [tag.strip().removeprefix("W/") for tag in sent.split(",")]:
+            return 304, response_headers, b""
+
+        # the calendar is saved by export_ics, not kept in memory
+        if urlsplit(target).path == "/events.ics":
+            try:
+                body = self.export_calendar(target)
+            except ApiError as e:
+                return self.error(e.status, e.message)
+            response_headers["Content-Type"] = "text/calendar; charset=utf-8"
+            if compress:
+                response_headers["Content-Encoding"] = "gzip"
+                body = gzip_chunks(body)
+            return 200, response_headers, body
+
+        try:
+            body = self.cache.get(
+                ("answer", target, compress),
+                version,
+                lambda: self.encode(self.route(target, version), compress),
+            )
+        except ApiError as e:
+            return self.error(e.status, e.message)
+
+        if body.startswith(b"\x1f\x8b"):
+            response_headers["Content-Encoding"] = "gzip"
+        return 200, response_headers, body
+
+    def error(self, status: int, message: str) -> tuple:
+        """
+        Makes an error answer.
+
+        :param status: The HTTP status code.
+        :param message: What went wrong.
+        :return: A tuple like the one from handle.
+        """
+        body = json.dumps({"error": message}).encode()
+        return status, {"Content-Type": "application/json"}, body
+
+    def encode(self, data, compress: bool) -> bytes:
+        """
+        Turns an answer into bytes.
+
+        :param data: The answer.
+        :param compress: True if the client accepts gzip.
+        :return: The JSON, gzipped if it is worth it.
+        """
+        body = json.dumps(data, separators=(",", ":")).encode()
+        if compress and len(body) >= GZIP_MIN_BYTES:
+            # level 5 is almost as small as 9 for JSON and a lot faster
+            return gzip.compress(body, compresslevel=5)
+        return body
+
+    def export_calendar(self, target: str):
+        """
+        Answers /events.ics, the events of the matching clubs as an
+        iCalendar file.
+
+        :param target: The path and query, with the same filters as /clubs.
+        :return: An iterator of bytes.
+        """
+        params = {
+            name: values
+            for name, values in parse_qs(urlsplit(target).query).items()
+            if values
+        }
+        # the filters are read now, so a bad one is a 400 and not a broken
+        # calendar
+        return export_ics(**club_filters(params))
+
+    def route(self, target: str, version: str):
+        """
+        Works out the answer for a path.
+
+        :param target: The path and query.
+        :param version: The data version.
+        :return: The answer, to be turned into JSON.
+        """
+        parts = urlsplit(target)
+        params = {
+            name: values
+            for name, values in parse_qs(parts.query).items()
+            if values
+        }
+        path = [unquote(part) for part in parts.path.split("/") if part]
+
+        if path == ["clubs"]:
+            return self.list_clubs(params, version)
+        if len(path) == 2 and path[0] == "clubs":
+            return self.get_club(path[1])
+        if path == ["events"]:
+            return self.list_events(params, version)
+        if path == ["categories"]:
+            return self.list_categories(params)
+        if path == ["favourites"]:
+            return self.list_favourites(params, version)
+        raise ApiError(404, f"no such path: {parts.path}")
+
+    def page(self, items: list, params: dict, version: str) -> dict:
+        """
+        Cuts one page out of a list. The cursor says where the last page
+        ended and which data version it was for, so pages never skip or
+        repeat items while the data stays the same.
+
+        :param items: The whole list, in the same order every time.
+        :param params: The query parameters, with cursor and limit.
+        :param version: The data version.
+        :return: A dictionary with the items of the page, the cursor of the
+        next page (None on the last page) and the total.
+        """
+        try:
+            limit = int(params.get("limit", [PAGE_SIZE])[0])
+        except ValueError:
+            raise ApiError(400, "limit must be a number")
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ApiError(400, f"limit must be from 1 to {MAX_PAGE_SIZE}")
+
+        start = 0
+        if "cursor" in params:
+            try:
+                cursor = base64.urlsafe_b64decode(params["cursor"][0]).decode()
+                cursor_version, start = cursor.rsplit(":", 1)
+                start = int(start)
+            except ValueError:
+                raise ApiError(400, "cursor is not valid")
+            if cursor_version != version:
+                raise ApiError(410, "the data changed, start again")
+
+        end = start + limit
+        cursor = None
+        if end < len(items):
+            cursor = base64.urlsafe_b64encode(
+                f"{version}:{end}".encode()
+            ).decode()
+        return {
+            "items": items[start:end],
+            "next_cursor": cursor,
+            "total": len(items),
+        }
+
+    def list_clubs(self, params: dict, version: str) -> dict:
+        """
+        Answers /clubs, the clubs that match the filters.
+
+        :param params: The query parameters, see club_filters.
+        :param version: The data version.
+        :return: A page of club summaries.
+        """
+        query = club_filters(params)
+
+        # pages of the same query share one list of the matching clubs
+        key = ("clubs",) + tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in query.items()
+        )
+        clubs = self.cache.get(
+            key,
+            version,
+            lambda: [club_summary(club) for club in find_clubs(**query)],
+        )
+        return self.page(clubs, params, version)
+
+    def get_club(self, identifier: str) -> dict:
+        """
+        Answers /clubs/{id}, everything about one club.
+
+        :param identifier: The club id.
+        :return: The club with its description and events.
+        """
+        self.store.refresh()
+        # requests are answered in several threads, so the clubs are read
+        # once and the index is swapped in whole
+        loads, clubs = self.store.loads, self.store.clubs
+        if self.loads != loads:
+            self.by_id = {
+                club_id(club.get_original_url()): club for club in clubs
+            }
+            self.loads = loads
+
+        club = self.by_id.get(identifier)
+        if club is None:
+            raise ApiError(404, f"no club with id {identifier}")
+        return {
+            **club_summary(club),
+            "description": club.get_description(),
+            "contacts": club.get_contacts(),
+            "events": club.get_events(),
+        }
+
+    def list_events(self, params: dict, version: str) -> dict:
+        """
+        Answers /events, the events between two dates, by date.
+
+        :param params: The query parameters: from and to (dates, either
+        can be left out).
+        :param version: The data version.
+        :return: A page of events.
+        """
+        first = parse_date(params.get("from", [None])[0], "from")
+        last = parse_date(params.get("to", [None])[0], "to")
+
+        def find_events():
+            by_date = refresh_snapshot()["events_by_date"]
+            ordinals = sorted(by_date)
+            start = (
+                bisect.bisect_left(ordinals, first.toordinal()) if first else 0
+            )
+            end = (
+                bisect.bisect_right(ordinals, last.toordinal())
+                if last
+                else len(ordinals)
+            )
+            return [
+                event
+                for ordinal in ordinals[start:end]
+                for event in by_date[ordinal]
+            ]
+
+        events = self.cache.get(("events", first, last), version, find_events)
+        return self.page(events, params, version)
+
+    def list_categories(self, params: dict) -> dict:
+        """
+        Answers /categories, every category with its number of clubs.
+
+        :param params: The query parameters: campus (optional).
+        :return: A dictionary with the list of categories.
+        """
+        campus = params.get("campus", [None])[0]
+        catalog = self.store.get_catalog()
+        counts = facet_index.category_counts(catalog, campus)
+        favourites = facet_index.category_counts(catalog, campus, True)
+        return {
+            "items": [
+                {
+                    "name": category,
+                    "clubs": counts[category],
+                    "favourites": favourites[category],
+                }
+                for category in catalog
+                if counts[category]
+            ]
+        }
+
+    def list_favourites(self, params: dict, version: str) -> dict:
+        """
+        Answers /favourites, the clubs that the users favourited.
+
+        :param params: The query parameters: user (given once per user) and
+        match, all (the default) for the clubs every user favourited or any
+        for the clubs at least one of them did.
+        :param version: The data version.
+        :return: A page of club summaries, each with the number of the users
+        that favourited it, in the order of the clubs.
+        """
+        users = params.get("user", [])
+        if not users:
+            raise ApiError(400, "give at least one user")
+        match = params.get("match", ["all"])[0]
+        if match not in ("all", "any"):
+            raise ApiError(400, "match must be all or any")
+
+        def find_favourites():
+            if match == "all":
+                urls = set(user_favourites.common_favourites(users))
+            else:
+                urls = set(user_favourites.any_favourites(users))
+            counts = user_favourites.favourite_counts(users)
+            self.store.refresh()
+            return [
+                {
+                    **club_summary(club),
+                    "users": counts[club.get_original_url()],
+                }
+                for club in self.store.clubs
+                if club.get_original_url() in urls
+            ]
+
+        key = ("favourites", tuple(users), match)
+        clubs = self.cache.get(key, version, find_favourites)
+        return self.page(clubs, params, version)
+
+
+async def handle_connection(api: ClubApi, reader, writer) -> None:
+    """
+    Answers the requests on one connection. The connection is kept open
+    for more requests unless the client asks to close it.
+
+    :param api: The ClubApi.
+    :param reader: The asyncio StreamReader.
+    :param writer: The asyncio StreamWriter.
+    """
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                break
+
+            request_line, *lines = head.decode("latin-1").split("\r\n")
+            headers = {}
+            for line in lines:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+
+            # a read-only API has no use for a body, but it has to be read
+            length = headers.get("content-length", "0")
+            if length.isdigit() and int(length):
+                await reader.readexactly(int(length))
+
+            try:
+                method, target, protocol = request_line.split(" ")
+            except ValueError:
+                status, response_headers, body = api.error(
+                    400, "bad request line"
+                )
+                method, protocol = "GET", "HTTP/1.0"
+            else:
+                try:
+                    status, response_headers, body = await asyncio.to_thread(
+                        api.handle, method, target, headers
+                    )
+                except Exception:
+                    # one bad request should not stop the server, and the
+                    # details are for the log, not the client
+                    print(f"Error answering {method} {target}:", flush=True)
+                    traceback.print_exc()
+                    status, response_headers, body = api.error(
+                        500, "internal server error"
+                    )
+
+            connection = headers.get("connection", "").lower()
+            keep_alive = (
+                connection == "keep-alive"
+                if protocol == "HTTP/1.0"
+                else connection != "close"
+            )
+
+            chunked = not isinstance(body, bytes)
+            if not chunked:
+                response_headers["Content-Length"] = str(len(body))
+            elif protocol == "HTTP/1.0":
+                # HTTP/1.0 has no chunks, the end of the body is the end of
+                # the connection
+                keep_alive = False
+            else:
+                response_headers["Transfer-Encoding"] = "chunked"
+            response_headers["Connection"] = (
+                "keep-alive" if keep_alive else "close"
+            )
+            lines = [f"HTTP/1.1 {status} {REASONS[status]}"] + [
+                f"{name}: {value}" for name, value in response_headers.items()
+            ]
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            if method == "HEAD":
+                if chunked:
+                    body.close()
+            elif not chunked:
+                writer.write(body)
+            else:
+                try:
+                    while True:
+                        # each chunk is made in a worker thread too
+                        chunk = await asyncio.to_thread(next, body, None)
+                        if chunk is None:
+                            break
+                        if not chunk:
+                            continue
+                        if protocol == "HTTP/1.0":
+                            writer.write(chunk)
+                        else:
+                            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                        # waits for a slow client instead of filling memory
+                        await writer.drain()
+                except ConnectionError:
+                    break
+                except Exception:
+                    # the status was already sent, so the client can only
+                    # tell from the connection closing without the last chunk
+                    print(f"Error sending {target}:", flush=True)
+                    traceback.print_exc()
+                    break
+                finally:
+                    body.close()
+                if protocol != "HTTP/1.0":
+                    writer.write(b"0\r\n\r\n")
+            await writer.drain()
+
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str = HOST, port: int = PORT) -> None:
+    """
+    Runs the server until it is stopped.
+
+    :param host: The address to listen on.
+    :param port: The port to listen on.
+    """
+    api = ClubApi()
+    # loads the clubs now, so the first request is not slow
+    club_store.refresh()
+
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(api, reader, writer),
+        host,
+        port,
+        limit=MAX_HEADER_BYTES,
+    )
+    print(f"Serving clubs and events on http://{host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve the clubs and events as JSON over HTTP."
+    )
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
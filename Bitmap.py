@@ -0,0 +1,362 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program is a compressed set of whole numbers (a bitmap), used
+for the club ids each user favourited. It works like a Roaring bitmap: the
+numbers are split by their top 16 bits into containers of up to 65536
+numbers. A container with few numbers is a sorted array of 2 byte numbers,
+and a full one is a row of 65536 bits, whichever is smaller. Intersections
+and unions work a container at a time and skip the containers only one side
+has.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import bisect
+import struct
+import sys
+from array import array
+
+# past this many numbers a container is smaller as bits than as an array
+ARRAY_LIMIT = 4096
+
+# the numbers in one container
+CONTAINER_SIZE = 1 << 16
+
+# container kinds in the saved bytes
+ARRAY = 0
+BITS = 1
+
+# number of containers, then for each: top 16 bits, kind, count of numbers
+HEADER = struct.Struct("<I")
+CONTAINER = struct.Struct("<HBI")
+
+BITS_BYTES = CONTAINER_SIZE // 8
+
+# the positions of the bits set in each byte value
+BYTE_BITS = [
+    tuple(i for i in range(8) if value >> i & 1) for value in range(256)
+]
+
+
+def bits_to_array(bits: int) -> array:
+    """
+    Lists the bits that are set in a bits container.
+
+    :param bits: The container as a Python int.
+    :return: A sorted array of the positions of the bits.
+    """
+    numbers = array("H")
+    # shifting a big int copies it, so the bits are read a byte at a time
+    for i, byte in enumerate(bits.to_bytes(BITS_BYTES, "little")):
+        if byte:
+            numbers.extend([i * 8 + bit for bit in BYTE_BITS[byte]])
+    return numbers
+
+
+def array_to_bits(numbers) -> int:
+    """
+    Sets the bits for an array container.
+
+    :param numbers: The numbers in the container.
+    :return: The container as a Python int.
+    """
+    data = bytearray(BITS_BYTES)
+    for number in numbers:
+        data[number >> 3] |= 1 << (number & 7)
+    return int.from_bytes(data, "little")
+
+
+def shrink(container):
+    """
+    Uses the smaller kind of container for the numbers.
+
+    :param container: An array or a Python int.
+    :return: The container, None if it is empty.
+    """
+    if isinstance(container, int):
+        if container.bit_count() > ARRAY_LIMIT:
+            return container
+        container = bits_to_array(container)
+    elif len(container) > ARRAY_LIMIT:
+        return array_to_bits(container)
+    return container or None
+
+
+def container_len(container) -> int:
+    """
+    Counts the numbers in a container.
+
+    :param container: An array or a Python int.
+    :return: The count.
+    """
+    if isinstance(container, int):
+        return container.bit_count()
+    return len(container)
+
+
+def intersect(a, b):
+    """
+    Finds the numbers in both containers.
+
+    :param a: An array or a Python int.
+    :param b: An array or a Python int.
+    :return: The container, None if it is empty.
+    """
+    if isinstance(a, int) and isinstance(b, int):
+        return shrink(a & b)
+    if isinstance(a, int):
+        a, b = b, a
+    if isinstance(b, int):
+        data = b.to_bytes(BITS_BYTES, "little")
+        return shrink(
+            array("H", [n for n in a if data[n >> 3] >> (n & 7) & 1])
+        )
+    return shrink(array("H", sorted(set(a).intersection(b))))
+
+
+def unite(a, b):
+    """
+    Finds the numbers in either container.
+
+    :param a: An array or a Python int.
+    :param b: An array or a Python int.
+    :return: The container.
+    """
+    if isinstance(a, int) or isinstance(b, int):
+        if not isinstance(a, int):
+            a = array_to_bits(a)
+        if not isinstance(b, int):
+            b = array_to_bits(b)
+        return shrink(a | b)
+    return shrink(array("H", sorted(set(a).union(b))))
+
+
+def subtract(a, b):
+    """
+    Finds the numbers in the first container but not the second.
+
+    :param a: An array or a Python int.
+    :param b: An array or a Python int.
+    :return: The container, None if it is empty.
+    """
+    if isinstance(a, int):
+        if not isinstance(b, int):
+            b = array_to_bits(b)
+        return shrink(a & ~b)
+    if isinstance(b, int):
+        data = b.to_bytes(BITS_BYTES, "little")
+        return shrink(
+            array("H", [n for n in a if not data[n >> 3] >> (n & 7) & 1])
+        )
+    return shrink(array("H", sorted(set(a).difference(b))))
+
+
+class Bitmap:
+    """
+    The Bitmap class.
+
+    Attributes:
+    containers: A dictionary of top 16 bits -> container, where a container
+    is a sorted array of the bottom 16 bits of the numbers, or a Python int
+    with those bits set. Empty containers are removed.
+    """
+
+    def __init__(self, numbers=()):
+        """
+        Constructor for the Bitmap class.
+
+        :param numbers: The numbers to start with.
+        """
+        self.containers = {}
+        for number in sorted(numbers):
+            self.add(number)
+
+    def add(self, number: int) -> None:
+        """
+        Adds a number.
+
+        :param number: A whole number from 0 to 2**32 - 1.
+        """
+        high, low = divmod(number, CONTAINER_SIZE)
+        container = self.containers.get(high)
+        if container is None:
+            self.containers[high] = array("H", [low])
+        elif isinstance(container, int):
+            self.containers[high] = container | 1 << low
+        elif not container or container[-1] < low:
+            # numbers usually come in order, so this is the common case
+            container.append(low)
+            self.containers[high] = shrink(container)
+        elif low not in container:
+            container.insert(bisect.bisect_left(container, low), low)
+            self.containers[high] = shrink(container)
+
+    def discard(self, number: int) -> None:
+        """
+        Removes a number if it is there.
+
+        :param number: A whole number.
+        """
+        high, low = divmod(number, CONTAINER_SIZE)
+        container = self.containers.get(high)
+        if container is None or number not in self:
+            return
+        if isinstance(container, int):
+            container = shrink(container & ~(1 << low))
+        else:
+            container.remove(low)
+            container = shrink(container)
+        if container is None:
+            del self.containers[high]
+        else:
+            self.containers[high] = container
+
+    def __contains__(self, number: int) -> bool:
+        high, low = divmod(number, CONTAINER_SIZE)
+        container = self.containers.get(high)
+        if container is None:
+            return False
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        i = bisect.bisect_left(container, low)
+        return i < len(container) and container[i] == low
+
+    def __len__(self) -> int:
+        return sum(map(container_len, self.containers.values()))
+
+    def __iter__(self):
+        for high in sorted(self.containers):
+            container = self.containers[high]
+            if isinstance(container, int):
+                container = bits_to_array(container)
+            base = high * CONTAINER_SIZE
+            for low in container:
+                yield base + low
+
+    def __eq__(self, other) -> bool:
+        # a container always has the smaller kind, so equal bitmaps have
+        # equal containers
+        return (
+            isinstance(other, Bitmap) and self.containers == other.containers
+        )
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        result = Bitmap()
+        for high in self.containers.keys() & other.containers.keys():
+            container = intersect(
+                self.containers[high], other.containers[high]
+            )
+            if container is not None:
+                result.containers[high] = container
+        return result
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        result = Bitmap()
+        for high in self.containers.keys() | other.containers.keys():
+            if high not in other.containers:
+                result.containers[high] = copy_container(self.containers[high])
+            elif high not in self.containers:
+                result.containers[high] = copy_container(
+                    other.containers[high]
+                )
+            else:
+                result.containers[high] = unite(
+                    self.containers[high], other.containers[high]
+                )
+        return result
+
+    def __sub__(self, other: "Bitmap") -> "Bitmap":
+        result = Bitmap()
+        for high, container in self.containers.items():
+            if high in other.containers:
+                container = subtract(container, other.containers[high])
+            else:
+                container = copy_container(container)
+            if container is not None:
+                result.containers[high] = container
+        return result
+
+    def intersection_len(self, other: "Bitmap") -> int:
+        """
+        Counts the numbers in both bitmaps without making the intersection.
+
+        :param other: Another Bitmap.
+        :return: The count.
+        """
+        count = 0
+        for high in self.containers.keys() & other.containers.keys():
+            a, b = self.containers[high], other.containers[high]
+            if isinstance(a, int) and isinstance(b, int):
+                count += (a & b).bit_count()
+            else:
+                count += container_len(intersect(a, b) or array("H"))
+        return count
+
+    def to_bytes(self) -> bytes:
+        """
+        Saves the bitmap as bytes, see HEADER and CONTAINER.
+
+        :return: The bytes.
+        """
+        parts = [HEADER.pack(len(self.containers))]
+        for high in sorted(self.containers):
+            container = self.containers[high]
+            if isinstance(container, int):
+                parts.append(CONTAINER.pack(high, BITS, container.bit_count()))
+                parts.append(container.to_bytes(BITS_BYTES, "little"))
+            else:
+                parts.append(CONTAINER.pack(high, ARRAY, len(container)))
+                numbers = array("H", container)
+                if sys.byteorder == "big":
+                    numbers.byteswap()
+                parts.append(numbers.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data) -> "Bitmap":
+        """
+        Reads a bitmap saved with to_bytes.
+
+        :param data: The bytes, or a memoryview of them.
+        :return: The Bitmap.
+        """
+        bitmap = cls()
+        (count,) = HEADER.unpack_from(data)
+        offset = HEADER.size
+        for _ in range(count):
+            high, kind, length = CONTAINER.unpack_from(data, offset)
+            offset += CONTAINER.size
+            if kind == BITS:
+                bitmap.containers[high] = int.from_bytes(
+                    data[offset : offset + BITS_BYTES], "little"
+                )
+                offset += BITS_BYTES
+            else:
+                numbers = array("H")
+                numbers.frombytes(data[offset : offset + 2 * length])
+                if sys.byteorder == "big":
+                    numbers.byteswap()
+                bitmap.containers[high] = numbers
+                offset += 2 * length
+        return bitmap
+
+
+def copy_container(container):
+    """
+    Copies a container, so changing one bitmap does not change another.
+
+    :param container: An array or a Python int.
+    :return: The copy.
+    """
+    if isinstance(container, int):
+        return container
+    return array("H", container)
@@ -12,14 +12,21 @@ Purpose: This program displays a club event calendar for the user to view
 events by month, search for events by keyword, and open event links.
 
 Date Created: 2024-11-13
-Date Last Modified: 2024-12-05
+Date Last Modified: 2026-10-19
 """
 
 from tkinter import *
 from tkinter import ttk
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
+from collections import OrderedDict
+import os
+import queue
+import threading
 import webbrowser
+from Database import group_events_by_date, load_from_file
+from Snapshot import refresh_snapshot
+from Type_Ahead import suggest_events
+from Search_Box import DEBOUNCE_MS
 
 
 # Load data from JSON file
@@ -30,16 +37,277 @@ def loadFromFile(filename):
     :param filename: The name of the file to load data from.
     :return: The loaded data as a list.
     """
-    try:
-        with open(filename, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
+    if not os.path.exists(filename):
         return []
+    # Works out if the file is JSON, gzip or msgpack
+    return load_from_file(filename)
 
 
-# Load event data from the saved JSON file
+# Name of the saved event data file
 EVENTS_FILE = "events.json"
-events = loadFromFile(EVENTS_FILE)
+
+# How often to look again for a month the background thread is still making
+MONTH_POLL_MS = 20
+
+# How often the background thread checks the events file while idle
+CHECK_SECONDS = 2
+
+
+def buildEventIndex(events):
+    """
+    Group events by the ordinal of their date, so a day's events can be
+    found with one dictionary lookup instead of a scan over every event.
+
+    :param events: The list of event dictionaries.
+    :return: A dictionary of date ordinal -> list of events on that day.
+    """
+    return group_events_by_date(events)
+
+
+class EventIndex:
+    """
+    A class to hold the events grouped by date. The index is only rebuilt
+    when the events file changes on disk.
+    """
+
+    def __init__(self, filename=EVENTS_FILE):
+        """
+        Initialize the EventIndex.
+
+        :param filename: The name of the events file to index.
+        """
+        self.filename = filename
+        self.signature = None
+        self.loaded = False
+        self.events = []
+        self.byDate = {}
+        self.lock = threading.Lock()  # Shared with the prefetch thread
+
+    def refresh(self):
+        """
+        Reload and regroup the events if the file changed since last time.
+
+        :return: True if the index was rebuilt, False otherwise.
+        """
+        try:
+            stat = os.stat(self.filename)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        with self.lock:
+            if self.loaded and signature == self.signature:
+                return False
+
+            # The snapshot already has the events grouped by date
+            snapshot = None
+            if self.filename == EVENTS_FILE and signature:
+                snapshot = refresh_snapshot()
+            if snapshot is not None:
+                events = snapshot["events"]
+                self.byDate = snapshot["events_by_date"]
+            else:
+                events = loadFromFile(self.filename) if signature else []
+                self.byDate = buildEventIndex(events)
+            self.events = events
+            self.signature = signature
+            self.loaded = True
+            return True
+
+    def getEvents(self):
+        """
+        Get all the events, reloading them first if the file changed.
+
+        :return: The list of event dictionaries.
+        """
+        self.refresh()
+        return self.events
+
+    def eventsForMonth(self, year, month):
+        """
+        Get the events for each day of a month.
+
+        :param year: The year of the month.
+        :param month: The month (1 to 12).
+        :return: A list with one list of events per day of the month.
+        """
+        self.refresh()
+        firstOrdinal = datetime(year, month, 1).toordinal()
+        daysInMonth = (
+            datetime(year + month // 12, month % 12 + 1, 1).toordinal()
+            - firstOrdinal
+        )
+        return [
+            self.byDate.get(firstOrdinal + day, [])
+            for day in range(daysInMonth)
+        ]
+
+
+def shiftMonth(year, month, offset):
+    """
+    Move a month forwards or backwards.
+
+    :param year: The year of the month.
+    :param month: The month (1 to 12).
+    :param offset: The number of months to move, negative to go back.
+    :return: A (year, month) tuple.
+    """
+    year, month = divmod(year * 12 + month - 1 + offset, 12)
+    return year, month + 1
+
+
+def buildMonthModel(eventIndex, year, month):
+    """
+    Work out everything the calendar needs to draw a month, so drawing it
+    is only a matter of copying text into the day cells.
+
+    :param eventIndex: The EventIndex to take the events from.
+    :param year: The year of the month.
+    :param month: The month (1 to 12).
+    :return: A dictionary with the title and the 6x7 cells of the month.
+    Each cell is None or a (day, [(title, url), ...]) tuple.
+    """
+    eventIndex.refresh()
+    # Read before the events, so a change in between only makes it look stale
+    signature = eventIndex.signature
+    monthEvents = eventIndex.eventsForMonth(year, month)
+
+    firstWeekday = datetime(year, month, 1).weekday()  # Monday = 0
+    cells = [None] * (6 * 7)
+    for day, dayEvents in enumerate(monthEvents, start=1):
+        cells[firstWeekday + day - 1] = (
+            day,
+            [
+                (event.get("title", "No Title"), event.get("original_url"))
+                for event in dayEvents
+            ],
+        )
+
+    return {
+        "year": year,
+        "month": month,
+        "title": datetime(year, month, 1).strftime("%B %Y"),
+        "cells": cells,
+        "signature": signature,
+    }
+
+
+class MonthModelCache:
+    """
+    A small LRU cache of month models. A background thread fills it with the
+    months around the one being shown, and is the only one to read the
+    events file and build models, so Next/Previous only draw a model that is
+    already made.
+    """
+
+    def __init__(self, eventIndex, radius=2, capacity=12):
+        """
+        Initialize the MonthModelCache and start its background thread.
+
+        :param eventIndex: The EventIndex to build the models from.
+        :param radius: How many months before and after to prepare.
+        :param capacity: The most months to keep.
+        """
+        self.eventIndex = eventIndex
+        self.radius = radius
+        # Always keep room for the months around the current one
+        self.capacity = max(capacity, 2 * radius + 3)
+        self.models = OrderedDict()
+        self.signature = None  # Of the events the models were built from
+        self.lock = threading.Lock()
+        self.requests = queue.Queue()
+
+        self.worker = threading.Thread(target=self.prefetchLoop, daemon=True)
+        self.worker.start()
+
+    def get(self, year, month):
+        """
+        Get a ready model for a month. Only the cache is read, the background
+        thread drops the models when the events file changes.
+
+        :param year: The year of the month.
+        :param month: The month (1 to 12).
+        :return: The month model, or None if it is not made yet.
+        """
+        with self.lock:
+            model = self.models.get((year, month))
+            if model is not None:
+                self.models.move_to_end((year, month))
+            return model
+
+    def put(self, model):
+        """
+        Add a model to the cache, dropping the least recently used ones.
+        A model built from events that changed since is left out.
+
+        :param model: The month model to add.
+        """
+        with self.lock:
+            if model["signature"] != self.signature:
+                return
+            key = (model["year"], model["month"])
+            self.models[key] = model
+            self.models.move_to_end(key)
+            while len(self.models) > self.capacity:
+                self.models.popitem(last=False)
+
+    def load(self, year, month):
+        """
+        Get the model for a month and start preparing the months around it.
+
+        :param year: The year of the month.
+        :param month: The month (1 to 12).
+        :return: The month model, or None if the background thread has not
+        made it yet, e.g. on the first display.
+        """
+        model = self.get(year, month)
+        self.requests.put((year, month))
+        return model
+
+    def checkEvents(self):
+        """
+        Background thread: reload the events if the file changed, and drop
+        the models made from the old ones.
+        """
+        self.eventIndex.refresh()
+        with self.lock:
+            if self.eventIndex.signature != self.signature:
+                self.models.clear()
+                self.signature = self.eventIndex.signature
+
+    def prefetchLoop(self):
+        """
+        Background thread: build the models around each requested month, and
+        notice a new events file even while no month is asked for.
+        """
+        shown = None
+        while True:
+            try:
+                year, month = self.requests.get(timeout=CHECK_SECONDS)
+            except queue.Empty:
+                if shown is None:
+                    continue
+                year, month = shown
+
+            # If the user clicked ahead, only the newest month matters
+            try:
+                while True:
+                    year, month = self.requests.get_nowait()
+            except queue.Empty:
+                pass
+            shown = (year, month)
+
+            self.checkEvents()
+
+            # Closest months first, since those are clicked next
+            for offset in sorted(
+                range(-self.radius, self.radius + 1), key=abs
+            ):
+                nearYear, nearMonth = shiftMonth(year, month, offset)
+                if self.get(nearYear, nearMonth) is None:
+                    self.put(
+                        buildMonthModel(self.eventIndex, nearYear, nearMonth)
+                    )
 
 
 class ClubEventCalendar(ttk.Frame):
@@ -132,6 +400,7 @@ class ClubEventCalendar(ttk.Frame):
         # Calendar grid
         self.calendarFrame = ttk.Frame(self, style="TFrame")
         self.calendarFrame.grid(row=2, column=0, columnspan=7, pady=5)
+        self.buildCalendarGrid()
 
         # Search bar
         self.searchFrame = ttk.Frame(self, style="TFrame")
@@ -145,6 +414,10 @@ class ClubEventCalendar(ttk.Frame):
         self.searchEntry = ttk.Entry(self.searchFrame, width=15)
         self.searchEntry.grid(row=0, column=1, padx=2)
 
+        # Suggest events while typing, once typing stops for a moment
+        self.pendingSuggestion = None
+        self.searchEntry.bind("<KeyRelease>", self.onSearchKey)
+
         self.searchButton = ttk.Button(
             self.searchFrame,
             text="Search",
@@ -160,33 +433,19 @@ class ClubEventCalendar(ttk.Frame):
         self.searchResultsText.grid(row=4, column=0, columnspan=7, pady=5)
         self.searchResultsText.config(state=DISABLED)
 
-        # Load events
-        self.allEvents = events
+        # Load events, grouped by date, and prepare months in the background
+        self.eventIndex = EventIndex(EVENTS_FILE)
+        self.monthModels = MonthModelCache(self.eventIndex)
+        self.pendingMonth = None
 
         # Display the calendar
         self.displayCalendar()
 
-    def displayCalendar(self):
+    def buildCalendarGrid(self):
         """
-        Display the calendar for the current month and year.
+        Create the day headers and a fixed 6x7 pool of day cells once.
+        Each month only reconfigures these cells instead of rebuilding them.
         """
-        # Update the month/year label
-        self.monthYearLabel.config(
-            text=f"{datetime(self.currentYear, self.currentMonth, 1).strftime('%B %Y')}"
-        )
-
-        # Clear previous calendar
-        for widget in self.calendarFrame.winfo_children():
-            widget.destroy()
-
-        # Determine the first day and number of days in the current month
-        firstDay = datetime(self.currentYear, self.currentMonth, 1)
-        firstWeekday = firstDay.weekday()  # Monday = 0, Sunday = 6
-        daysInMonth = (
-            firstDay.replace(month=self.currentMonth % 12 + 1, day=1)
-            - timedelta(days=1)
-        ).day
-
         # Add day labels
         days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         for col, day in enumerate(days):
@@ -198,53 +457,108 @@ class ClubEventCalendar(ttk.Frame):
             )
             lbl.grid(row=0, column=col, padx=2, pady=2)
 
-        # Add days of the month
-        row = 1
-        col = firstWeekday
-
-        for day in range(1, daysInMonth + 1):
-            dayDate = datetime(self.currentYear, self.currentMonth, day)
-            formattedDate = dayDate.strftime("%d %B, %Y")
-
-            # Day frame
+        # A month can spread over at most 6 weeks
+        self.dayCells = []
+        for cell in range(6 * 7):
             dayFrame = ttk.Frame(
                 self.calendarFrame,
                 relief="raised",
                 borderwidth=1,
                 style="TFrame",
             )
-            dayFrame.grid(row=row, column=col, padx=2, pady=2, sticky="nsew")
+            dayFrame.grid(
+                row=1 + cell // 7,
+                column=cell % 7,
+                padx=2,
+                pady=2,
+                sticky="nsew",
+            )
+            dayFrame.grid_remove()  # Hidden until a month uses it
             dayLabel = ttk.Label(
-                dayFrame, text=str(day), style="TLabel", font=(self.font, 10)
+                dayFrame, text="", style="TLabel", font=(self.font, 10)
             )
             dayLabel.pack(anchor="nw")
+            self.dayCells.append(
+                {
+                    "frame": dayFrame,
+                    "label": dayLabel,
+                    "events": [],
+                    "shown": 0,
+                }
+            )
 
-            # Events for the day
-            for event in self.allEvents:
-                if event.get("date") == formattedDate:
-                    # When I use wraplength in button will cause black screen issue. So I changed it to Label to avoid that issue
-                    eventLabel = ttk.Label(
-                        dayFrame,
-                        text=event.get("title", "No Title"),
-                        style="TLabel",
-                        wraplength=80,
-                        cursor="hand2",
-                        background=self.sec_color,
-                    )
+    def getEventLabel(self, dayCell, position):
+        """
+        Get the event label at a position in a day cell, creating it only if
+        this cell has never needed that many labels before.
+
+        :param dayCell: The day cell dictionary.
+        :param position: The position of the event in the day.
+        :return: The event label.
+        """
+        if position < len(dayCell["events"]):
+            return dayCell["events"][position]
+
+        # When I use wraplength in button will cause black screen issue. So I changed it to Label to avoid that issue
+        eventLabel = ttk.Label(
+            dayCell["frame"],
+            style="TLabel",
+            wraplength=80,
+            cursor="hand2",
+            background=self.sec_color,
+        )
+        eventLabel.url = None
+        # Can click to open URL, the URL is swapped when the label is reused
+        eventLabel.bind(
+            "<Button-1>",
+            lambda e, label=eventLabel: self.openEventLink(label.url),
+        )
+        dayCell["events"].append(eventLabel)
+        return eventLabel
+
+    def displayCalendar(self):
+        """
+        Display the calendar for the current month and year. If the month is
+        not made yet, the last month stays until it is.
+        """
+        if self.pendingMonth is not None:
+            self.after_cancel(self.pendingMonth)
+            self.pendingMonth = None
+
+        model = self.monthModels.load(self.currentYear, self.currentMonth)
+        if model is None:
+            # The background thread makes it, look again in a moment
+            self.pendingMonth = self.after(MONTH_POLL_MS, self.displayCalendar)
+            return
+
+        # Update the month/year label
+        self.monthYearLabel.config(text=model["title"])
+
+        for dayCell, cell in zip(self.dayCells, model["cells"]):
+            dayEvents = []
+
+            # Cells before the 1st or after the last day stay hidden
+            if cell is None:
+                dayCell["frame"].grid_remove()
+            else:
+                day, dayEvents = cell
+                dayCell["label"].config(text=str(day))
+                dayCell["frame"].grid()
+
+            # Reuse the event labels for the day
+            for position, (title, url) in enumerate(dayEvents):
+                eventLabel = self.getEventLabel(dayCell, position)
+                eventLabel.config(text=title)
+                eventLabel.url = url
+                if position >= dayCell["shown"]:
                     eventLabel.pack(anchor="w", pady=1)
-                    # Can click to open URL
-                    eventLabel.bind(
-                        "<Button-1>",
-                        lambda e, url=event.get(
-                            "original_url"
-                        ): self.openEventLink(url),
-                    )
 
-            # Move to next row after Sunday
-            col += 1
-            if col > 6:
-                col = 0
-                row += 1
+            # Hide the labels left over from the last month
+            for eventLabel in dayCell["events"][
+                len(dayEvents) : dayCell["shown"]
+            ]:
+                eventLabel.pack_forget()
+            dayCell["shown"] = len(dayEvents)
 
     def previousMonth(self):
         """
@@ -275,16 +589,49 @@ class ClubEventCalendar(ttk.Frame):
         if url:
             webbrowser.open(url)
 
+    def onSearchKey(self, event):
+        """
+        Wait for the user to stop typing, then suggest events.
+
+        :param event: The event that triggered the method.
+        """
+        if self.pendingSuggestion is not None:
+            self.after_cancel(self.pendingSuggestion)
+        self.pendingSuggestion = self.after(
+            DEBOUNCE_MS, self.showEventSuggestions
+        )
+
+    def showEventSuggestions(self):
+        """
+        Show the events with titles that start like the search text, from
+        the type-ahead index. Search still looks through every event.
+        """
+        self.pendingSuggestion = None
+        keyword = self.searchEntry.get().strip()
+        self.searchResultsText.config(state=NORMAL)
+        self.searchResultsText.delete(1.0, END)
+
+        for title, event in suggest_events(keyword) if keyword else []:
+            eventText = f"{event.get('title', 'No Title')} by {event.get('club', 'Unknown Club')} on {event.get('date', 'Unknown Date')}\n\n"
+            self.searchResultsText.insert(END, eventText)
+
+        self.searchResultsText.config(state=DISABLED)
+
     def searchEvents(self):
         """
         Search events by keyword.
         """
+        # A suggestion waiting for typing to stop would replace the results
+        if self.pendingSuggestion is not None:
+            self.after_cancel(self.pendingSuggestion)
+            self.pendingSuggestion = None
+
         keyword = self.searchEntry.get().lower().strip()
         self.searchResultsText.config(state=NORMAL)
         self.searchResultsText.delete(1.0, END)
         found = False
 
-        for event in self.allEvents:
+        for event in self.eventIndex.getEvents():
             if (
                 keyword in event.get("title", "").lower()
                 or keyword in event.get("description", "").lower()
@@ -0,0 +1,467 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program finds the clubs that match a query (campus, categories,
+keywords, favourites and events between two dates) in one go. It looks at
+which index would give the fewest clubs to start from, then checks the rest
+of the query on those clubs one at a time, cheapest and most selective check
+first. explain() shows the plan with how many clubs went through each step
+and how long it took.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import bisect
+import datetime
+import heapq
+import threading
+import time
+from Club_Store import club_store
+from Database import make_event_id
+from Snapshot import refresh_snapshot
+
+
+class ClubQuery:
+    """
+    The ClubQuery class. A query for clubs. Every part that is given has to
+    match, the parts left as None are ignored.
+
+    Attributes:
+    campus: The campus of the clubs.
+    all_categories: A list of categories the clubs need to all have.
+    any_categories: A list of categories the clubs need at least one of.
+    keywords: A list of keywords, one of which has to be in the name or
+    description.
+    favourite: True for only favourite clubs, False for only the others.
+    events_from: The first date (datetime.date) of the events to look for.
+    events_to: The last date of the events to look for. If only one of the
+    dates is given, the events are not limited on the other side.
+    """
+
+    def __init__(
+        self,
+        campus: str = None,
+        all_categories: list = None,
+        any_categories: list = None,
+        keywords: list = None,
+        favourite: bool = None,
+        events_from: datetime.date = None,
+        events_to: datetime.date = None,
+    ):
+        """
+        Constructor for the ClubQuery class.
+        """
+        self.campus = campus
+        self.all_categories = list(all_categories or [])
+        self.any_categories = list(any_categories or [])
+        self.keywords = [keyword.lower() for keyword in keywords or []]
+        self.favourite = favourite
+        self.events_from = events_from
+        self.events_to = events_to
+
+    def has_dates(self) -> bool:
+        """
+        :return: True if the query looks for events between dates.
+        """
+        return self.events_from is not None or self.events_to is not None
+
+
+class QueryEngine:
+    """
+    The QueryEngine class. It plans and runs ClubQuery objects on the clubs
+    in a ClubStore.
+
+    Attributes:
+    store: The ClubStore with the clubs and the category index.
+    loads: The store loads the extra indexes were made for.
+    positions: A dictionary of id(club) -> position in store.clubs, to keep
+    the results in the same order as the clubs.
+    by_campus: A dictionary of campus -> list of clubs.
+    favourites: The list of favourite clubs, in the same order as
+    store.clubs. It is kept up to date as clubs are favourited.
+    event_clubs: A dictionary of event id -> list of clubs with the event.
+    dates: The events grouped by date the sorted dates were made for, and
+    the sorted dates (ordinals).
+    """
+
+    def __init__(self, store=club_store):
+        """
+        Constructor for the QueryEngine class. The indexes are made when the
+        first query runs.
+        """
+        self.store = store
+        self.loads = None
+        self.positions = {}
+        self.by_campus = {}
+        self.favourites = []
+        self.event_clubs = {}
+        self.dates = (None, [])
+        self.lock = threading.Lock()
+        store.subscribe(self.favourite_changed)
+
+    def refresh(self) -> None:
+        """
+        Makes the campus, favourite and event indexes again if the clubs
+        were reloaded since they were made.
+        """
+        self.store.refresh()
+        loads = self.store.loads
+        with self.lock:
+            if loads == self.loads:
+                return
+            positions = {}
+            by_campus = {}
+            favourites = []
+            event_clubs = {}
+            for position, club in enumerate(self.store.clubs):
+                positions[id(club)] = position
+                by_campus.setdefault(club.get_campus(), []).append(club)
+                if club.get_is_favourited():
+                    favourites.append(club)
+                for event_id in club.get_event_ids():
+                    event_clubs.setdefault(event_id, []).append(club)
+
+            self.positions = positions
+            self.by_campus = by_campus
+            self.favourites = favourites
+            self.event_clubs = event_clubs
+            self.loads = loads
+
+    def favourite_changed(self, club) -> None:
+        """
+        Adds a club to the favourites or takes it away, if that was not done
+        already.
+
+        :param club: The Club object that was favourited or unfavourited.
+        """
+        with self.lock:
+            position = self.positions.get(id(club))
+            if position is None:
+                return
+            # a new list, so a query going through the old one is not changed
+            favourites = [
+                other for other in self.favourites if other is not club
+            ]
+            if club.get_is_favourited():
+                positions = [self.positions[id(other)] for other in favourites]
+                favourites.insert(
+                    bisect.bisect_left(positions, position), club
+                )
+            self.favourites = favourites
+
+    def clubs_with_events(self, query: ClubQuery) -> list:
+        """
+        Finds the clubs with events between the query's dates, from the
+        events grouped by date.
+
+        :param query: The query.
+        :return: A list of clubs, in the same order as store.clubs.
+        """
+        by_date = refresh_snapshot()["events_by_date"]
+        # the dates are only sorted again when the events change
+        if self.dates[0] is not by_date:
+            self.dates = (by_date, sorted(by_date))
+        ordinals = self.dates[1]
+        start = (
+            bisect.bisect_left(ordinals, query.events_from.toordinal())
+            if query.events_from
+            else 0
+        )
+        end = (
+            bisect.bisect_right(ordinals, query.events_to.toordinal())
+            if query.events_to
+            else len(ordinals)
+        )
+
+        clubs = {}
+        for ordinal in ordinals[start:end]:
+            for event in by_date[ordinal]:
+                # events from files that were never migrated have no id
+                event_id = event.get("event_id") or make_event_id(event)
+                for club in self.event_clubs.get(event_id, []):
+                    clubs[id(club)] = club
+        return sorted(clubs.values(), key=lambda c: self.positions[id(c)])
+
+    def union(self, lists: list):
+        """
+        Goes through the clubs in any of some lists, each once, in the same
+        order as store.clubs. The lists must be in that order already.
+
+        :param lists: The lists of clubs.
+        :return: An iterator of clubs.
+        """
+        last = None
+        for position, club in heapq.merge(
+            *[
+                ((self.positions[id(club)], club) for club in clubs)
+                for clubs in lists
+            ],
+            key=lambda item: item[0],
+        ):
+            if position != last:
+                last = position
+                yield club
+
+    def plan(self, query: ClubQuery) -> dict:
+        """
+        Plans a query. Every index that could give the clubs to start from
+        is estimated, and the one with the fewest clubs is used. The other
+        parts of the query become checks, ordered from cheap and selective to
+        slow.
+
+        :param query: The query.
+        :return: A dictionary with the source (a dictionary with name,
+        estimate and rows, a function that returns an iterator of clubs) and
+        the list of checks (dictionaries with name, estimate and test, a
+        function that takes a club and returns True if it matches).
+        """
+        self.refresh()
+        store = self.store
+        campus = query.campus
+        total = len(store.clubs)
+        sources = []
+        checks = []
+
+        # worked out once, for the source or the check
+        with_events = None
+        if query.has_dates():
+            with_events = self.clubs_with_events(query)
+
+        # the category index has each category on each campus
+        for category in query.all_categories:
+            clubs = store.by_category.get((campus, category), [])
+            sources.append(
+                {
+                    "name": f"category {category!r}"
+                    + (f" on {campus}" if campus else ""),
+                    "estimate": len(clubs),
+                    "rows": lambda clubs=clubs: iter(clubs),
+                    "covers": {"campus"},
+                }
+            )
+        if query.any_categories:
+            lists = [
+                store.by_category.get((campus, category), [])
+                for category in query.any_categories
+            ]
+            sources.append(
+                {
+                    "name": f"any category of {query.any_categories!r}"
+                    + (f" on {campus}" if campus else ""),
+                    "estimate": min(total, sum(len(c) for c in lists)),
+                    "rows": lambda: self.union(lists),
+                    "covers": {"campus", "any_categories"},
+                }
+            )
+        if campus:
+            clubs = self.by_campus.get(campus, [])
+            sources.append(
+                {
+                    "name": f"campus {campus!r}",
+                    "estimate": len(clubs),
+                    "rows": lambda clubs=clubs: iter(clubs),
+                    "covers": {"campus"},
+                }
+            )
+        if query.favourite:
+            sources.append(
+                {
+                    "name": "favourites",
+                    "estimate": len(self.favourites),
+                    "rows": lambda: iter(self.favourites),
+                    "covers": {"favourite"},
+                }
+            )
+        if with_events is not None:
+            sources.append(
+                {
+                    "name": "events by date",
+                    "estimate": len(with_events),
+                    "rows": lambda: iter(with_events),
+                    "covers": {"dates"},
+                }
+            )
+        sources.append(
+            {
+                "name": "all clubs",
+                "estimate": total,
+                "rows": lambda: iter(store.clubs),
+                "covers": set(),
+            }
+        )
+        source = min(sources, key=lambda s: s["estimate"])
+        covers = source["covers"]
+
+        # each check is estimated by how many clubs it would let through
+        # on its own, slow checks (events, keywords) always go last
+        if campus and "campus" not in covers:
+            checks.append(
+                {
+                    "name": f"campus {campus!r}",
+                    "estimate": len(self.by_campus.get(campus, [])),
+                    "cost": 0,
+                    "test": lambda club: club.get_campus() == campus,
+                }
+            )
+        if query.all_categories:
+            checks.append(
+                {
+                    "name": f"all categories of {query.all_categories!r}",
+                    "estimate": min(
+                        len(store.by_category.get((campus, c), []))
+                        for c in query.all_categories
+                    ),
+                    "cost": 0,
+                    "test": lambda club: all(
+                        category in club.get_categories()
+                        for category in query.all_categories
+                    ),
+                }
+            )
+        if query.any_categories and "any_categories" not in covers:
+            checks.append(
+                {
+                    "name": f"any category of {query.any_categories!r}",
+                    "estimate": min(
+                        total,
+                        sum(
+                            len(store.by_category.get((campus, c), []))
+                            for c in query.any_categories
+                        ),
+                    ),
+                    "cost": 0,
+                    "test": lambda club: any(
+                        category in club.get_categories()
+                        for category in query.any_categories
+                    ),
+                }
+            )
+        if query.favourite is not None and "favourite" not in covers:
+            favourites = len(self.favourites)
+            checks.append(
+                {
+                    "name": f"favourite is {query.favourite}",
+                    "estimate": (
+                        favourites if query.favourite else total - favourites
+                    ),
+                    "cost": 0,
+                    "test": lambda club: club.get_is_favourited()
+                    == query.favourite,
+                }
+            )
+        if with_events is not None and "dates" not in covers:
+            event_ids = {id(c) for c in with_events}
+            checks.append(
+                {
+                    "name": "events by date",
+                    "estimate": len(event_ids),
+                    "cost": 1,
+                    "test": lambda club: id(club) in event_ids,
+                }
+            )
+        if query.keywords:
+            checks.append(
+                {
+                    "name": f"keywords {query.keywords!r}",
+                    "estimate": None,  # not known without reading them
+                    "cost": 2,
+                    "test": lambda club: any(
+                        keyword in club.get_name().lower()
+                        for keyword in query.keywords
+                    )
+                    # the description is only read if the name did not match
+                    or any(
+                        keyword in club.get_description().lower()
+                        for keyword in query.keywords
+                    ),
+                }
+            )
+        checks.sort(key=lambda check: (check["cost"], check["estimate"] or 0))
+
+        return {"source": source, "checks": checks}
+
+    def run(self, query: ClubQuery):
+        """
+        Runs a query. The clubs are checked one at a time as they are asked
+        for, so taking only the first few is cheap.
+
+        :param query: The query.
+        :return: An iterator of the matching clubs, in the same order as
+        store.clubs.
+        """
+        plan = self.plan(query)
+        tests = [check["test"] for check in plan["checks"]]
+        for club in plan["source"]["rows"]():
+            if all(test(club) for test in tests):
+                yield club
+
+    def explain(self, query: ClubQuery) -> str:
+        """
+        Plans and runs a query, counting the clubs that go in and out of
+        each step and timing it.
+
+        :param query: The query.
+        :return: The plan as text, one step per line.
+        """
+        plan = self.plan(query)
+        source = plan["source"]
+        checks = plan["checks"]
+        rows_in = [0] * len(checks)
+        rows_out = [0] * len(checks)
+        seconds = [0.0] * len(checks)
+        source_rows = 0
+        source_seconds = 0.0
+
+        rows = source["rows"]()
+        while True:
+            start = time.perf_counter()
+            club = next(rows, None)
+            source_seconds += time.perf_counter() - start
+            if club is None:
+                break
+            source_rows += 1
+            for i, check in enumerate(checks):
+                rows_in[i] += 1
+                start = time.perf_counter()
+                matched = check["test"](club)
+                seconds[i] += time.perf_counter() - start
+                if not matched:
+                    break
+                rows_out[i] += 1
+
+        lines = [
+            f"source  {source['name']}: estimate {source['estimate']}, "
+            f"{source_rows} rows, {source_seconds * 1000:.3f} ms"
+        ]
+        for i, check in enumerate(checks):
+            estimate = "?" if check["estimate"] is None else check["estimate"]
+            lines.append(
+                f"check   {check['name']}: estimate {estimate}, "
+                f"{rows_in[i]} in, {rows_out[i]} out, "
+                f"{seconds[i] * 1000:.3f} ms"
+            )
+        result = rows_out[-1] if checks else source_rows
+        lines.append(f"result  {result} clubs")
+        return "\n".join(lines)
+
+
+# The one query engine shared by every view
+query_engine = QueryEngine()
+
+
+def find_clubs(**parts):
+    """
+    Finds the clubs that match a query.
+
+    :param parts: The parts of the query, see ClubQuery.
+    :return: An iterator of the matching clubs.
+    """
+    return query_engine.run(ClubQuery(**parts))
@@ -0,0 +1,142 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program puts the clubs the user is most likely to care about
+first in the club list. The user's taste (profile) is the sum of the TF-IDF
+vectors of their favourite clubs, made the same way as for the similar clubs,
+and a club scores higher the more its vector points the same way as the
+profile. Favouriting or unfavouriting a club just adds or takes away that
+club's vector, so the profile is never made again from every club.
+
+NumPy does not have to be installed, without it the clubs keep their order.
+It is only imported once there are favourites to rank by.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import threading
+from Club_Store import club_store
+from Facet_Index import facet_index
+from Database import optional_module
+from Similar_Clubs import club_vectors
+
+
+class FavouriteRanking:
+    """
+    The FavouriteRanking class.
+
+    Attributes:
+    store: The ClubStore with the clubs.
+    loads: The store loads the vectors were made for.
+    positions: A dictionary of original_url -> position of the club.
+    vectors: The NumPy array of club vectors, one row per club.
+    favourites: The set of positions of the favourite clubs in the profile.
+    profile: The sum of the vectors of the favourite clubs.
+    """
+
+    def __init__(self, store=club_store):
+        """
+        Constructor for the FavouriteRanking class. The vectors are made
+        when the clubs are first ranked.
+        """
+        self.store = store
+        self.loads = None
+        self.positions = {}
+        self.vectors = None
+        self.favourites = set()
+        self.profile = None
+        self.lock = threading.Lock()
+        store.subscribe(self.favourite_changed)
+
+    def refresh(self) -> None:
+        """
+        Makes the vectors and the profile again if the clubs were reloaded.
+        """
+        self.store.refresh()
+        if self.store.loads == self.loads:
+            return
+        # the same vectors as the similar clubs, got before taking the lock
+        # since the store can call favourite_changed while making them
+        vectors = club_vectors.get()
+        with self.lock:
+            clubs = self.store.clubs
+            self.vectors = vectors
+            self.positions = {
+                club.get_original_url(): position
+                for position, club in enumerate(clubs)
+            }
+            self.favourites = {
+                position
+                for position, club in enumerate(clubs)
+                if club.get_is_favourited()
+            }
+            self.profile = self.vectors[sorted(self.favourites)].sum(axis=0)
+            self.loads = self.store.loads
+
+    def favourite_changed(self, club) -> None:
+        """
+        Adds a club to the profile or takes it away, if that was not done
+        already.
+
+        :param club: The Club object that was favourited or unfavourited.
+        """
+        with self.lock:
+            position = self.positions.get(club.get_original_url())
+            if self.profile is None or position is None:
+                return
+            if club.get_is_favourited() and position not in self.favourites:
+                self.favourites.add(position)
+                self.profile += self.vectors[position]
+            elif not club.get_is_favourited() and position in self.favourites:
+                self.favourites.remove(position)
+                self.profile -= self.vectors[position]
+
+    def rank(self, urls: list) -> list:
+        """
+        Orders clubs by how well they match the favourites. Clubs that match
+        equally well, e.g. when there are no favourites, keep their order.
+
+        :param urls: The list of original urls of the clubs.
+        :return: The list of indexes into urls, best match first.
+        """
+        # without favourites nothing has to be read, the order stays
+        if not facet_index.campus_count(favourite=True):
+            return list(range(len(urls)))
+        numpy = optional_module("numpy")
+        if numpy is None:
+            return list(range(len(urls)))
+        self.refresh()
+        with self.lock:
+            if not self.favourites:
+                return list(range(len(urls)))
+            rows = numpy.array(
+                [self.positions.get(url, -1) for url in urls],
+                dtype=numpy.int64,
+            )
+            # all the clubs are scored at once, unknown clubs go last
+            scores = self.vectors[rows] @ self.profile
+            scores[rows < 0] = -numpy.inf
+        return numpy.argsort(-scores, kind="stable").tolist()
+
+
+# The one ranking shared by every view
+favourite_ranking = FavouriteRanking()
+
+
+def rank_clubs(items: list) -> list:
+    """
+    Orders clubs by how well they match the favourites.
+
+    :param items: A list of (original url, name) tuples.
+    :return: The same tuples, best match first.
+    """
+    order = favourite_ranking.rank([url for url, name in items])
+    return [items[i] for i in order]
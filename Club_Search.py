@@ -0,0 +1,173 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program searches the clubs by words in their name, categories
+and description, best matches first. It uses BM25, the ranking most search
+engines start from: a word counts more if it is rare across the clubs and if
+it shows up often in a club, and long descriptions do not win just for being
+long. Words in the name count the most.
+
+An index of which clubs have each word (postings) is made once after the
+clubs are loaded, so a search only looks at the clubs that have one of the
+words instead of every club.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import heapq
+import math
+import re
+import threading
+from array import array
+from Club_Store import club_store
+
+# how much a word counts in each part of a club
+NAME_WEIGHT = 3
+CATEGORY_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+# the usual BM25 settings: how fast more of the same word stops helping,
+# and how much longer clubs are held back
+K1 = 1.2
+B = 0.75
+
+WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list:
+    """
+    Splits text into lowercase words.
+
+    :param text: The text.
+    :return: A list of words.
+    """
+    return WORD.findall(text.lower())
+
+
+class SearchIndex:
+    """
+    The SearchIndex class.
+
+    Attributes:
+    store: The ClubStore with the clubs.
+    loads: The store loads the index was made for.
+    postings: A dictionary of word -> (array of club positions, array of
+    weighted counts of the word in each of those clubs).
+    idf: A dictionary of word -> how rare the word is.
+    norms: For each club, the part of the BM25 formula that only depends on
+    its length, worked out once.
+    """
+
+    def __init__(self, store=club_store):
+        """
+        Constructor for the SearchIndex class. The index is made on the
+        first search.
+        """
+        self.store = store
+        self.loads = None
+        self.postings = {}
+        self.idf = {}
+        self.norms = array("f")
+        self.lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """
+        Makes the index again if the clubs were reloaded since it was made.
+        Favourites do not change it.
+        """
+        self.store.refresh()
+        with self.lock:
+            if self.store.loads == self.loads:
+                return
+            self.build(self.store.clubs)
+            self.loads = self.store.loads
+
+    def build(self, clubs: list) -> None:
+        """
+        Makes the postings, word rarity and club lengths.
+
+        :param clubs: The list of Club objects.
+        """
+        counts_by_word = {}
+        lengths = array("f")
+        for position, club in enumerate(clubs):
+            counts = {}
+            for text, weight in (
+                (club.get_name(), NAME_WEIGHT),
+                (" ".join(club.get_categories()), CATEGORY_WEIGHT),
+                (club.get_description(), DESCRIPTION_WEIGHT),
+            ):
+                for word in tokenize(text):
+                    counts[word] = counts.get(word, 0) + weight
+            lengths.append(sum(counts.values()))
+            for word, count in counts.items():
+                if word not in counts_by_word:
+                    counts_by_word[word] = (array("I"), array("f"))
+                counts_by_word[word][0].append(position)
+                counts_by_word[word][1].append(count)
+
+        total = len(clubs)
+        # clubs with no text at all would make the average 0
+        average = (sum(lengths) / total if total else 0) or 1
+        self.norms = array(
+            "f",
+            [K1 * (1 - B + B * length / average) for length in lengths],
+        )
+        self.idf = {
+            word: math.log(
+                1 + (total - len(positions) + 0.5) / (len(positions) + 0.5)
+            )
+            for word, (positions, _) in counts_by_word.items()
+        }
+        self.postings = counts_by_word
+
+    def search(self, text: str, k: int = 20) -> list:
+        """
+        Finds the clubs that best match some words.
+
+        :param text: The words to search for.
+        :param k: The most clubs to return.
+        :return: A list of (Club, score) tuples, best first.
+        """
+        self.refresh()
+        scores = {}
+        for word in set(tokenize(text)):
+            if word not in self.postings:
+                continue
+            idf = self.idf[word]
+            positions, counts = self.postings[word]
+            for position, count in zip(positions, counts):
+                scores[position] = scores.get(position, 0.0) + idf * (
+                    count * (K1 + 1) / (count + self.norms[position])
+                )
+
+        # only the best k are sorted, ties go to the club that comes first
+        best = heapq.nsmallest(
+            k, scores.items(), key=lambda item: (-item[1], item[0])
+        )
+        return [
+            (self.store.clubs[position], score) for position, score in best
+        ]
+
+
+# The one search index shared by every view
+search_index = SearchIndex()
+
+
+def search_clubs(text: str, k: int = 20) -> list:
+    """
+    Finds the clubs that best match some words.
+
+    :param text: The words to search for.
+    :param k: The most clubs to return.
+    :return: A list of Club objects, best first.
+    """
+    return [club for club, score in search_index.search(text, k)]
@@ -0,0 +1,308 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program keeps the clubs from clubs.json in memory, together with
+indexes by campus and category. The indexes are only rebuilt when the file
+changes, so the views can ask for categories and clubs without rescanning.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import os
+from Database import CLUBS_FILE, Club, changes_since, data_lock, get_generation
+from Snapshot import load_descriptions, rebuild_snapshot, refresh_snapshot
+from functools import partial
+
+
+class ClubStore:
+    """
+    The ClubStore class.
+
+    Attributes:
+    filename: The name of the clubs file.
+    version: Goes up by one every time the clubs are reloaded or changed.
+    loads: Goes up by one every time the clubs are reloaded, but not when
+    only favourites change.
+    generation: The generation of the data files the clubs are up to date
+    with.
+    clubs: A list of all Club objects.
+    by_url: A dictionary of original_url -> Club.
+    by_category: A dictionary of (campus, category) -> list of Club objects.
+    The campus None holds the clubs from every campus.
+    related: A dictionary of (campus, category) -> set of the categories that
+    clubs in that category also have.
+    search_names: The lowercase name of each club, in the same order as
+    clubs.
+    catalog: The sorted list of every category, made once per reload.
+    subscribers: The functions called with a club when it is favourited or
+    unfavourited, here or in another app.
+    """
+
+    def __init__(self, filename: str = CLUBS_FILE):
+        """
+        Constructor for the ClubStore class. Nothing is loaded until the
+        clubs are first needed.
+        """
+        self.filename = filename
+        self.signature = None
+        self.loaded = False
+        self.version = 0
+        self.loads = 0
+        self.generation = 0
+        self.clubs = []
+        self.by_url = {}
+        self.by_category = {}
+        self.related = {}
+        self.search_names = []
+        self.catalog = []
+        self.subscribers = []
+
+    def refresh(self) -> bool:
+        """
+        Reloads the clubs and indexes if the file changed. If it was only
+        changed by favouriting clubs (here or in another app), just those
+        clubs are updated. Otherwise everything comes from the snapshot,
+        which is only rebuilt from the JSON files when it is stale.
+
+        :return: True if the clubs were reloaded, False otherwise.
+        """
+        if self.loaded and self.get_signature() == self.signature:
+            return False
+
+        # a file and its change are recorded together under the lock
+        with data_lock():
+            signature = self.get_signature()
+            generation = get_generation()
+            changes = changes_since(self.generation)
+            if not (self.loaded and self.apply_changes(changes)):
+                self.build(refresh_snapshot())
+        self.signature = signature
+        self.generation = generation
+        self.loaded = True
+        return True
+
+    def get_signature(self) -> tuple:
+        """
+        Gets the last modified time and size of the clubs file.
+
+        :return: A tuple, or None if the file is missing.
+        """
+        try:
+            stat = os.stat(self.filename)
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    def apply_changes(self, changes: list) -> bool:
+        """
+        Updates the clubs from the changes recorded since they were loaded,
+        if they only changed which clubs are favourites.
+
+        :param changes: The list of changes from changes_since.
+        :return: True if the clubs are now up to date, False if they have to
+        be reloaded.
+        """
+        updates = []
+        for change in changes or []:
+            if change["file"] != self.filename:
+                continue
+            # the whole file was rewritten
+            if change["changes"] is None or change["key"] != "original_url":
+                return False
+            for url, fields in change["changes"].items():
+                if url not in self.by_url or set(fields) != {"is_favourited"}:
+                    return False
+                updates.append((self.by_url[url], fields["is_favourited"]))
+
+        # the file changed but not through the app, e.g. edited by hand
+        if not updates:
+            return False
+
+        for club, is_favourited in updates:
+            club.set_is_favourited(is_favourited)
+        for club, is_favourited in updates:
+            self.favourite_changed(club)
+        return True
+
+    def subscribe(self, callback) -> None:
+        """
+        Calls a function every time a club is favourited or unfavourited.
+        It can be called more than once for the same change.
+
+        :param callback: A function that takes the Club object.
+        """
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        """
+        Stops calling a function when a club is favourited or unfavourited.
+
+        :param callback: The function given to subscribe.
+        """
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def favourite_changed(self, club: Club) -> None:
+        """
+        Tells the subscribers that a club was favourited or unfavourited.
+        The version goes up, so results worked out from the favourites are
+        made again before the change is written to the file.
+
+        :param club: The Club object.
+        """
+        self.version += 1
+        for callback in list(self.subscribers):
+            callback(club)
+
+    def build(self, snapshot: dict) -> None:
+        """
+        Makes the Club objects and indexes from a snapshot.
+
+        :param snapshot: The snapshot dictionary.
+        """
+        # descriptions stay on disk until a club's description is read
+        blob = load_descriptions()
+        if blob is not None and len(blob) == len(snapshot["columns"]["name"]):
+            descriptions = [partial(blob.get, i) for i in range(len(blob))]
+        elif "descriptions" in snapshot:
+            # a snapshot that was just built still has them
+            descriptions = snapshot["descriptions"]
+        else:
+            # the JSON files changed after the snapshot was read
+            snapshot = rebuild_snapshot()
+            descriptions = snapshot["descriptions"]
+
+        columns = snapshot["columns"]
+        clubs = [
+            Club(*values)
+            for values in zip(
+                columns["name"],
+                columns["campus"],
+                descriptions,
+                columns["contacts"],
+                columns["categories"],
+                columns["events"],
+                columns["original_url"],
+                columns["is_favourited"],
+            )
+        ]
+
+        self.clubs = clubs
+        self.by_url = {club.get_original_url(): club for club in clubs}
+        self.by_category = {
+            key: [clubs[position] for position in positions]
+            for key, positions in snapshot["by_category"].items()
+        }
+        self.related = snapshot["related"]
+        self.search_names = snapshot["search_names"]
+        self.catalog = sorted(
+            category for campus, category in self.by_category if campus is None
+        )
+        self.version += 1
+        self.loads += 1
+
+    def get_version(self) -> int:
+        """
+        Gets the version of the clubs, after reloading them if the file
+        changed. Results worked out from the clubs can be kept until it
+        changes.
+
+        :return: The version.
+        """
+        self.refresh()
+        return self.version
+
+    def get_catalog(self) -> list:
+        """
+        Gets every category of every club.
+
+        :return: A sorted list of categories. Do not change it, since it is
+        shared.
+        """
+        self.refresh()
+        return self.catalog
+
+    def get_clubs(self) -> list:
+        """
+        Gets all the clubs.
+
+        :return: A list of all Club objects.
+        """
+        self.refresh()
+        return self.clubs
+
+    def get_club(self, url: str) -> Club:
+        """
+        Gets a club by its original url.
+
+        :param url: The original url of the club.
+        :return: The Club object, or None if there is no such club.
+        """
+        self.refresh()
+        return self.by_url.get(url)
+
+    def clubs_in(self, category: str, campus: str = None) -> list:
+        """
+        Gets the clubs in a category.
+
+        :param category: The category.
+        :param campus: The campus to look in, or None for every campus.
+        :return: A list of Club objects.
+        """
+        self.refresh()
+        return self.by_category.get((campus, category), [])
+
+    def search(self, keywords: list) -> list:
+        """
+        Gets the clubs with any of the keywords in their name or description,
+        the same as filter_keywords on all the clubs.
+
+        :param keywords: The list of keywords.
+        :return: A list of Club objects.
+        """
+        self.refresh()
+        keywords = [keyword.lower() for keyword in keywords]
+        return [
+            club
+            for club, name in zip(self.clubs, self.search_names)
+            if any(keyword in name for keyword in keywords)
+            # the description is only read if the name did not match
+            or any(
+                keyword in club.get_description().lower()
+                for keyword in keywords
+            )
+        ]
+
+    def get_categories(
+        self, campus: str = None, interests: list = None
+    ) -> list:
+        """
+        Gets the categories of the clubs on a campus that match any of the
+        interests, the same ones get_all_categories would find after
+        filtering. Only the index is used, not the clubs.
+
+        :param campus: The campus, or None for every campus.
+        :param interests: The list of interests, empty or None for all.
+        :return: A sorted list of categories.
+        """
+        self.refresh()
+        interests = set(interests or [])
+        categories = set()
+        for (key_campus, category), others in self.related.items():
+            if key_campus != campus:
+                continue
+            if not interests or category in interests:
+                categories.update(others)
+        return sorted(categories)
+
+
+# The one store shared by every view
+club_store = ClubStore()
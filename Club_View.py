@@ -12,14 +12,16 @@ Purpose: This program allows the user to view a list of clubs and see a more
 detailed view of each club. The user can also favourite clubs.
 
 Date Created: 2024-11-13
-Date Last Modified: 2024-12-05
+Date Last Modified: 2026-10-19
 """
 
 from tkinter import *
 import json
 from Database import *
-from List_View import all_clubs
+from Club_Store import club_store
+from Similar_Clubs import NEIGHBOURS, similar_clubs
 from tkinter import ttk
+from Virtual_List import VirtualList
 
 
 class ClubListView(ttk.Frame):
@@ -36,7 +38,6 @@ class ClubListView(ttk.Frame):
         """
         super().__init__(parent)
         self.controller = controller
-        self.all_clubs = all_clubs
 
         self.configure(style="TFrame")  # Set the background to white
 
@@ -56,15 +57,19 @@ class ClubListView(ttk.Frame):
         )
         self.label.grid(row=0, column=0, pady=5, sticky="n")
 
-        # Placeholder for club list content
-        self.club_listbox = Listbox(self, width=50, height=20)
+        # Placeholder for club list content, only the visible rows are made
+        self.club_listbox = VirtualList(
+            self,
+            self.make_club_row,
+            self.fill_club_row,
+            row_height=24,
+            width=300,
+            height=400,
+        )
         self.club_listbox.grid(
             row=1, column=0, padx=10, pady=10, sticky="nsew"
         )
 
-        # Bind listbox selection to the handler
-        self.club_listbox.bind("<<ListboxSelect>>", self.open_club_view)
-
         # Back button to return to CategoryView
         back_button = Button(
             self, text="<< Back", command=self.change_to_CategoryView
@@ -81,46 +86,62 @@ class ClubListView(ttk.Frame):
 
         self.controller.show_frame(CategoryView)
 
-    def club_list(self, category, list_of_clubs):
+    def make_club_row(self, parent):
+        """
+        Make one row of the club list.
+
+        :param parent: The parent widget.
+        :return: The row label.
+        """
+        row = Label(parent, anchor="w", bg="white", cursor="hand2")
+        row.club_id = None  # The original url of the club shown in the row
+
+        # Clicking a row opens the club it is showing at the time
+        row.bind("<Button-1>", lambda e: self.open_club_view(row.club_id))
+        return row
+
+    def fill_club_row(self, row, club):
+        """
+        Show a club in a row of the club list.
+
+        :param row: The row label.
+        :param club: A tuple of the original url and the name of the club.
+        """
+        row.club_id, club_name = club
+        row.config(text=club_name)
+
+    def club_list(self, category, list_of_clubs, title=None):
         """
         Populate the listbox with clubs in the selected category.
 
         :param category: The selected category.
-        :param list_of_clubs: The list of clubs in the category.
+        :param list_of_clubs: The list of (original url, name) tuples of the
+        clubs in the category.
+        :param title: The title to show instead of the category, e.g. for
+        search results.
         """
         self.label.config(
-            text=f"Clubs in {category}"
+            text=title or f"Clubs in {category}"
         )  # Update the title to show the category
-        self.club_listbox.delete(0, END)  # Clear previous entries
+        # Replace the previous entries with all the clubs at once
+        self.club_listbox.set_items(list_of_clubs)
 
-        # Insert each club name into the Listbox
-        for name in list_of_clubs:
-            self.club_listbox.insert(END, name)
-
-    def open_club_view(self, event):
+    def open_club_view(self, selected_club_id):
         """
         Open the detailed view for the selected club.
 
-        :param event: The event that triggered the method.
+        :param selected_club_id: The original url of the club that was
+        clicked.
         """
-        # Get selected club name
-        selected_index = self.club_listbox.curselection()
-        if not selected_index:
+        if not selected_club_id:
             return
-        selected_club_name = self.club_listbox.get(selected_index)
-
-        # Find the selected club
-        selected_club = next(
-            (
-                club
-                for club in self.all_clubs
-                if club.get_name() == selected_club_name
-            ),
-            None,
-        )
+
+        # Find the selected club in the current clubs, by its url since two
+        # clubs can have the same name
+        selected_club = club_store.get_club(selected_club_id)
         if selected_club:
             # Navigate to ClubView with the selected club
-            club_view = self.controller.frames[ClubView]
+            club_view = self.controller.get_frame(ClubView)
             club_view.display_club(selected_club)
             self.controller.show_frame(ClubView)
 
@@ -153,6 +174,7 @@ class ClubView(ttk.Frame):
         nested_frame.grid_rowconfigure(1, weight=0)  # Description title row
         nested_frame.grid_rowconfigure(2, weight=1)  # Description row
         nested_frame.grid_rowconfigure(3, weight=0)  # Location and Contact row
+        nested_frame.grid_rowconfigure(4, weight=0)  # Similar clubs row
         nested_frame.grid_columnconfigure(0, weight=1)  # Content column
         nested_frame.grid_columnconfigure(
             1, weight=0
@@ -287,6 +309,36 @@ class ClubView(ttk.Frame):
         )
         self.contact_info.grid(row=1, column=0, pady=(0, 10), sticky="w")
 
+        # Similar clubs, each one opens that club when clicked
+        similar_frame = ttk.Frame(nested_frame, style="TFrame")
+        similar_frame.grid(
+            row=4, column=0, columnspan=2, padx=5, pady=(0, 10), sticky="w"
+        )
+        self.similar_label = Label(
+            similar_frame,
+            text="Similar clubs:",
+            font=("Arial", 11),
+            anchor="w",
+            fg="blue",
+            bg="white",
+        )
+        self.similar_rows = []
+        for i in range(NEIGHBOURS):
+            row = Label(
+                similar_frame,
+                text="",
+                font=("Arial", 10),
+                anchor="w",
+                bg="white",
+                cursor="hand2",
+            )
+            row.club = None  # The club shown in the row
+            row.bind(
+                "<Button-1>",
+                lambda e, row=row: row.club and self.display_club(row.club),
+            )
+            self.similar_rows.append(row)
+
         # Favourite button to add/remove from favourites
         self.favourite_button = Button(
             nested_frame,
@@ -328,6 +380,30 @@ class ClubView(ttk.Frame):
         else:
             self.favourite_button.config(text="♡")
 
+        self.show_similar_clubs(club)
+
+    def show_similar_clubs(self, club):
+        """
+        Show the clubs most like the club, hiding the section if there are
+        none or they are still being worked out.
+
+        :param club: The club object being displayed.
+        """
+        similar = similar_clubs.similar(club)
+        if similar:
+            self.similar_label.grid(row=0, column=0, pady=(5, 5), sticky="w")
+        else:
+            self.similar_label.grid_remove()
+
+        for i, row in enumerate(self.similar_rows):
+            if i < len(similar):
+                row.club = similar[i]
+                row.config(text=f"• {similar[i].get_name()}")
+                row.grid(row=i + 1, column=0, sticky="w")
+            else:
+                row.club = None
+                row.grid_remove()
+
     def toggle_favourite(self):
         """
         Toggle the favourite status of the current club.
@@ -340,21 +416,6 @@ class ClubView(ttk.Frame):
                 self.current_club.favourite()
                 self.favourite_button.config(text="♥", fg="#720808")
 
-            # Save updated clubs.json file
-            self.save_clubs_to_file()
-
-    def save_clubs_to_file(self):
-        """
-        Helper function to save the updated clubs to the clubs.json file.
-        """
-        # Load all club objects from the file
-        clubs = load_from_file(CLUBS_FILE)
-        all_clubs = [Club(**club) for club in clubs]
-
-        # Save the updated list of clubs to the file
-        updated_clubs_data = [club.to_dict() for club in all_clubs]
-        save_to_file(CLUBS_FILE, updated_clubs_data)
-
     def change_to_ClubListView(self):
         """
         Navigate back to the ClubListView.
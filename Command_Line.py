@@ -0,0 +1,112 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program runs parts of the app without opening a window, e.g.
+on a server or from a scheduled task. Run it from the project folder with:
+
+    python Command_Line.py refresh
+    python Command_Line.py ics --campus UTM --from 2024-10-01 -o events.ics
+
+refresh scrapes the clubs and events again. ics exports events as an
+iCalendar file, all of them or only those of the clubs that match the
+filters, to a file or to the screen.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import argparse
+import datetime
+import sys
+from Database import refresh_database
+from Ics_Export import export_ics
+
+
+def refresh(args) -> None:
+    """
+    Scrapes the clubs and events again and saves them.
+
+    :param args: The parsed arguments.
+    """
+    clubs, events = refresh_database()
+    print(f"Saved {len(clubs)} clubs and {len(events)} events")
+
+
+def ics(args) -> None:
+    """
+    Exports events as an iCalendar file.
+
+    :param args: The parsed arguments.
+    """
+    chunks = export_ics(
+        campus=args.campus,
+        all_categories=args.category,
+        favourite=True if args.favourites else None,
+        events_from=args.events_from,
+        events_to=args.events_to,
+    )
+    if args.output == "-":
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.output, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the club finder without a window."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser(
+        "refresh", help="scrape the clubs and events again"
+    ).set_defaults(run=refresh)
+
+    ics_parser = commands.add_parser(
+        "ics", help="export events as an iCalendar file"
+    )
+    ics_parser.add_argument("--campus", help="only clubs on this campus")
+    ics_parser.add_argument(
+        "--category",
+        action="append",
+        help="only clubs in this category, can be given more than once",
+    )
+    ics_parser.add_argument(
+        "--favourites", action="store_true", help="only favourite clubs"
+    )
+    ics_parser.add_argument(
+        "--from",
+        dest="events_from",
+        type=datetime.date.fromisoformat,
+        help="first date, YYYY-MM-DD",
+    )
+    ics_parser.add_argument(
+        "--to",
+        dest="events_to",
+        type=datetime.date.fromisoformat,
+        help="last date, YYYY-MM-DD",
+    )
+    ics_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="the file to write, the screen if not given",
+    )
+    ics_parser.set_defaults(run=ics)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,38 @@
-import requests
-from bs4 import BeautifulSoup
 import json  # codehs does not need to install
 import os  # codehs does not need to install
 import datetime
+import atexit
+import copy
+import gzip
+import hashlib
+import importlib
+import io
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 
 # names for files
 CLUBS_FILE = "clubs.json"
 EVENTS_FILE = "events.json"
 FILTERS_FILE = "filters.json"
 
+# formats save_to_file can write, load_from_file works out which one it is
+# pretty: json with indents, compact: json without spaces,
+# fast: compact json from orjson if it is installed,
+# gzip: compact json compressed, msgpack: binary (needs msgpack installed),
+# msgpack-gzip: msgpack compressed
+SAVE_FORMATS = ("pretty", "compact", "fast", "gzip", "msgpack", "msgpack-gzip")
+SAVE_FORMAT = "compact"  # the format used when none is given
+GZIP_MAGIC = b"\x1f\x8b"
+
+# saves to the same file within this many seconds are written only once
+COALESCE_SECONDS = 0.25
+
+# how long the writer thread waits before trying a failed write again
+RETRY_SECONDS = 5
+
 
 class Event:
     """
@@ -20,6 +44,7 @@ class Event:
     original_url: The original url of the event, may not be working.
     title: The title of the event.
     description: The description of the event from the club page.
+    event_id: A stable id for the event, made from its url and date.
     """
 
     def __init__(
@@ -29,6 +54,7 @@ class Event:
         original_url: str,
         title: str,
         description: str,
+        event_id: str = None,
     ):
         """
         Constructor for the Event class."""
@@ -37,6 +63,7 @@ class Event:
         self.__original_url = original_url
         self.__title = title
         self.__description = description
+        self.__event_id = event_id
 
     # GETTERS BELOW vvvvvvvvvvvvvvvvvvvvvvvv
 
@@ -55,6 +82,13 @@ class Event:
     def get_description(self):
         return self.__description
 
+    def get_event_id(self):
+        if self.__event_id is None:
+            self.__event_id = make_event_id(
+                {"original_url": self.__original_url, "date": self.__date}
+            )
+        return self.__event_id
+
     # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
 
     def to_dict(self):
@@ -70,6 +104,7 @@ class Event:
             "original_url": self.get_original_url(),
             "title": self.get_title(),
             "description": self.get_description(),
+            "event_id": self.get_event_id(),
         }
 
 
@@ -83,7 +118,8 @@ class Club:
     description: The description of the club.
     contacts: Any social media, email, or phone numbers on the website.
     categories: The categories the club falls under.
-    events: A list of Event objects related to the club.
+    events: A list of Event objects related to the club. Clubs loaded from
+    the files hold event ids instead, which are looked up in EVENTS_FILE.
     original_url: The original url of the club.
     is_favourited: A boolean to check if the club is favourited.
     """
@@ -120,6 +156,9 @@ class Club:
         return self.__campus
 
     def get_description(self) -> str:
+        # clubs from the snapshot only read their description when needed
+        if callable(self.__description):
+            return self.__description()
         return self.__description
 
     def get_contacts(self) -> list:
@@ -129,7 +168,27 @@ class Club:
         return self.__categories
 
     def get_events(self) -> list:
-        return self.__events
+        # event ids are only looked up when the events are needed, and
+        # events still inside the club (from files that were never migrated
+        # or a refresh in progress) come back as the same kind of dictionary
+        events = []
+        for event in self.__events:
+            if isinstance(event, str):
+                event = get_event(event)
+            elif isinstance(event, Event):
+                event = get_event(event.get_event_id()) or event.to_dict()
+            else:
+                event_id = make_event_id(event)
+                event = get_event(event_id) or {**event, "event_id": event_id}
+            if event is not None:
+                events.append(event)
+        return events
+
+    def get_event_ids(self) -> list:
+        return [
+            event if isinstance(event, str) else make_event_id(event)
+            for event in self.__events
+        ]
 
     def get_original_url(self) -> str:
         return self.__original_url
@@ -142,7 +201,8 @@ class Club:
     def to_dict(self) -> dict:
         """
         Converts to a dictionary. We need this to save the data to a file.
-        Note that the events are converted to a dictionary as well.
+        Note that only the event ids are saved, the events themselves are
+        saved once in EVENTS_FILE.
 
         :return: A dictionary of the Club object.
         """
@@ -152,37 +212,173 @@ class Club:
             "description": self.get_description(),
             "contacts": self.get_contacts(),
             "categories": self.get_categories(),
-            "events": [event.to_dict() for event in self.get_events()],
+            "events": self.get_event_ids(),
             "original_url": self.get_original_url(),
             "is_favourited": self.get_is_favourited(),
         }
 
+    def set_is_favourited(self, is_favourited: bool) -> None:
+        """
+        Sets the favourite attribute without saving, e.g. when another app
+        changed it.
+
+        :param is_favourited: The new value.
+        """
+        self.__is_favourited = is_favourited
+
     def favourite(self):
         """
         Sets the favourite attribute to true and updates the database.
+        Only this club is changed in the file, on the writer thread. The
+        views that depend on favourites are told right away.
         """
-        self.__is_favourited = True
-        clubs = load_from_file(CLUBS_FILE)
-        for club in clubs:
-            if club["original_url"] == self.get_original_url():
-                club["is_favourited"] = True
-                break
-        save_to_file(CLUBS_FILE, clubs)
+        self.set_is_favourited(True)
+        update_later(
+            CLUBS_FILE,
+            "original_url",
+            self.get_original_url(),
+            {"is_favourited": True},
+        )
+
+        from Club_Store import club_store  # avoids circle error
+
+        club_store.favourite_changed(self)
 
     def unfavourite(self):
         """
         Sets the favourite attribute to false and updates the database.
+        Only this club is changed in the file, on the writer thread. The
+        views that depend on favourites are told right away.
         """
-        self.__is_favourited = False
-        clubs = load_from_file(CLUBS_FILE)
-        for club in clubs:
-            if club["original_url"] == self.get_original_url():
-                club["is_favourited"] = False
-                break
-        save_to_file(CLUBS_FILE, clubs)
+        self.set_is_favourited(False)
+        update_later(
+            CLUBS_FILE,
+            "original_url",
+            self.get_original_url(),
+            {"is_favourited": False},
+        )
 
+        from Club_Store import club_store  # avoids circle error
 
-def fetch_page(url: str) -> BeautifulSoup:
+        club_store.favourite_changed(self)
+
+
+def make_event_id(event) -> str:
+    """
+    Makes a stable id for an event from its url and date, so the same event
+    gets the same id every time the database is refreshed.
+
+    :param event: The Event object or event dictionary.
+    :return: The event id.
+    """
+    if isinstance(event, Event):
+        return event.get_event_id()
+    if event.get("event_id"):
+        return event["event_id"]
+
+    date = event.get("date", "")
+    if isinstance(date, datetime.datetime):
+        date = date.strftime("%d %B, %Y")
+    key = f"{event.get('original_url', '')}|{date}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+# the events from EVENTS_FILE by id, reloaded when the file changes
+_event_store = {"signature": None, "events": {}}
+
+
+def load_event_store() -> dict:
+    """
+    Loads the events by id. The file is only read again if it changed.
+
+    :return: A dictionary of event id -> event dictionary.
+    """
+    try:
+        stat = os.stat(EVENTS_FILE)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        return {}
+
+    if _event_store["signature"] != signature:
+        _event_store["events"] = {
+            make_event_id(event): event for event in iter_records(EVENTS_FILE)
+        }
+        _event_store["signature"] = signature
+    return _event_store["events"]
+
+
+def get_event(event_id: str) -> dict:
+    """
+    Gets an event by its id.
+
+    :param event_id: The event id.
+    :return: The event dictionary, or None if there is no such event.
+    """
+    return load_event_store().get(event_id)
+
+
+def migrate_events(
+    clubs_file: str = CLUBS_FILE, events_file: str = EVENTS_FILE
+) -> dict:
+    """
+    One-time migration of files from before events had ids. The events
+    inside each club are moved to the events file (once each), every event
+    gets an event_id, and the clubs only keep the ids.
+    Files that were already migrated are left alone.
+
+    :param clubs_file: The name of the clubs file.
+    :param events_file: The name of the events file.
+    :return: A dictionary with the size of the files before and after, or
+    None if nothing was migrated.
+    """
+    # another app could be migrating or changing the files at the same time
+    with data_lock():
+        return _migrate_events(clubs_file, events_file)
+
+
+def _migrate_events(clubs_file: str, events_file: str) -> dict:
+    """
+    Does the migration for migrate_events, holding data_lock.
+    """
+    # migrated clubs only hold ids, so the first club with events tells
+    for club in iter_from_file(clubs_file):
+        if club.get("events"):
+            if not isinstance(club["events"][0], dict):
+                return None
+            break
+    else:
+        return None
+
+    clubs = load_from_file(clubs_file)
+    events = load_from_file(events_file)
+    bytes_before = os.path.getsize(clubs_file) + os.path.getsize(events_file)
+
+    # one copy of each event, by id
+    store = {}
+    for event in events:
+        event["event_id"] = make_event_id(event)
+        store[event["event_id"]] = event
+    for club in clubs:
+        event_ids = []
+        for event in club["events"]:
+            if isinstance(event, dict):
+                event_id = make_event_id(event)
+                store.setdefault(event_id, {**event, "event_id": event_id})
+                event = event_id
+            event_ids.append(event)
+        club["events"] = event_ids
+
+    save_to_file(events_file, list(store.values()))
+    save_to_file(clubs_file, clubs)
+
+    return {
+        "bytes_before": bytes_before,
+        "bytes_after": os.path.getsize(clubs_file)
+        + os.path.getsize(events_file),
+    }
+
+
+def fetch_page(url: str) -> "BeautifulSoup":
     """
     Helper function to fetch the page from the url and parse it.
     If it runs into an error, it prints the error and returns None.
@@ -190,6 +386,10 @@ def fetch_page(url: str) -> BeautifulSoup:
     :param url: The url to fetch.
     :return: The BeautifulSoup object.
     """
+    # only imported when a refresh runs, so starting the app stays fast
+    import requests
+    from bs4 import BeautifulSoup
+
     try:
         # fetch the page
         response = requests.get(url)
@@ -379,26 +579,620 @@ def refresh_database() -> tuple:
     #         events.extend(club_events)
 
     # rewrites the json files, converting the objects to dictionaries
-    save_to_file(CLUBS_FILE, [club.to_dict() for club in clubs])
-    save_to_file(EVENTS_FILE, [event.to_dict() for event in events])
+    club_dicts = [club.to_dict() for club in clubs]
+    event_dicts = [event.to_dict() for event in events]
+    with data_lock():
+        # keep the favourites, even ones made while this was scraping
+        favourites = {
+            club["original_url"]
+            for club in load_from_file(CLUBS_FILE)
+            if club.get("is_favourited")
+        }
+        for club in club_dicts:
+            club["is_favourited"] = club["original_url"] in favourites
+        save_to_file(CLUBS_FILE, club_dicts)
+        save_to_file(EVENTS_FILE, event_dicts)
+
+    # the json lines versions can be read one club or event at a time
+    save_to_jsonl(jsonl_name(CLUBS_FILE), club_dicts)
+    save_to_jsonl(jsonl_name(EVENTS_FILE), event_dicts)
+
+    # writes the snapshot so the next start up does not parse the json files
+    from Snapshot import build_snapshot, write_snapshot  # avoids circle error
+
+    write_snapshot(build_snapshot(club_dicts, event_dicts))
+
+    # works out the similar clubs now, so opening a club does not wait
+    from Similar_Clubs import build_similar  # avoids circle error
+
+    build_similar(
+        [club["original_url"] for club in club_dicts],
+        [club["categories"] for club in club_dicts],
+        [club["description"] for club in club_dicts],
+    )
 
     return clubs, events
 
 
-def save_to_file(filename: str, data: list) -> None:
+@lru_cache(maxsize=None)
+def optional_module(name: str):
+    """
+    Imports a module that does not have to be installed.
+
+    :param name: The name of the module.
+    :return: The module, or None if it is not installed.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def require_module(name: str):
+    """
+    Imports a module that a chosen file format needs.
+
+    :param name: The name of the module.
+    :return: The module.
+    """
+    module = optional_module(name)
+    if module is None:
+        raise ImportError(f"{name} is not installed, pip install {name}")
+    return module
+
+
+def encode_data(data, file_format: str = None) -> bytes:
+    """
+    Converts the data to bytes in one of the SAVE_FORMATS.
+
+    :param data: The data to convert.
+    :param file_format: The format, SAVE_FORMAT if not given.
+    :return: The bytes to write to the file.
+    """
+    file_format = file_format or SAVE_FORMAT
+    if file_format not in SAVE_FORMATS:
+        raise ValueError(f"Unknown file format: {file_format}")
+
+    if file_format == "pretty":
+        return json.dumps(data, indent=4).encode("utf-8")
+    if file_format in ("msgpack", "msgpack-gzip"):
+        encoded = require_module("msgpack").packb(data)
+    elif file_format in ("fast", "gzip") and optional_module("orjson"):
+        encoded = optional_module("orjson").dumps(data)
+    else:
+        encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    if file_format.endswith("gzip"):
+        # level 1 is about 4 times faster than the default and still about
+        # a fifth of the size
+        return gzip.compress(encoded, compresslevel=1)
+    return encoded
+
+
+def decode_data(raw: bytes):
+    """
+    Converts bytes from a file back to data, working out the format from the
+    first bytes: gzip files start with GZIP_MAGIC and JSON with [ or {.
+
+    :param raw: The bytes read from the file.
+    :return: The data.
+    """
+    if raw.startswith(GZIP_MAGIC):
+        raw = gzip.decompress(raw)
+
+    if raw.lstrip()[:1] in (b"[", b"{"):
+        if optional_module("orjson"):
+            return optional_module("orjson").loads(raw)
+        return json.loads(raw)
+    return require_module("msgpack").unpackb(raw)
+
+
+@contextmanager
+def atomic_write(filename: str):
+    """
+    Opens a temporary file next to filename for writing in binary. When the
+    block ends, the data is flushed to disk and the temporary file replaces
+    filename in one step, so a crash never leaves a half written file.
+
+    :param filename: The name of the file.
+    :return: The open temporary file.
+    """
+    folder = os.path.dirname(os.path.abspath(filename))
+    fd, temp_filename = tempfile.mkstemp(
+        dir=folder, prefix=os.path.basename(filename) + ".", suffix=".tmp"
+    )
+    try:
+        # keep the permissions of the file being replaced
+        mode = os.stat(filename).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_filename, mode)
+        os.replace(temp_filename, filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+    # make the rename itself survive a crash (not possible on Windows)
+    try:
+        folder_fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(folder_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(folder_fd)
+
+
+# one app (or refresh) at a time changes the data files, see data_lock
+LOCK_FILE = "data.lock"
+
+# the generation goes up by one with every change to a data file, and each
+# change is added to the changes file, so other apps can catch up cheaply
+SEQUENCE_FILE = "data.seq"
+CHANGES_FILE = "changes.jsonl"
+CHANGES_LIMIT = 1 << 20  # bytes, the older half is dropped past this
+
+# the lock is held by this process while the depth is above zero
+_data_lock = threading.RLock()
+_lock_state = {"depth": 0, "file": None}
+
+
+@contextmanager
+def data_lock(filename: str = LOCK_FILE):
+    """
+    Holds the lock on the data files, for reading, changing and writing them
+    in one go. Other threads wait on a thread lock and other processes on an
+    advisory lock on the lock file (fcntl, which Windows does not have).
+    The same thread can take it again while holding it.
+
+    :param filename: The name of the lock file.
+    """
+    with _data_lock:
+        if _lock_state["depth"] == 0:
+            f = open(filename, "a+b")
+            fcntl = optional_module("fcntl")
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            _lock_state["file"] = f
+        _lock_state["depth"] += 1
+        try:
+            yield
+        finally:
+            _lock_state["depth"] -= 1
+            if _lock_state["depth"] == 0:
+                # closing the file releases the flock
+                _lock_state["file"].close()
+                _lock_state["file"] = None
+
+
+def get_generation() -> int:
+    """
+    Gets the number of changes made to the data files so far.
+
+    :return: The generation, 0 if nothing was recorded yet.
+    """
+    try:
+        with open(SEQUENCE_FILE, "rb") as f:
+            return int(f.read() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def record_change(filename: str, key: str = None, changes: dict = None) -> int:
+    """
+    Records that a data file changed. Hold data_lock while calling this,
+    together with the write itself.
+
+    :param filename: The name of the file that changed.
+    :param key: The field the items in changes are found by, e.g.
+    original_url.
+    :param changes: A dictionary of key value -> dictionary of the new field
+    values, or None if the whole file was rewritten.
+    :return: The new generation.
+    """
+    generation = get_generation() + 1
+    entry = {
+        "generation": generation,
+        "file": filename,
+        "key": key,
+        "changes": changes,
+    }
+
+    # the log goes first, so the entry is there once the generation is seen
+    if (
+        os.path.exists(CHANGES_FILE)
+        and os.path.getsize(CHANGES_FILE) > CHANGES_LIMIT
+    ):
+        with open(CHANGES_FILE, "rb") as f:
+            lines = f.read().splitlines(keepends=True)
+        with atomic_write(CHANGES_FILE) as f:
+            f.writelines(lines[len(lines) // 2 :])
+    with open(CHANGES_FILE, "ab") as f:
+        f.write((json.dumps(entry) + "\n").encode("utf-8"))
+
+    with atomic_write(SEQUENCE_FILE) as f:
+        f.write(str(generation).encode())
+    return generation
+
+
+def changes_since(generation: int) -> list:
+    """
+    Gets the changes made to the data files after a generation.
+
+    :param generation: The generation already seen.
+    :return: A list of the change dictionaries from record_change, oldest
+    first, or None if some of them are no longer in the changes file.
+    """
+    current = get_generation()
+    if current <= generation:
+        return []
+
+    changes = []
+    try:
+        with open(CHANGES_FILE, "rb") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:  # cut off by a crash
+                    continue
+                if generation < entry["generation"] <= current:
+                    changes.append(entry)
+    except FileNotFoundError:
+        return None
+
+    # every generation in between has to be there
+    if [entry["generation"] for entry in changes] != list(
+        range(generation + 1, current + 1)
+    ):
+        return None
+    return changes
+
+
+def apply_changes(data: list, key: str, changes: dict) -> list:
+    """
+    Applies changes from record_change to the items loaded from a file.
+
+    :param data: The list of item dictionaries.
+    :param key: The field the items are found by.
+    :param changes: A dictionary of key value -> dictionary of new values.
+    :return: The same list.
+    """
+    if changes:
+        for item in data:
+            if item.get(key) in changes:
+                item.update(changes[item[key]])
+    return data
+
+
+class FileWriter:
     """
-    Saves the data to the file.
+    The FileWriter class. It saves files on its own thread, so the app does
+    not wait for the disk. Saves to the same file that come in within
+    COALESCE_SECONDS of each other are written once, with the newest data.
+
+    Changes to single items (see update) are applied to the file as it is
+    on disk when it is written, under data_lock, so they never overwrite
+    what another app wrote in the meantime.
+
+    Attributes:
+    pending: A dictionary of filename -> dictionary with the data (None if
+    only items changed), file_format, key and changes not written yet.
+    writing: The same, for the files being written right now.
+    write_lock: Held while a file is written, so only one write happens at
+    a time.
+    """
+
+    def __init__(self, delay: float = COALESCE_SECONDS):
+        """
+        Constructor for the FileWriter class. The thread starts on the first
+        save.
+        """
+        self.delay = delay
+        self.pending = {}
+        self.writing = {}
+        self.condition = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.thread = None
+
+    def queue(self, filename: str) -> dict:
+        """
+        Gets the entry queued for a file, making an empty one if needed,
+        and wakes up the thread. Hold condition when calling this.
+
+        :param filename: The name of the file.
+        :return: The pending dictionary for the file.
+        """
+        if filename not in self.pending:
+            self.pending[filename] = {
+                "data": None,
+                "file_format": None,
+                "key": None,
+                "changes": {},
+            }
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+        self.condition.notify()
+        return self.pending[filename]
+
+    def save(self, filename: str, data, file_format: str = None) -> None:
+        """
+        Queues data to be saved to a file. It replaces anything still queued
+        for that file.
+
+        :param filename: The name of the file.
+        :param data: The data to save.
+        :param file_format: One of SAVE_FORMATS, SAVE_FORMAT if not given.
+        """
+        with self.condition:
+            self.pending.pop(filename, None)
+            entry = self.queue(filename)
+            entry["data"] = data
+            entry["file_format"] = file_format
+
+    def update(self, filename: str, key: str, value, changes: dict) -> None:
+        """
+        Queues a change to one item of a file.
+
+        :param filename: The name of the file.
+        :param key: The field the item is found by, e.g. original_url.
+        :param value: The value of that field for the item.
+        :param changes: A dictionary of the fields to change.
+        """
+        with self.condition:
+            entry = self.queue(filename)
+            entry["key"] = key
+            entry["changes"].setdefault(value, {}).update(changes)
+
+    def get_pending(self, filename: str) -> list:
+        """
+        Gets what was saved to a file but is not on disk yet.
+
+        :param filename: The name of the file.
+        :return: A list of pending dictionaries, oldest first.
+        """
+        with self.condition:
+            return [
+                copy.deepcopy(entries[filename])
+                for entries in (self.writing, self.pending)
+                if filename in entries
+            ]
+
+    def requeue(self, filename: str, entry: dict) -> None:
+        """
+        Queues an entry that could not be written again, in front of
+        anything queued for the file since. Hold condition when calling
+        this.
+
+        :param filename: The name of the file.
+        :param entry: The pending dictionary that was not written.
+        """
+        newer = self.pending.get(filename)
+        if newer is None:
+            self.pending[filename] = entry
+        elif newer["data"] is None:
+            # the newer changes go on top of the older entry
+            for value, changes in newer["changes"].items():
+                entry["changes"].setdefault(value, {}).update(changes)
+            entry["key"] = newer["key"] or entry["key"]
+            self.pending[filename] = entry
+        # otherwise the newer data replaces the whole file anyway
+
+    def discard(self, filename: str) -> None:
+        """
+        Drops the data queued for a file, e.g. because newer data is being
+        written to it right away. Hold write_lock when calling this.
+
+        :param filename: The name of the file.
+        """
+        with self.condition:
+            self.pending.pop(filename, None)
+
+    def run(self) -> None:
+        """
+        The writer thread: waits for saves, gives more saves a moment to come
+        in, then writes them. Writes that fail stay queued and are tried
+        again after RETRY_SECONDS.
+        """
+        try:
+            while True:
+                with self.condition:
+                    while not self.pending:
+                        self.condition.wait()
+                time.sleep(self.delay)
+                try:
+                    self.flush()
+                except Exception as e:
+                    # e.g. the disk is full, the data is still in memory
+                    print(f"Error saving data files: {e}")
+                    time.sleep(RETRY_SECONDS)
+        finally:
+            # the next save starts a new thread
+            with self.condition:
+                self.thread = None
+
+    def flush(self) -> None:
+        """
+        Writes everything that is queued now, on the calling thread. Files
+        that could not be written are queued again, and the first error is
+        raised once the other files are written.
+        """
+        error = None
+        # always data_lock first, then write_lock, like save_to_file
+        with data_lock(), self.write_lock:
+            with self.condition:
+                self.writing = self.pending
+                self.pending = {}
+            written = set()
+            try:
+                for filename, entry in self.writing.items():
+                    try:
+                        self.write_entry(filename, entry)
+                    except Exception as e:
+                        error = error or e
+                    else:
+                        written.add(filename)
+            finally:
+                with self.condition:
+                    for filename, entry in self.writing.items():
+                        if filename not in written:
+                            self.requeue(filename, entry)
+                    self.writing = {}
+        if error is not None:
+            raise error
+
+    def write_entry(self, filename: str, entry: dict) -> None:
+        """
+        Writes one queued entry to its file. Hold data_lock and write_lock
+        when calling this.
+
+        :param filename: The name of the file.
+        :param entry: The pending dictionary for the file.
+        """
+        # a favourite only changes one column of the snapshot, so it is
+        # updated instead of being rebuilt on the next start up
+        favourites = None
+        if (
+            filename == CLUBS_FILE
+            and entry["data"] is None
+            and entry["key"] == "original_url"
+            and all(
+                set(fields) == {"is_favourited"}
+                for fields in entry["changes"].values()
+            )
+        ):
+            from Snapshot import source_digest  # avoids circle error
+
+            favourites = {
+                url: fields["is_favourited"]
+                for url, fields in entry["changes"].items()
+            }
+            before = source_digest()
+
+        data = entry["data"]
+        if data is None:
+            data = read_data_file(filename)
+        apply_changes(data, entry["key"], entry["changes"])
+        write_data_file(filename, data, entry["file_format"])
+        if entry["data"] is None:
+            record_change(filename, entry["key"], entry["changes"])
+        else:
+            record_change(filename)
+
+        if favourites:
+            from Snapshot import update_favourites  # avoids circle error
+
+            try:
+                update_favourites(before, favourites)
+            except OSError as e:
+                # the file was written, only the next start up is slower
+                print(f"Error updating the snapshot: {e}")
+
+            from User_Favourites import save_favourites  # avoids circle error
+
+            try:
+                save_favourites(data, favourites)
+            except OSError as e:
+                print(f"Error saving the user favourites: {e}")
+
+
+def write_data_file(filename: str, data, file_format: str = None) -> None:
+    """
+    Writes the data to the file right away, crash safe.
+
+    :param filename: The name of the file.
+    :param data: The data to save.
+    :param file_format: One of SAVE_FORMATS, SAVE_FORMAT if not given.
+    """
+    encoded = encode_data(data, file_format)
+    with atomic_write(filename) as f:
+        f.write(encoded)
+
+
+def read_data_file(filename: str):
+    """
+    Reads the data as it is on disk, leaving out anything still queued.
+
+    :param filename: The name of the file.
+    :return: The data from the file, or an empty list if it is missing.
+    """
+    try:
+        with open(filename, "rb") as f:
+            return decode_data(f.read())
+    except FileNotFoundError:
+        return []
+
+
+# the one writer thread for all the data files
+file_writer = FileWriter()
+
+# writes anything still queued when the app closes
+atexit.register(file_writer.flush)
+
+
+def save_later(filename: str, data: list, file_format: str = None) -> None:
+    """
+    Saves the data to the file on the writer thread, without waiting.
+    load_from_file already returns the new data before it is written.
 
     :param filename: The name of the file.
     :param data: The data to save.
+    :param file_format: One of SAVE_FORMATS, SAVE_FORMAT if not given.
     """
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=4)  # indent for pretty printing :)
+    file_writer.save(filename, data, file_format)
+
+
+def update_later(filename: str, key: str, value, changes: dict) -> None:
+    """
+    Changes one item of a file on the writer thread, without waiting.
+    Only that item is changed, so changes other apps made to the rest of the
+    file are kept.
+
+    :param filename: The name of the file.
+    :param key: The field the item is found by, e.g. original_url.
+    :param value: The value of that field for the item.
+    :param changes: A dictionary of the fields to change.
+    """
+    file_writer.update(filename, key, value, changes)
+
+
+def flush_writes() -> None:
+    """
+    Writes everything saved with save_later that is not on disk yet.
+    """
+    file_writer.flush()
+
+
+def save_to_file(filename: str, data: list, file_format: str = None) -> None:
+    """
+    Saves the data to the file right away. The file is replaced in one step,
+    so it is never left half written.
+
+    :param filename: The name of the file.
+    :param data: The data to save.
+    :param file_format: One of SAVE_FORMATS, SAVE_FORMAT if not given.
+    """
+    # the same order as FileWriter.flush, since callers can already hold
+    # data_lock
+    with data_lock(), file_writer.write_lock:
+        # anything queued for the file is older than this
+        file_writer.discard(filename)
+        write_data_file(filename, data, file_format)
+        record_change(filename)
 
 
 def load_from_file(filename: str) -> list:
     """
-    Loads the data from the file.
+    Loads the data from the file, in any of the SAVE_FORMATS.
 
     :param filename: The name of the file.
     :return: The data from the file as a list.
@@ -407,8 +1201,184 @@ def load_from_file(filename: str) -> list:
     if not os.path.exists(filename):
         save_to_file(filename, [])
 
-    with open(filename, "r") as f:
-        return json.load(f)
+    # data saved with save_later that is not written yet is the newest
+    pending = file_writer.get_pending(filename)
+    if pending:
+        data = None
+        for entry in pending:
+            if entry["data"] is not None:
+                data = entry["data"]
+            elif data is None:
+                data = read_data_file(filename)
+            apply_changes(data, entry["key"], entry["changes"])
+        return data
+
+    with open(filename, "rb") as f:
+        return decode_data(f.read())
+
+
+def open_data_file(filename: str) -> tuple:
+    """
+    Opens a data file for reading as a stream, uncompressing it if needed.
+
+    :param filename: The name of the file.
+    :return: A tuple of the format ("json" or "msgpack") and the open
+    binary file.
+    """
+    with open(filename, "rb") as f:
+        compressed = f.read(2) == GZIP_MAGIC
+
+    f = gzip.open(filename, "rb") if compressed else open(filename, "rb")
+    start = f.read(64).lstrip()[:1]
+    f.seek(0)
+    return ("json" if start in (b"[", b"{", b"") else "msgpack"), f
+
+
+def jsonl_name(filename: str) -> str:
+    """
+    Gets the name of the JSON Lines version of a data file.
+
+    :param filename: The name of the JSON file, e.g. clubs.json.
+    :return: The name of the JSON Lines file, e.g. clubs.jsonl.
+    """
+    return os.path.splitext(filename)[0] + ".jsonl"
+
+
+def save_to_jsonl(filename: str, data) -> None:
+    """
+    Saves the data to a JSON Lines file, one item per line. The data can be
+    any iterable, so it does not need to be in memory all at once.
+
+    :param filename: The name of the file.
+    :param data: The items to save.
+    """
+    with atomic_write(filename) as f:
+        for item in data:
+            f.write((json.dumps(item) + "\n").encode("utf-8"))
+
+
+def iter_from_file(filename: str, chunk_size: int = 65536):
+    """
+    Reads the items from a data file one at a time, without loading the whole
+    file first. JSON Lines files (.jsonl) are read line by line. Other files
+    must hold a list in one of the SAVE_FORMATS, which is read in chunks and
+    decoded item by item.
+
+    :param filename: The name of the file.
+    :param chunk_size: How many characters to read at a time.
+    :return: A generator of the items in the file.
+    """
+    if not os.path.exists(filename):
+        return
+
+    if filename.endswith(".jsonl"):
+        with open(filename, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+
+    file_format, f = open_data_file(filename)
+    with f:
+        if file_format == "msgpack":
+            unpacker = require_module("msgpack").Unpacker(f)
+            for _ in range(unpacker.read_array_header()):
+                yield unpacker.unpack()
+            return
+
+        yield from iter_json_list(
+            io.TextIOWrapper(f, encoding="utf-8"), filename, chunk_size
+        )
+
+
+def iter_json_list(f, filename: str, chunk_size: int = 65536):
+    """
+    Decodes the items of a JSON list from an open text file one at a time.
+
+    :param f: The open text file.
+    :param filename: The name of the file, for error messages.
+    :param chunk_size: How many characters to read at a time.
+    :return: A generator of the items in the list.
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size)
+    position = 0
+    end_of_file = buffer == ""
+    started = False  # true after the opening [
+
+    while True:
+        # skip the spaces, and the commas between items
+        separators = " \t\r\n," if started else " \t\r\n"
+        while position < len(buffer) and buffer[position] in separators:
+            position += 1
+
+        # read the next chunk when this one is used up
+        if position == len(buffer):
+            if end_of_file:
+                raise ValueError(f"{filename} ended before the list did")
+            buffer = f.read(chunk_size)
+            position = 0
+            end_of_file = buffer == ""
+            continue
+
+        if not started:
+            if buffer[position] != "[":
+                raise ValueError(f"{filename} does not hold a list")
+            started = True
+            position += 1
+            continue
+
+        if buffer[position] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            item, end = None, None
+
+        # a number, true, false or null only ends at the comma or ] after
+        # it (or the end of the file), e.g. 1.5 cut off after "1." would be
+        # read as 1
+        complete = end is not None
+        if complete and not isinstance(item, (dict, list, str)):
+            after = end
+            while after < len(buffer) and buffer[after] in " \t\r\n":
+                after += 1
+            if after < len(buffer):
+                complete = buffer[after] in ",]"
+            else:
+                complete = end_of_file
+
+        # an item that reaches the end of the chunk may be cut off, so
+        # the unused part is kept and the next chunk added to it
+        if not complete and not end_of_file:
+            more = f.read(chunk_size)
+            end_of_file = more == ""
+            buffer = buffer[position:] + more
+            position = 0
+            continue
+        if not complete:
+            raise ValueError(f"{filename} has an item that is not JSON")
+
+        yield item
+        position = end
+
+
+def iter_records(filename: str):
+    """
+    Reads the items from a data file one at a time. If the JSON Lines
+    version of the file is there and up to date, it is read instead.
+
+    :param filename: The name of the JSON file, e.g. clubs.json.
+    :return: A generator of the items in the file.
+    """
+    lines_file = jsonl_name(filename)
+    if os.path.exists(lines_file) and (
+        not os.path.exists(filename)
+        or os.path.getmtime(lines_file) >= os.path.getmtime(filename)
+    ):
+        return iter_from_file(lines_file)
+    return iter_from_file(filename)
 
 
 def check_files() -> bool:
@@ -429,6 +1399,9 @@ def check_files() -> bool:
         save_to_file(EVENTS_FILE, [])
         files_created = True
 
+    # moves events out of the clubs file, if it is from an older version
+    migrate_events()
+
     return files_created
 
 
@@ -450,6 +1423,32 @@ def get_all_categories(clubs: list) -> list:
     return list(all_categories)
 
 
+def group_events_by_date(events: list) -> dict:
+    """
+    Groups event dictionaries by the ordinal of their date, so the events on
+    a day can be found without going through all of them.
+
+    :param events: The list of event dictionaries.
+    :return: A dictionary of date ordinal -> list of event dictionaries.
+    """
+    by_date = {}
+    ordinals = {}  # many events share a date, so each is only parsed once
+
+    for event in events:
+        date = event.get("date", "")
+        if date not in ordinals:
+            try:
+                ordinals[date] = datetime.datetime.strptime(
+                    date, "%d %B, %Y"
+                ).toordinal()
+            except ValueError:
+                ordinals[date] = None  # skip events without a readable date
+        if ordinals[date] is not None:
+            by_date.setdefault(ordinals[date], []).append(event)
+
+    return by_date
+
+
 def filter_campus(clubs: list, campus: str) -> list:
     """
     Filters the clubs by campus (St George, UTM, UTSC).
@@ -509,17 +1508,16 @@ def filter_keywords(clubs: list, keywords: list) -> list:
 
 def update_filters(campus: str, interests: list) -> None:
     """
-    Adds filters for campus and interests to the filter file.
+    Adds filters for campus and interests to the filter state, which saves
+    them to the filter file.
 
     :param campus: String for campus
     :param interests: The list of interests chosen.
     """
-    if os.path.exists(FILTERS_FILE):
-        with open(FILTERS_FILE, "r") as f:
-            filters = json.load(f)
-            if campus:  # campus was selected
-                filters["campus"] = campus
-            elif interests:
-                filters["interests"] = interests
+    from Filter_State import filter_state  # avoids circle error
 
-    save_to_file(FILTERS_FILE, filters)
+    # the views get the new filters right away, the file is saved later
+    if campus:  # campus was selected
+        filter_state.update(campus=campus)
+    elif interests:
+        filter_state.update(interests=interests)
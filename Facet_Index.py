@@ -0,0 +1,249 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program counts the clubs in each category on each campus, and
+how many of them are favourites, so the views can show the counts next to
+the categories and campuses. The counts are made once from the club store's
+indexes every time the clubs are reloaded, and favouriting or unfavouriting
+a club only changes the counts for its categories. Every count is then a
+dictionary lookup.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import threading
+from Club_Store import club_store
+
+# how many sets of interests keep their counts, the oldest are dropped
+INTEREST_CACHE_SIZE = 64
+
+
+class FacetIndex:
+    """
+    The FacetIndex class.
+
+    Attributes:
+    store: The ClubStore the counts come from.
+    loads: The store loads the counts were made for.
+    counts: A dictionary of (campus, category) -> number of clubs. The
+    campus None counts the clubs from every campus.
+    favourites: The same, counting only the favourite clubs.
+    campus_counts: A dictionary of campus -> [number of clubs, number of
+    favourites]. The campus None counts every club.
+    favourite_ids: The set of id(club) of the clubs counted as favourites.
+    interest_counts: A dictionary of (campus, interests) -> dictionary of
+    category -> [number of clubs, number of favourites], counting only the
+    clubs with at least one of the interests.
+    """
+
+    def __init__(self, store=club_store):
+        """
+        Constructor for the FacetIndex class. The counts are made when they
+        are first needed.
+        """
+        self.store = store
+        self.loads = None
+        self.counts = {}
+        self.favourites = {}
+        self.campus_counts = {}
+        self.favourite_ids = set()
+        self.interest_counts = {}
+        self.lock = threading.Lock()
+        store.subscribe(self.favourite_changed)
+
+    def refresh(self) -> None:
+        """
+        Makes the counts again if the clubs were reloaded since they were
+        made.
+        """
+        self.store.refresh()
+        loads = self.store.loads
+        with self.lock:
+            if loads == self.loads:
+                return
+
+            favourite_ids = {
+                id(club)
+                for club in self.store.clubs
+                if club.get_is_favourited()
+            }
+            counts = {}
+            favourites = {}
+            for key, clubs in self.store.by_category.items():
+                counts[key] = len(clubs)
+                favourites[key] = sum(
+                    id(club) in favourite_ids for club in clubs
+                )
+
+            campus_counts = {None: [0, 0]}
+            for club in self.store.clubs:
+                for campus in (None, club.get_campus()):
+                    totals = campus_counts.setdefault(campus, [0, 0])
+                    totals[0] += 1
+                    totals[1] += id(club) in favourite_ids
+
+            self.counts = counts
+            self.favourites = favourites
+            self.campus_counts = campus_counts
+            self.favourite_ids = favourite_ids
+            self.interest_counts = {}
+            self.loads = loads
+
+    def favourite_changed(self, club) -> None:
+        """
+        Moves a club in or out of the favourite counts, if that was not done
+        already.
+
+        :param club: The Club object that was favourited or unfavourited.
+        """
+        with self.lock:
+            # a club from before the last reload is not counted here
+            if (
+                self.loads != self.store.loads
+                or self.store.by_url.get(club.get_original_url()) is not club
+            ):
+                return
+            is_favourited = club.get_is_favourited()
+            if is_favourited == (id(club) in self.favourite_ids):
+                return
+            if is_favourited:
+                self.favourite_ids.add(id(club))
+                change = 1
+            else:
+                self.favourite_ids.discard(id(club))
+                change = -1
+
+            categories = club.get_categories()
+            for campus in (None, club.get_campus()):
+                self.campus_counts[campus][1] += change
+                for category in categories:
+                    self.favourites[(campus, category)] += change
+            for (campus, interests), known in self.interest_counts.items():
+                if campus not in (None, club.get_campus()):
+                    continue
+                if interests.isdisjoint(categories):
+                    continue
+                for category in categories:
+                    known[category][1] += change
+
+    def count(
+        self, category: str, campus: str = None, favourite: bool = None
+    ) -> int:
+        """
+        Counts the clubs in a category.
+
+        :param category: The category.
+        :param campus: The campus, or None for every campus.
+        :param favourite: True to count only favourites, False to count only
+        the others, None to count both.
+        :return: The number of clubs.
+        """
+        self.refresh()
+        total = self.counts.get((campus, category), 0)
+        favourites = self.favourites.get((campus, category), 0)
+        if favourite is None:
+            return total
+        return favourites if favourite else total - favourites
+
+    def category_counts(
+        self, categories: list, campus: str = None, favourite: bool = None
+    ) -> dict:
+        """
+        Counts the clubs in each of some categories.
+
+        :param categories: The list of categories.
+        :param campus: The campus, or None for every campus.
+        :param favourite: True to count only favourites, False to count only
+        the others, None to count both.
+        :return: A dictionary of category -> number of clubs.
+        """
+        self.refresh()
+        counts = {}
+        for category in categories:
+            total = self.counts.get((campus, category), 0)
+            favourites = self.favourites.get((campus, category), 0)
+            if favourite is None:
+                counts[category] = total
+            else:
+                counts[category] = (
+                    favourites if favourite else total - favourites
+                )
+        return counts
+
+    def counts_with_interests(
+        self, categories: list, campus: str = None, interests: list = None
+    ) -> tuple:
+        """
+        Counts the clubs in each of some categories that also have at least
+        one of the interests, the same clubs find_clubs gives for the
+        category with any_categories=interests.
+
+        :param categories: The list of categories.
+        :param campus: The campus, or None for every campus.
+        :param interests: The list of interests, empty or None for all.
+        :return: A tuple of two dictionaries of category -> number of clubs,
+        one counting every club and one only the favourites.
+        """
+        if not interests:
+            return (
+                self.category_counts(categories, campus),
+                self.category_counts(categories, campus, True),
+            )
+
+        self.refresh()
+        key = (campus, frozenset(interests))
+        with self.lock:
+            known = self.interest_counts.get(key)
+            if known is None:
+                # each club with any of the interests adds to all of its
+                # categories once
+                known = {}
+                seen = set()
+                for interest in key[1]:
+                    for club in self.store.by_category.get(
+                        (campus, interest), []
+                    ):
+                        if id(club) in seen:
+                            continue
+                        seen.add(id(club))
+                        favourite = id(club) in self.favourite_ids
+                        for category in club.get_categories():
+                            totals = known.setdefault(category, [0, 0])
+                            totals[0] += 1
+                            totals[1] += favourite
+                if len(self.interest_counts) >= INTEREST_CACHE_SIZE:
+                    del self.interest_counts[next(iter(self.interest_counts))]
+                self.interest_counts[key] = known
+
+            totals = [known.get(category, (0, 0)) for category in categories]
+            return (
+                {c: total[0] for c, total in zip(categories, totals)},
+                {c: total[1] for c, total in zip(categories, totals)},
+            )
+
+    def campus_count(self, campus: str = None, favourite: bool = None) -> int:
+        """
+        Counts the clubs on a campus.
+
+        :param campus: The campus, or None for every campus.
+        :param favourite: True to count only favourites, False to count only
+        the others, None to count both.
+        :return: The number of clubs.
+        """
+        self.refresh()
+        total, favourites = self.campus_counts.get(campus, (0, 0))
+        if favourite is None:
+            return total
+        return favourites if favourite else total - favourites
+
+
+# The one facet index shared by every view
+facet_index = FacetIndex()
@@ -11,13 +11,15 @@ Final Project
 Purpose: This program lets the user view a list of their favourite clubs.
 
 Date Created: 2024-11-13
-Date Last Modified: 2024-12-05
+Date Last Modified: 2026-10-19
 """
 
 from tkinter import ttk, messagebox
 from Database import *
 from Start_View import *
 from Club_View import ClubView
+from Club_Query import find_clubs
+from Virtual_List import VirtualList
 
 
 class Favourites_View(ttk.Frame):
@@ -35,66 +37,96 @@ class Favourites_View(ttk.Frame):
         super().__init__(parent)
         self.controller = controller
 
+        self.grid_rowconfigure(1, weight=1)  # The list takes the free space
+        self.grid_columnconfigure(0, weight=1)
+
+        # Title
+        title = ttk.Label(self, text="Favourites", style="Title.TLabel")
+        title.grid(row=0, column=0, pady=10)
+
+        # The heart buttons share one style, so it is only configured once
+        favourite_style = ttk.Style()
+        favourite_style.configure("DarkRed.TButton", foreground="#720808")
+
+        # Only the rows on screen are made, and reused as the list scrolls
+        self.club_rows = VirtualList(
+            self, self.make_club_row, self.fill_club_row, row_height=40
+        )
+        self.club_rows.grid(row=1, column=0, padx=5, sticky="nsew")
+
+        # Message if no favourites
+        self.empty_label = ttk.Label(
+            self, text="No favourites yet. Check clubs to find some."
+        )
+        self.empty_label.grid(row=1, column=0, padx=10, sticky="n")
+
         # Display the favourite clubs
         self.display_favourites()
 
+    def make_club_row(self, parent):
+        """
+        Make one row of the favourites list.
+
+        :param parent: The parent widget.
+        :return: The row frame.
+        """
+        row = ttk.Frame(parent, style="TFrame")
+        row.club = None  # The club currently shown in the row
+        row.grid_columnconfigure(0, weight=1)
+
+        row.club_label = ttk.Label(
+            row,
+            wraplength=220,
+            width=23,
+            anchor="w",
+        )
+        row.club_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
+
+        # Button to view club details
+        ttk.Button(
+            row,
+            text="View Club",
+            width=9,
+            command=lambda: self.change_to_Club_View(row.club),
+        ).grid(row=0, column=1)
+
+        # Button to remove from favourites
+        toggle_favourite = ttk.Button(
+            row,
+            text="♥",
+            width=2,
+            style="DarkRed.TButton",
+            command=lambda: self.confirm_and_remove_favourite(row.club),
+        )
+        toggle_favourite.grid(row=0, column=2)
+        return row
+
+    def fill_club_row(self, row, club):
+        """
+        Show a club in a row of the favourites list.
+
+        :param row: The row frame.
+        :param club: The club to show.
+        """
+        row.club = club
+        row.club_label.config(text=club.get_name())
+
     def display_favourites(self):
         """
-        Display the list of favourite clubs.
+        Display the list of favourite clubs. They are the club store's own
+        Club objects, so unfavouriting one updates everything else at once.
         """
-        # Clear the current screen
-        for widget in self.winfo_children():
-            widget.destroy()
+        # The query engine keeps the favourites, the file is not read again
+        favourite_clubs = list(find_clubs(favourite=True))
 
-        # Title
-        title = ttk.Label(self, text="Favourites", style="Title.TLabel")
-        title.grid(row=0, column=0, columnspan=7, pady=10, padx=120)
-
-        # Load and display favourite clubs
-        clubs = load_from_file("clubs.json")
-        clubs = [Club(**club) for club in clubs]
-
-        # Filter favourite clubs
-        favourite_clubs = [club for club in clubs if club.get_is_favourited()]
-
-        # Display each favourite club
-        for i, club in enumerate(favourite_clubs):
-            club_label = ttk.Label(
-                self,
-                text=club.get_name(),
-                wraplength=220,
-                width=23,
-                anchor="w",
-            )
-            club_label.grid(row=1 + i, column=0, padx=10, pady=5, sticky="w")
-
-            # Button to view club details
-            ttk.Button(
-                self,
-                text="View Club",
-                width=9,
-                command=lambda club=club: self.change_to_Club_View(club),
-            ).grid(row=1 + i, column=1)
-
-            # Button to remove from favourites
-            favourite_style = ttk.Style()
-            favourite_style.configure("DarkRed.TButton", foreground="#720808")
-            toggle_favourite = ttk.Button(
-                self,
-                text="♥",
-                width=2,
-                style="DarkRed.TButton",
-                command=lambda club=club: self.confirm_and_remove_favourite(
-                    club
-                ),
-            )
-            toggle_favourite.grid(row=1 + i, column=2)
+        # Display the favourite clubs in one go
+        self.club_rows.set_items(favourite_clubs)
 
         # Display message if no favourites
         if len(favourite_clubs) == 0:
-            ttk.Label(
-                self, text="No favourites yet. Check clubs to find some."
-            ).grid(row=2, column=0, padx=10)
+            self.empty_label.grid()
+        else:
+            self.empty_label.grid_remove()
 
     def refresh_favorite_clubs(self):
         """
@@ -123,6 +155,6 @@ class Favourites_View(ttk.Frame):
 
         :param club: The club to display.
         """
-        club_view = self.controller.frames[ClubView]
+        club_view = self.controller.get_frame(ClubView)
         club_view.display_club(club)
         self.controller.show_frame(ClubView)
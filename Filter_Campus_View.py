@@ -12,7 +12,7 @@ Purpose: This program opens a pop-up window to select the campus for filtering
 clubs.
 
 Date Created: 2024-11-13
-Date Last Modified: 2024-12-05
+Date Last Modified: 2026-10-19
 """
 
 import tkinter as tk
@@ -20,6 +20,9 @@ from tkinter import ttk
 import json
 from Database import *
 from List_View import *
+from Club_Store import club_store
+from Filter_State import filter_state
+from Facet_Index import facet_index
 
 
 class Filter_Campus_View(ttk.Frame):
@@ -63,12 +66,12 @@ class Filter_Campus_View(ttk.Frame):
         )
         description.pack(padx=10, pady=10)
 
-        # Campus selection buttons
+        # Campus selection buttons, with the number of clubs on each
         campuses = ["St George", "UTSC", "UTM"]
         for campus in campuses:
             campus_button = ttk.Button(
                 popup,
-                text=campus,
+                text=f"{campus} ({facet_index.campus_count(campus)} clubs)",
                 command=lambda campus=campus: self.apply_campus(campus, popup),
             )
             campus_button.pack(padx=10, pady=10)
@@ -76,28 +79,24 @@ class Filter_Campus_View(ttk.Frame):
         # Add a "Skip" button
         skip_button = ttk.Button(
             popup,
-            text="No Filters",
+            text=f"No Filters ({facet_index.campus_count()} clubs)",
             command=lambda: self.apply_campus(None, popup),
         )
         skip_button.pack(padx=10, pady=10)
 
     def apply_campus(self, campus, popup):
         """
-        Apply the selected campus filter and update the filters.json file.
+        Apply the selected campus filter.
 
         :param campus: The selected campus.
         :param popup: The pop-up window to close after selection.
         """
         popup.destroy()
 
-        clubs = load_from_file(CLUBS_FILE)
-        clubs = [Club(**club) for club in clubs]
-        all_interests = get_all_categories(clubs)
+        # Every category counts as an interest, from the catalog the club
+        # store made when it loaded the clubs
+        all_interests = club_store.get_catalog()
 
-        # Add the property campus with the campus as a list to the filters.json file
-        filters = {"campus": campus, "interests": all_interests}
-        with open("filters.json", "w") as f:
-            json.dump(filters, f, indent=4)
-
-        # Refresh the list view by closing and reopening the app
-        self.controller.refresh_category()
+        # The category view is subscribed, so it updates itself, and the
+        # filters are saved to filters.json in the background
+        filter_state.update(campus=campus, interests=list(all_interests))
@@ -0,0 +1,115 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program keeps the campus and interest filters in memory. The
+views read them from here instead of from filters.json, and can subscribe to
+be told when they change. Changes are saved to filters.json in the
+background.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import copy
+import os
+import threading
+from Database import FILTERS_FILE, load_from_file, save_later
+
+# the filters when nothing is chosen
+DEFAULT_FILTERS = {"campus": None, "interests": []}
+
+
+class FilterState:
+    """
+    The FilterState class.
+
+    Attributes:
+    filename: The name of the filters file.
+    filters: The dictionary of filters, with campus and interests.
+    version: Goes up by one every time the filters change.
+    subscribers: The functions called after the filters change.
+    """
+
+    def __init__(self, filename: str = FILTERS_FILE):
+        """
+        Constructor for the FilterState class. The file is read when the
+        filters are first needed.
+        """
+        self.filename = filename
+        self.filters = None
+        self.version = 0
+        self.subscribers = []
+        self.lock = threading.Lock()
+
+    def load(self) -> None:
+        """
+        Reads the filters from the file, or saves the default filters if
+        there is no file yet. Hold lock when calling this.
+        """
+        if os.path.exists(self.filename):
+            self.filters = {**DEFAULT_FILTERS, **load_from_file(self.filename)}
+        else:
+            self.filters = copy.deepcopy(DEFAULT_FILTERS)
+            save_later(self.filename, copy.deepcopy(self.filters), "pretty")
+
+    def get(self) -> dict:
+        """
+        Gets the filters.
+
+        :return: A copy of the dictionary of filters.
+        """
+        with self.lock:
+            if self.filters is None:
+                self.load()
+            return copy.deepcopy(self.filters)
+
+    def update(self, **changes) -> None:
+        """
+        Changes some of the filters, saves them in the background and tells
+        the subscribers. Nothing happens if nothing changed.
+
+        :param changes: The new values, e.g. campus="UTM" or interests=[].
+        """
+        with self.lock:
+            if self.filters is None:
+                self.load()
+            filters = {**self.filters, **copy.deepcopy(changes)}
+            if filters == self.filters:
+                return
+            self.filters = filters
+            self.version += 1
+            save_later(self.filename, copy.deepcopy(filters), "pretty")
+            subscribers = list(self.subscribers)
+
+        for callback in subscribers:
+            callback(copy.deepcopy(filters))
+
+    def subscribe(self, callback) -> None:
+        """
+        Calls a function every time the filters change.
+
+        :param callback: A function that takes the new filters dictionary.
+        """
+        with self.lock:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        """
+        Stops calling a function when the filters change.
+
+        :param callback: The function given to subscribe.
+        """
+        with self.lock:
+            if callback in self.subscribers:
+                self.subscribers.remove(callback)
+
+
+# The one filter state shared by every view
+filter_state = FilterState()
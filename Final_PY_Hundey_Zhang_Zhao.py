@@ -13,7 +13,7 @@ University of Toronto, filter the clubs by campus and interests, view club
 details, view club events, and favourite clubs.
 
 Date Created: 2024-11-13
-Date Last Modified: 2024-12-05
+Date Last Modified: 2026-10-19
 """
 
 import tkinter as tk
@@ -75,21 +75,9 @@ class MainApp(tk.Tk):
         )
 
         # Frames dictionary to store the references for each page
+        # Each frame is only made the first time it is needed
         self.frames = {}
 
-        # Initialize all the frames (views)
-        for Page in (
-            Start_View,
-            CategoryView,
-            ClubEventCalendar,
-            Favourites_View,
-            ClubListView,
-            ClubView,
-        ):
-            frame = Page(self.container, self)
-            self.frames[Page] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
-
         # Show the initial frame (you can set it to Start_View if desired)
         self.show_frame(Start_View)
 
@@ -141,27 +129,35 @@ class MainApp(tk.Tk):
         )
         favourites_button.pack(side="left", padx=5, pady=5)
 
+    def get_frame(self, page):
+        """
+        Get the frame for a page, making it if it was not made yet.
+
+        :param page: The class of the frame.
+        :return: The frame.
+        """
+        if page not in self.frames:
+            frame = page(self.container, self)
+            self.frames[page] = frame
+            frame.grid(row=0, column=0, sticky="nsew")
+        return self.frames[page]
+
     def show_frame(self, page):
         """
         Bring the specified frame to the front.
 
         :param page: The frame to show.
         """
-        frame = self.frames[page]
+        frame = self.get_frame(page)
         frame.tkraise()
 
         # Refresh favourites page if it is being shown
         if page == Favourites_View:
             frame.refresh_favorite_clubs()
 
-    def refresh_category(self):
-        """
-        Refresh the CategoryView frame.
-        """
-        self.frames[CategoryView].destroy()
-        frame = CategoryView(self.container, self)
-        self.frames[CategoryView] = frame
-        frame.grid(row=0, column=0, sticky="nsew")
+        # Update the club counts, in case favourites changed
+        if page == CategoryView:
+            frame.refresh_categories()
 
 
 if __name__ == "__main__":
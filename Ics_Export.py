@@ -0,0 +1,279 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program exports events as an iCalendar (.ics) file, so they can
+be added to Google Calendar, Outlook or Apple Calendar. The events can be
+limited to the clubs on a campus, in a category or favourited, and to a range
+of dates.
+
+The file is made one event at a time with generators and handed out in
+chunks, so a big export never has to be in memory all at once. Each export is
+also saved in ICS_CACHE_FOLDER while it is made, and the next export with the
+same filters just reads that file. The saved exports are for one version of
+the data, and are deleted when the clubs or events change.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import bisect
+import datetime
+import hashlib
+import os
+from Database import EVENTS_FILE, atomic_write, make_event_id
+from Club_Store import club_store
+from Club_Query import find_clubs
+from Snapshot import refresh_snapshot, source_digest
+
+# name for the folder of saved exports
+ICS_CACHE_FOLDER = "ics_cache"
+
+# about how many bytes are handed out at a time
+CHUNK_BYTES = 64 * 1024
+
+# lines of an iCalendar file can be at most this many bytes long
+LINE_BYTES = 75
+
+PRODUCT_ID = "-//INF452 Final Project//UofT Club Finder//EN"
+
+
+def escape_text(text: str) -> str:
+    """
+    Escapes text for an iCalendar value.
+
+    :param text: The text.
+    :return: The text with backslashes, commas, semicolons and new lines
+    escaped.
+    """
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """
+    Splits a long line into lines of at most LINE_BYTES bytes, each one
+    after the first starting with a space, without splitting a character.
+
+    :param line: The line, without the line ending.
+    :return: The folded line, with CRLF line endings.
+    """
+    encoded = line.encode("utf-8")
+    if len(encoded) <= LINE_BYTES:
+        return line + "\r\n"
+
+    parts = []
+    start = 0
+    limit = LINE_BYTES
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # step back to the start of a UTF-8 character
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode("utf-8"))
+        start = end
+        limit = LINE_BYTES - 1  # the space at the start takes one byte
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def export_version() -> str:
+    """
+    Gets the version of the data the exports are made from. It changes when
+    the clubs (including favourites) or events change.
+
+    :return: The version as text.
+    """
+    return f"{club_store.get_version()}-{source_digest().hex()}"
+
+
+def find_events(
+    campus: str = None,
+    all_categories: list = None,
+    keywords: list = None,
+    favourite: bool = None,
+    events_from: datetime.date = None,
+    events_to: datetime.date = None,
+):
+    """
+    Goes through the events that match the filters, by date.
+
+    :param campus: Only events of clubs on this campus.
+    :param all_categories: Only events of clubs with all these categories.
+    :param keywords: Only events of clubs with one of these keywords.
+    :param favourite: True for only events of favourite clubs, False for
+    only the others.
+    :param events_from: The first date, or None.
+    :param events_to: The last date, or None.
+    :return: An iterator of (date, event dictionary) tuples.
+    """
+    # the events of the matching clubs, if the clubs are filtered at all
+    allowed = None
+    if campus or all_categories or keywords or favourite is not None:
+        allowed = {
+            event_id
+            for club in find_clubs(
+                campus=campus,
+                all_categories=all_categories,
+                keywords=keywords,
+                favourite=favourite,
+            )
+            for event_id in club.get_event_ids()
+        }
+
+    by_date = refresh_snapshot()["events_by_date"]
+    ordinals = sorted(by_date)
+    start = (
+        bisect.bisect_left(ordinals, events_from.toordinal())
+        if events_from
+        else 0
+    )
+    end = (
+        bisect.bisect_right(ordinals, events_to.toordinal())
+        if events_to
+        else len(ordinals)
+    )
+
+    for ordinal in ordinals[start:end]:
+        date = datetime.date.fromordinal(ordinal)
+        for event in by_date[ordinal]:
+            if (
+                allowed is None
+                or (event.get("event_id") or make_event_id(event)) in allowed
+            ):
+                yield date, event
+
+
+def ics_lines(events, stamp: datetime.datetime):
+    """
+    Makes the lines of the iCalendar file, one event at a time.
+
+    :param events: An iterator of (date, event dictionary) tuples.
+    :param stamp: When the data was last changed, for DTSTAMP.
+    :return: An iterator of lines, each ending with CRLF.
+    """
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield f"PRODID:{PRODUCT_ID}\r\n"
+    yield "CALSCALE:GREGORIAN\r\n"
+    yield "X-WR-CALNAME:UofT Club Events\r\n"
+
+    dtstamp = stamp.strftime("%Y%m%dT%H%M%SZ")
+    for date, event in events:
+        event_id = event.get("event_id") or make_event_id(event)
+        description = event.get("description", "")
+        if event.get("club"):
+            description = f"Hosted by {event['club']}\n\n{description}"
+
+        yield "BEGIN:VEVENT\r\n"
+        yield fold_line(f"UID:{event_id}@sop.utoronto.ca")
+        yield f"DTSTAMP:{dtstamp}\r\n"
+        # the events only have a day, so they are all-day events
+        yield f"DTSTART;VALUE=DATE:{date.strftime('%Y%m%d')}\r\n"
+        end = date + datetime.timedelta(days=1)
+        yield f"DTEND;VALUE=DATE:{end.strftime('%Y%m%d')}\r\n"
+        yield fold_line(f"SUMMARY:{escape_text(event.get('title', ''))}")
+        yield fold_line(f"DESCRIPTION:{escape_text(description)}")
+        if event.get("original_url"):
+            yield fold_line(f"URL:{event['original_url']}")
+        yield "END:VEVENT\r\n"
+
+    yield "END:VCALENDAR\r\n"
+
+
+def in_chunks(lines):
+    """
+    Groups lines into chunks of about CHUNK_BYTES bytes.
+
+    :param lines: An iterator of lines.
+    :return: An iterator of UTF-8 bytes.
+    """
+    chunk = []
+    size = 0
+    for line in lines:
+        encoded = line.encode("utf-8")
+        chunk.append(encoded)
+        size += len(encoded)
+        if size >= CHUNK_BYTES:
+            yield b"".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield b"".join(chunk)
+
+
+def clear_old_exports(version_key: str, folder: str = ICS_CACHE_FOLDER):
+    """
+    Deletes the saved exports of other versions of the data.
+
+    :param version_key: The start of the file names of this version.
+    :param folder: The folder of saved exports.
+    """
+    try:
+        names = os.listdir(folder)
+    except FileNotFoundError:
+        return
+    for name in names:
+        if name.endswith(".ics") and not name.startswith(version_key):
+            try:
+                os.remove(os.path.join(folder, name))
+            except FileNotFoundError:
+                pass  # another app deleted it first
+
+
+def export_ics(folder: str = ICS_CACHE_FOLDER, **filters):
+    """
+    Exports the events that match the filters as an iCalendar file, in
+    chunks. The export is read from the saved file if there is one for
+    these filters and this version of the data, and saved otherwise.
+
+    :param folder: The folder of saved exports.
+    :param filters: The filters, see find_events.
+    :return: An iterator of bytes.
+    """
+    version = export_version()
+    version_key = hashlib.blake2b(version.encode(), digest_size=8).hexdigest()
+    # filters left out and filters given as None are the same export
+    given = sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in filters.items()
+        if value is not None and value != []
+    )
+    filters_key = hashlib.blake2b(
+        repr(given).encode(), digest_size=8
+    ).hexdigest()
+    filename = os.path.join(folder, f"{version_key}-{filters_key}.ics")
+
+    try:
+        with open(filename, "rb") as f:
+            while chunk := f.read(CHUNK_BYTES):
+                yield chunk
+        return
+    except FileNotFoundError:
+        pass
+
+    clear_old_exports(version_key, folder)
+    os.makedirs(folder, exist_ok=True)
+    try:
+        stamp = datetime.datetime.fromtimestamp(
+            os.stat(EVENTS_FILE).st_mtime, datetime.timezone.utc
+        )
+    except FileNotFoundError:
+        stamp = datetime.datetime.now(datetime.timezone.utc)
+
+    # the file only gets its name once the whole export was written, so a
+    # stopped export is never read back
+    with atomic_write(filename) as f:
+        for chunk in in_chunks(ics_lines(find_events(**filters), stamp)):
+            f.write(chunk)
+            yield chunk
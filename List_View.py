@@ -11,7 +11,7 @@ Final Project
 Purpose: This program allows the user to view a list of clubs.
 
 Date Created: 2024-11-13
-Date Last Modified: 2024-12-05
+Date Last Modified: 2026-10-19
 """
 
 from tkinter import *
@@ -19,32 +19,40 @@ import json
 from Database import *
 from tkinter import ttk
 from Filter_Campus_View import *
+from Club_Store import club_store
+from Query_Cache import query_cache
+from Filter_State import filter_state
+from Facet_Index import facet_index
+from Club_Query import find_clubs
+from Club_Ranking import rank_clubs
+from Club_Search import search_clubs
+from Search_Box import SearchBox
+from Type_Ahead import suggest_clubs
 
-
-# Load data and receive all club categories
-load_clubs = load_from_file("clubs.json")
-# Convert dictionaries to Club and Event objects
-all_clubs = [Club(**club) for club in load_clubs]
+# The most clubs shown for a search
+SEARCH_RESULTS = 50
 
 
 #### adjusted to work with filters ######
-# Load filters from the filters.json file
+# Load filters from the filter state
 def load_filters():
     """
-    Load filters from the filters.json file.
+    Load the filters. They are kept in memory by the filter state, which
+    saves them to filters.json.
 
     :return: A dictionary containing the filters.
     """
-    if os.path.exists("filters.json"):
-        with open("filters.json", "r") as f:
-            return json.load(f)
-    else:
-        with open("filters.json", "w") as f:
-            json.dump({"campus": None, "interests": []}, f)
-    return {"campus": None, "interests": []}
+    return filter_state.get()
 
 
-filters = load_filters()
+def filter_key(filters):
+    """
+    Make a key for the query cache from the filters.
+
+    :param filters: The filters.
+    :return: A hashable tuple of the campus and the interests.
+    """
+    return (filters["campus"], frozenset(filters["interests"] or []))
 
 
 # Filter clubs based on campus and interests
@@ -75,10 +83,6 @@ def filter_clubs(clubs, filters):
     return filtered_clubs
 
 
-filtered_clubs = filter_clubs(all_clubs, filters)
-categories = get_all_categories(filtered_clubs)
-
-
 # The main page
 class CategoryView(ttk.Frame):
     """
@@ -98,9 +102,9 @@ class CategoryView(ttk.Frame):
         self.configure(style="TFrame")  # Set the background to white
 
         # Variables
-        buttons_per_row = 2
-        button_width = 14  # Width of each button
-        padding = 10  # Padding between buttons
+        self.buttons_per_row = 2
+        self.button_width = 14  # Width of each button
+        self.padding = 10  # Padding between buttons
 
         # Configure grid layout for the main frame
         self.grid_rowconfigure(0, weight=0)  # Title
@@ -124,12 +128,25 @@ class CategoryView(ttk.Frame):
             row=1, column=1, columnspan=2, pady=20, padx=20
         )
 
+        # Search box for club names, with suggestions while typing, Enter
+        # lists the best matches for the words
+        club_search = SearchBox(
+            self,
+            suggest_clubs,
+            self.open_club,
+            label="Find a club:",
+            submit=self.show_search_results,
+            width=20,
+        )
+        club_search.grid(row=1, column=0, padx=20, sticky="nw")
+
         # Scrollable frame setup using Canvas
         canvas = Canvas(self, bg="white")
         canvas.grid(row=2, column=1, sticky="ns")
 
         # Make a scrollable frame
-        scrollable_frame = ttk.Frame(canvas, style="TFrame")
+        self.scrollable_frame = ttk.Frame(canvas, style="TFrame")
+        scrollable_frame = self.scrollable_frame
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
 
         # Add a scrollbar
@@ -144,24 +161,80 @@ class CategoryView(ttk.Frame):
         )
 
         # Make scrollable frame columns distribute space evenly
-        for i in range(buttons_per_row):
+        for i in range(self.buttons_per_row):
             scrollable_frame.grid_columnconfigure(i, weight=0)
 
-        # Make dynamic buttons for each category
+        # Buttons for each category, and where they are on the grid
+        self.category_buttons = {}
+        self.button_positions = {}
+
+        # The buttons are made by show_frame, each time the view is shown
+
+        # Update the buttons whenever the filters change
+        filter_state.subscribe(lambda filters: self.refresh_categories())
+
+    def refresh_categories(self):
+        """
+        Update the category buttons and their club counts for the current
+        filters. Only the buttons for categories that were added or removed
+        are made or destroyed, and only buttons that moved are placed again.
+        """
+        filters = load_filters()
+        categories = query_cache.get(
+            ("categories", filter_key(filters)),
+            club_store.get_version(),
+            lambda: club_store.get_categories(
+                filters["campus"], filters["interests"]
+            ),
+        )
+
+        # The counts come from the facet index, which also counts only the
+        # clubs that match the interests
+        counts, favourites = facet_index.counts_with_interests(
+            categories, filters["campus"], filters["interests"]
+        )
+
+        # Remove the buttons for categories that are gone
+        for category in set(self.category_buttons) - set(categories):
+            self.category_buttons.pop(category).destroy()
+            self.button_positions.pop(category)
+
         for i, category in enumerate(categories):
-            row = i // buttons_per_row  # Determine the row number
-            column = i % buttons_per_row  # Determine the column number
-            button = Button(
-                scrollable_frame,
-                text=category,
-                bg="lightblue",
-                fg="black",
-                width=button_width,
-                height=5,
-                wraplength=120,
-                command=lambda c=category: self.change_to_ClubListView(c),
-            )
-            button.grid(row=row, column=column, padx=padding, pady=padding)
+            row = i // self.buttons_per_row  # Determine the row number
+            column = i % self.buttons_per_row  # Determine the column number
+
+            # Show how many clubs are in the category, and how many of them
+            # are favourites
+            text = f"{category}\n({counts[category]} clubs"
+            if favourites[category]:
+                text += f", {favourites[category]} ♥"
+            text += ")"
+
+            # Add buttons for new categories
+            if category not in self.category_buttons:
+                self.category_buttons[category] = Button(
+                    self.scrollable_frame,
+                    text=text,
+                    bg="lightblue",
+                    fg="black",
+                    width=self.button_width,
+                    height=5,
+                    wraplength=120,
+                    command=lambda c=category: self.change_to_ClubListView(c),
+                )
+
+            elif self.category_buttons[category].cget("text") != text:
+                self.category_buttons[category].config(text=text)
+
+            # Only place the button again if it moved
+            if self.button_positions.get(category) != (row, column):
+                self.category_buttons[category].grid(
+                    row=row,
+                    column=column,
+                    padx=self.padding,
+                    pady=self.padding,
+                )
+                self.button_positions[category] = (row, column)
 
     def change_to_ClubListView(self, category):
         """
@@ -174,11 +247,41 @@ class CategoryView(ttk.Frame):
         )  # Lazy way of importing, but ensures no circle error
 
         if self.controller:
-            club_list_view = self.controller.frames[ClubListView]
+            club_list_view = self.controller.get_frame(ClubListView)
             clubs_in_category = update_club_list(category)
             club_list_view.club_list(category, clubs_in_category)
             self.controller.show_frame(ClubListView)
 
+    def open_club(self, club_id):
+        """
+        Open the detailed view for a club picked in the search box.
+
+        :param club_id: The original url of the club.
+        """
+        from Club_View import (
+            ClubListView,
+        )  # Lazy way of importing, but ensures no circle error
+
+        self.controller.get_frame(ClubListView).open_club_view(club_id)
+
+    def show_search_results(self, text):
+        """
+        Show the clubs that best match the words typed in the search box.
+
+        :param text: The words typed in the search box.
+        """
+        from Club_View import (
+            ClubListView,
+        )  # Lazy way of importing, but ensures no circle error
+
+        clubs = [
+            (club.get_original_url(), club.get_name())
+            for club in search_clubs(text, SEARCH_RESULTS)
+        ]
+        club_list_view = self.controller.get_frame(ClubListView)
+        club_list_view.club_list(text, clubs, title=f'Clubs matching "{text}"')
+        self.controller.show_frame(ClubListView)
+
     def filter_by_campus(self, controller):
         """
         Open the campus filter pop-up.
@@ -194,16 +297,25 @@ def update_club_list(category):
     Add the clubs to the selected category.
 
     :param category: The selected category.
-    :return: A list of club names in the selected category.
+    :return: A list of (original url, name) tuples of the clubs in the
+    selected category, best match for the favourites first.
     """
     filters = load_filters()
-    filtered_clubs = filter_clubs(all_clubs, filters)
-    categories = get_all_categories(filtered_clubs)
-
-    # Filter clubs that belong to the selected category
-    filtered_club_names = [
-        club.get_name()
-        for club in filtered_clubs
-        if category in club.get_categories()
-    ]
-    return filtered_club_names
+
+    # Filter clubs that belong to the selected category, unless the same
+    # category was already filtered with these filters
+    clubs = query_cache.get(
+        ("clubs", category, filter_key(filters)),
+        club_store.get_version(),
+        lambda: [
+            (club.get_original_url(), club.get_name())
+            for club in find_clubs(
+                campus=filters["campus"],
+                all_categories=[category],
+                any_categories=filters["interests"],
+            )
+        ],
+    )
+
+    # the clubs most like the favourites go first
+    return rank_clubs(clubs)
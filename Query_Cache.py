@@ -0,0 +1,108 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program remembers the results of the filter and category
+queries the views make, so browsing back and forth between categories does
+not filter the clubs again. A result is kept for the filters it was made
+with and is thrown away once the clubs or favourites change.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class QueryCache:
+    """
+    The QueryCache class. A least recently used cache of query results.
+
+    Attributes:
+    capacity: The most results to keep.
+    version: The data version the results were made from.
+    hits: How many queries were answered from the cache.
+    misses: How many queries had to be worked out.
+    evictions: How many results were dropped to make room.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Constructor for the QueryCache class.
+        """
+        self.capacity = capacity
+        self.version = None
+        self.results = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, version, compute):
+        """
+        Gets the result of a query, working it out only if it is not kept.
+        All the results are dropped when the data version changes.
+
+        :param key: The query and the filters it uses, e.g.
+        ("clubs", category, campus, interests). It must be hashable.
+        :param version: The version of the data the query runs on.
+        :param compute: A function with no arguments that works out the
+        result.
+        :return: The result. Do not change it, since it is shared.
+        """
+        with self.lock:
+            if version != self.version:
+                self.results.clear()
+                self.version = version
+            elif key in self.results:
+                self.hits += 1
+                self.results.move_to_end(key)
+                return self.results[key]
+            self.misses += 1
+
+        # worked out without the lock, so a slow query does not block others
+        result = compute()
+
+        with self.lock:
+            if version == self.version:
+                self.results[key] = result
+                self.results.move_to_end(key)
+                while len(self.results) > self.capacity:
+                    self.results.popitem(last=False)
+                    self.evictions += 1
+        return result
+
+    def invalidate(self) -> None:
+        """
+        Drops every result, e.g. after data changed without a new version.
+        """
+        with self.lock:
+            self.results.clear()
+
+    def stats(self) -> dict:
+        """
+        Gets how well the cache is doing.
+
+        :return: A dictionary with the hits, misses, evictions, size and
+        hit_rate (between 0 and 1).
+        """
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.results),
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# The one cache shared by every view
+query_cache = QueryCache()
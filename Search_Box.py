@@ -0,0 +1,139 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program is a search box that shows suggestions under it while
+the user types. It waits until the user stops typing for a moment before
+looking for suggestions, so a fast typist does not start a search on every
+key.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+from tkinter import *
+from tkinter import ttk
+
+# how long to wait after the last key before searching
+DEBOUNCE_MS = 150
+
+
+class SearchBox(ttk.Frame):
+    """
+    A class to represent a search box with suggestions.
+    """
+
+    def __init__(
+        self, parent, suggest, choose, label="Search:", submit=None, **kwargs
+    ):
+        """
+        Initialize the SearchBox frame.
+
+        :param parent: The parent widget.
+        :param suggest: A function that takes the typed text and returns a
+        list of (label, value) tuples to suggest.
+        :param choose: A function called with the value of the suggestion
+        that was clicked (or the first one when Enter is pressed).
+        :param label: The text in front of the box.
+        :param submit: A function called with the text when Enter is
+        pressed, instead of choosing the first suggestion.
+        :param kwargs: Extra options for the entry, e.g. width.
+        """
+        ttk.Frame.__init__(self, parent, style="TFrame")
+        self.suggest = suggest
+        self.choose = choose
+        self.submit = submit
+        self.values = []  # the values of the suggestions shown
+        self.pending = None  # the search waiting for typing to stop
+
+        ttk.Label(self, text=label, style="TLabel").grid(
+            row=0, column=0, padx=2
+        )
+
+        self.entry = ttk.Entry(self, **kwargs)
+        self.entry.grid(row=0, column=1, padx=2, sticky="ew")
+        self.entry.bind("<KeyRelease>", self.on_key)
+        self.entry.bind("<Return>", lambda e: self.submit_text())
+        self.entry.bind("<Escape>", lambda e: self.hide_suggestions())
+
+        # Only shown while there are suggestions
+        self.suggestions = Listbox(self, height=0, activestyle="none")
+        self.suggestions.bind(
+            "<ButtonRelease-1>",
+            lambda e: self.choose_suggestion(self.suggestions.nearest(e.y)),
+        )
+
+    def on_key(self, event):
+        """
+        Wait for the user to stop typing, then search.
+
+        :param event: The event that triggered the method.
+        """
+        # Enter and Escape are handled by their own bindings
+        if event.keysym in ("Return", "Escape"):
+            return
+        if self.pending is not None:
+            self.after_cancel(self.pending)
+        self.pending = self.after(DEBOUNCE_MS, self.show_suggestions)
+
+    def show_suggestions(self):
+        """
+        Search for the text in the box and show the suggestions.
+        """
+        self.pending = None
+        text = self.entry.get().strip()
+        results = self.suggest(text) if text else []
+
+        self.values = [value for label, value in results]
+        self.suggestions.delete(0, END)
+        for label, value in results:
+            self.suggestions.insert(END, label)
+
+        if results:
+            self.suggestions.config(height=len(results))
+            self.suggestions.grid(row=1, column=1, padx=2, sticky="ew")
+        else:
+            self.hide_suggestions()
+
+    def hide_suggestions(self):
+        """
+        Hide the suggestions.
+        """
+        self.suggestions.grid_remove()
+
+    def submit_text(self):
+        """
+        Search for the whole text when Enter is pressed, or use the first
+        suggestion if there is nothing to submit to.
+        """
+        if self.submit is None:
+            self.choose_suggestion(0)
+            return
+        if self.pending is not None:
+            self.after_cancel(self.pending)
+            self.pending = None
+        text = self.entry.get().strip()
+        if text:
+            self.hide_suggestions()
+            self.submit(text)
+
+    def choose_suggestion(self, index):
+        """
+        Use one of the suggestions.
+
+        :param index: The position of the suggestion in the list.
+        """
+        # Search now if the user pressed Enter before the wait was over
+        if self.pending is not None:
+            self.after_cancel(self.pending)
+            self.show_suggestions()
+        if 0 <= index < len(self.values):
+            value = self.values[index]
+            self.hide_suggestions()
+            self.choose(value)
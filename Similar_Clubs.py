@@ -0,0 +1,499 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program finds the clubs most like each club, from the words in
+their descriptions and their categories. Every club is turned into a TF-IDF
+vector (words that are rare across the clubs count more), with the words
+hashed into a fixed number of columns so the vectors stay small. Clubs are
+alike when their vectors point the same way (cosine similarity).
+
+The similar clubs of every club are worked out with NumPy when the data is
+refreshed and saved to SIMILAR_FILE, so showing them is just reading one row.
+Comparing every club to every other club takes too long for a lot of clubs,
+so past EXACT_LIMIT clubs only the clubs that land near each other after
+sorting by a few random projections (locality sensitive hashing) are compared.
+If the file is missing or stale it is worked out again in the background, and
+no similar clubs are shown until it is ready.
+
+NumPy does not have to be installed, without it no similar clubs are shown.
+It is only imported when it is first used, so starting the app does not wait
+for it.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import hashlib
+import struct
+import threading
+import zlib
+from Database import atomic_write, optional_module
+from Club_Search import tokenize
+from Club_Store import club_store
+from Snapshot import descriptions_digest, load_descriptions
+
+# name for the file
+SIMILAR_FILE = "similar.bin"
+
+# how many similar clubs are kept for each club
+NEIGHBOURS = 5
+
+# how many columns the words are hashed into
+DIMENSIONS = 256
+
+# how much a category counts compared to one word of the description
+CATEGORY_WEIGHT = 3
+
+# up to this many clubs, every club is compared to every other one
+EXACT_LIMIT = 20000
+
+# how many clubs are compared to all the others at once
+BLOCK = 1024
+
+# past EXACT_LIMIT: how many random projections the clubs are sorted by,
+# the bits of each, and how many clubs on each side are compared
+TABLES = 8
+BITS = 16
+WINDOW = 8
+
+# change this when the way the vectors are made changes
+SIMILAR_VERSION = 1
+
+# magic, version, clubs digest, number of clubs, similar clubs per club
+# then the position of each similar club, -1 when there are not enough
+MAGIC = b"UCFSIML\0"
+HEADER = struct.Struct("<8sI16sII")
+
+
+def clubs_digest(urls: list, categories: list, text_digest: bytes) -> bytes:
+    """
+    Makes a fingerprint of everything the similar clubs depend on, so a
+    stale file can be found. Favourites are left out, they do not change
+    which clubs are alike.
+
+    :param urls: The original url of each club.
+    :param categories: The list of categories of each club.
+    :param text_digest: The descriptions_digest of the descriptions, which
+    the descriptions file has without decoding them.
+    :return: The fingerprint as 16 bytes.
+    """
+    digest = hashlib.blake2b(text_digest, digest_size=16)
+    digest.update(f"{SIMILAR_VERSION}:{NEIGHBOURS}:{DIMENSIONS}".encode())
+    for url, club_categories in zip(urls, categories):
+        digest.update("\0".join([url, "|".join(club_categories), ""]).encode())
+    return digest.digest()
+
+
+def embed_clubs(categories: list, descriptions: list):
+    """
+    Makes the TF-IDF vector of every club. Each word goes in the column its
+    hash picks, with a sign from the hash too, so two words sharing a
+    column mostly cancel out instead of adding up.
+
+    :param categories: The list of categories of each club.
+    :param descriptions: The description of each club.
+    :return: A NumPy array with one row of length 1 per club.
+    """
+    numpy = optional_module("numpy")
+    # the ids of the words, and for each club the counts of its word ids
+    ids = {}
+    rows = []
+    for club_categories, description in zip(categories, descriptions):
+        counts = {}
+        for word in tokenize(description):
+            number = ids.setdefault(word, len(ids))
+            counts[number] = counts.get(number, 0) + 1
+        for category in club_categories:
+            number = ids.setdefault("category:" + category.lower(), len(ids))
+            counts[number] = counts.get(number, 0) + CATEGORY_WEIGHT
+        rows.append(counts)
+
+    total = len(rows)
+    sizes = [len(counts) for counts in rows]
+    club = numpy.repeat(numpy.arange(total), sizes)
+    word = numpy.fromiter(
+        (number for counts in rows for number in counts),
+        dtype=numpy.int64,
+        count=len(club),
+    )
+    count = numpy.fromiter(
+        (value for counts in rows for value in counts.values()),
+        dtype=numpy.float32,
+        count=len(club),
+    )
+
+    # how many clubs have each word, then how rare it is
+    clubs_with = numpy.bincount(word, minlength=len(ids))
+    idf = numpy.log((1 + total) / (1 + clubs_with)).astype(numpy.float32) + 1
+
+    hashes = numpy.array(
+        [zlib.crc32(text.encode()) for text in ids], dtype=numpy.uint32
+    )
+    column = (hashes % DIMENSIONS).astype(numpy.int64)
+    sign = numpy.where(hashes >> 31, -1.0, 1.0).astype(numpy.float32)
+
+    vectors = numpy.zeros((total, DIMENSIONS), dtype=numpy.float32)
+    numpy.add.at(
+        vectors,
+        (club, column[word]),
+        (1 + numpy.log(count)) * idf[word] * sign[word],
+    )
+    lengths = numpy.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= numpy.maximum(lengths, 1e-9)
+    return vectors
+
+
+def nearest_exact(vectors, k: int = NEIGHBOURS):
+    """
+    Finds the k most similar clubs of every club by comparing every club to
+    every other one, BLOCK clubs at a time so the scores fit in memory.
+
+    :param vectors: The club vectors from embed_clubs.
+    :param k: How many similar clubs to find.
+    :return: A NumPy array with the positions of the similar clubs of each
+    club, most similar first, -1 when there are fewer than k other clubs.
+    """
+    numpy = optional_module("numpy")
+    total = len(vectors)
+    found = numpy.full((total, k), -1, dtype=numpy.int32)
+    k = min(k, total - 1)
+    if k <= 0:
+        return found
+
+    for start in range(0, total, BLOCK):
+        scores = vectors[start : start + BLOCK] @ vectors.T
+        size = len(scores)
+        # a club is not similar to itself
+        scores[numpy.arange(size), numpy.arange(start, start + size)] = (
+            -numpy.inf
+        )
+
+        # only the best k of each row are sorted
+        best = numpy.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = numpy.argsort(
+            -numpy.take_along_axis(scores, best, axis=1), axis=1
+        )
+        found[start : start + size, :k] = numpy.take_along_axis(
+            best, order, axis=1
+        )
+    return found
+
+
+def nearest_hashed(vectors, k: int = NEIGHBOURS, seed: int = 0):
+    """
+    Finds about the k most similar clubs of every club without comparing
+    every pair. The clubs are sorted by which side of BITS random planes
+    they are on, which puts similar clubs near each other, and each club is
+    compared to the WINDOW clubs on each side. This is done TABLES times
+    with different planes, keeping the best k found for each club.
+
+    :param vectors: The club vectors from embed_clubs.
+    :param k: How many similar clubs to find.
+    :param seed: The seed for the random planes, so a rebuild gives the
+    same result.
+    :return: A NumPy array like the one from nearest_exact.
+    """
+    total, dimensions = vectors.shape
+    numpy = optional_module("numpy")
+    random = numpy.random.default_rng(seed)
+    scores = numpy.full((total, k), -numpy.inf, dtype=numpy.float32)
+    found = numpy.full((total, k), -1, dtype=numpy.int64)
+    powers = 1 << numpy.arange(BITS)
+
+    for _ in range(TABLES):
+        planes = random.standard_normal((dimensions, BITS))
+        codes = ((vectors @ planes.astype(numpy.float32)) > 0) @ powers
+        order = numpy.argsort(codes, kind="stable")
+        in_order = vectors[order]
+
+        for offset in range(1, WINDOW + 1):
+            similarity = numpy.einsum(
+                "ij,ij->i", in_order[:-offset], in_order[offset:]
+            )
+            # each pair is a candidate for both clubs
+            for club, other in (
+                (order[:-offset], order[offset:]),
+                (order[offset:], order[:-offset]),
+            ):
+                worst = scores[club].argmin(axis=1)
+                better = (similarity > scores[club, worst]) & ~(
+                    found[club] == other[:, None]
+                ).any(axis=1)
+                club, worst = club[better], worst[better]
+                scores[club, worst] = similarity[better]
+                found[club, worst] = other[better]
+
+    order = numpy.argsort(-scores, axis=1)
+    return numpy.take_along_axis(found, order, axis=1).astype(numpy.int32)
+
+
+def find_similar(vectors):
+    """
+    Finds the similar clubs of every club, comparing every pair up to
+    EXACT_LIMIT clubs.
+
+    :param vectors: The club vectors from embed_clubs.
+    :return: A NumPy array like the one from nearest_exact.
+    """
+    if len(vectors) <= EXACT_LIMIT:
+        return nearest_exact(vectors)
+    return nearest_hashed(vectors)
+
+
+def write_similar(neighbours, digest: bytes, filename: str = SIMILAR_FILE):
+    """
+    Writes the similar clubs of every club.
+
+    :param neighbours: The NumPy array from nearest_exact or nearest_hashed.
+    :param digest: The clubs_digest of the clubs.
+    :param filename: The name of the file.
+    """
+    total, k = neighbours.shape
+    with atomic_write(filename) as f:
+        f.write(HEADER.pack(MAGIC, SIMILAR_VERSION, digest, total, k))
+        f.write(neighbours.astype("<i4").tobytes())
+
+
+def read_similar(digest: bytes, filename: str = SIMILAR_FILE):
+    """
+    Opens the similar clubs file if it was made for the same clubs. The
+    file is memory-mapped, so only the rows that are looked at are read.
+
+    :param digest: The clubs_digest of the current clubs.
+    :param filename: The name of the file.
+    :return: A NumPy array of similar club positions, or None if the file
+    is missing or stale.
+    """
+    numpy = optional_module("numpy")
+    try:
+        with open(filename, "rb") as f:
+            header = f.read(HEADER.size)
+        magic, version, file_digest, total, k = HEADER.unpack(header)
+    except (FileNotFoundError, struct.error):
+        return None
+    if (
+        magic != MAGIC
+        or version != SIMILAR_VERSION
+        or file_digest != digest
+        or k != NEIGHBOURS
+    ):
+        return None
+    if total == 0:
+        return numpy.zeros((0, k), dtype=numpy.int32)
+    try:
+        return numpy.memmap(
+            filename,
+            dtype="<i4",
+            mode="r",
+            offset=HEADER.size,
+            shape=(total, k),
+        )
+    except ValueError:
+        return None
+
+
+def build_similar(
+    urls: list,
+    categories: list,
+    descriptions: list,
+    filename: str = SIMILAR_FILE,
+):
+    """
+    Works out the similar clubs of every club and saves them, unless the
+    file is already up to date. Nothing is done without NumPy.
+
+    :param urls: The original url of each club.
+    :param categories: The list of categories of each club.
+    :param descriptions: The description of each club.
+    :param filename: The name of the file.
+    :return: The NumPy array of similar club positions, or None without
+    NumPy.
+    """
+    if optional_module("numpy") is None:
+        return None
+    digest = clubs_digest(urls, categories, descriptions_digest(descriptions))
+    neighbours = read_similar(digest, filename)
+    if neighbours is None:
+        neighbours = find_similar(embed_clubs(categories, descriptions))
+        write_similar(neighbours, digest, filename)
+    return neighbours
+
+
+class ClubVectors:
+    """
+    The ClubVectors class. It makes the vectors of the clubs in a ClubStore
+    once per load, for the similar clubs and the favourite ranking to share.
+
+    Attributes:
+    store: The ClubStore with the clubs.
+    loads: The store loads the vectors were made for.
+    vectors: The NumPy array from embed_clubs, one row per club.
+    """
+
+    def __init__(self, store=club_store):
+        """
+        Constructor for the ClubVectors class. The vectors are made when
+        they are first needed.
+        """
+        self.store = store
+        self.loads = None
+        self.vectors = None
+        self.lock = threading.Lock()
+
+    def get(self):
+        """
+        Gets the vectors, making them again if the clubs were reloaded. This
+        reads every description.
+
+        :return: The NumPy array, or None without NumPy.
+        """
+        if optional_module("numpy") is None:
+            return None
+        self.store.refresh()
+        with self.lock:
+            if self.store.loads != self.loads:
+                clubs = self.store.clubs
+                self.vectors = embed_clubs(
+                    [club.get_categories() for club in clubs],
+                    [club.get_description() for club in clubs],
+                )
+                self.loads = self.store.loads
+            return self.vectors
+
+
+# The one set of club vectors shared by every view
+club_vectors = ClubVectors()
+
+
+class SimilarClubs:
+    """
+    The SimilarClubs class. It looks up the similar clubs of a club. They are
+    read or worked out on a background thread, so a view never waits for
+    them.
+
+    Attributes:
+    store: The ClubStore with the clubs.
+    loads: The store loads the similar clubs are for.
+    clubs: The list of Club objects of those loads.
+    positions: A dictionary of original_url -> position of the club.
+    neighbours: The NumPy array of similar club positions, None until they
+    are ready or if there are none.
+    """
+
+    def __init__(self, store=club_store, filename: str = SIMILAR_FILE):
+        """
+        Constructor for the SimilarClubs class. Nothing is read until the
+        similar clubs are first needed.
+        """
+        self.store = store
+        self.filename = filename
+        self.loads = None
+        self.clubs = []
+        self.positions = {}
+        self.neighbours = None
+        self.lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """
+        Starts getting the similar clubs again if the clubs were reloaded.
+        Favourites do not change them.
+        """
+        self.store.refresh()
+        with self.lock:
+            if self.store.loads == self.loads:
+                return
+            clubs = self.clubs = self.store.clubs
+            self.neighbours = None
+            self.positions = {
+                club.get_original_url(): position
+                for position, club in enumerate(clubs)
+            }
+            loads = self.loads = self.store.loads
+        threading.Thread(
+            target=self.load, args=(clubs, loads), daemon=True
+        ).start()
+
+    def load(self, clubs: list, loads: int) -> None:
+        """
+        Reads or works out the similar clubs, and keeps them if the clubs
+        were not reloaded in the meantime. Runs on a background thread.
+
+        :param clubs: The list of Club objects.
+        :param loads: The store loads the clubs are from.
+        """
+        if optional_module("numpy") is None:
+            return
+        try:
+            neighbours = self.read_or_build(clubs, loads)
+        except OSError as e:
+            print(f"Error saving the similar clubs: {e}")
+            return
+        with self.lock:
+            if self.loads == loads:
+                self.neighbours = neighbours
+
+    def read_or_build(self, clubs: list, loads: int):
+        """
+        Reads the similar clubs from the file, or works them out and saves
+        them if it is missing or stale. The descriptions are only read when
+        they have to be worked out.
+
+        :param clubs: The list of Club objects.
+        :param loads: The store loads the clubs are from.
+        :return: The NumPy array of similar club positions, or None if the
+        clubs were reloaded while working them out.
+        """
+        blob = load_descriptions()
+        if blob is not None and len(blob) == len(clubs):
+            text_digest = blob.text_digest()
+        else:
+            text_digest = descriptions_digest(
+                [club.get_description() for club in clubs]
+            )
+        digest = clubs_digest(
+            [club.get_original_url() for club in clubs],
+            [club.get_categories() for club in clubs],
+            text_digest,
+        )
+        neighbours = read_similar(digest, self.filename)
+        if neighbours is None:
+            vectors = club_vectors.get()
+            # the vectors are for whatever clubs are loaded now
+            if club_vectors.loads != loads:
+                return None
+            neighbours = find_similar(vectors)
+            write_similar(neighbours, digest, self.filename)
+        return neighbours
+
+    def similar(self, club, k: int = NEIGHBOURS) -> list:
+        """
+        Gets the clubs most like a club.
+
+        :param club: The Club object.
+        :param k: The most clubs to return.
+        :return: A list of Club objects, most similar first, empty while
+        they are not ready.
+        """
+        self.refresh()
+        with self.lock:
+            neighbours = self.neighbours
+            position = self.positions.get(club.get_original_url())
+            clubs = self.clubs
+        if neighbours is None or position is None:
+            return []
+        return [
+            clubs[other]
+            for other in neighbours[position][:k].tolist()
+            if other >= 0
+        ]
+
+
+# The one similar clubs lookup shared by every view
+similar_clubs = SimilarClubs()
@@ -0,0 +1,477 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program saves everything the app builds from clubs.json and
+events.json (club columns, the category index, the date index and the search
+text) into one binary snapshot file. On start up the snapshot is read in one
+go instead of parsing the JSON files and building the indexes again. If the
+JSON files changed since the snapshot was written, the snapshot is ignored.
+Favouriting a club only changes one column, so the snapshot is updated then
+instead of going stale.
+
+The club descriptions are most of the data but are rarely needed, so they go
+in a separate file. It is memory-mapped and a description is only decoded
+when it is asked for.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from Database import (
+    CLUBS_FILE,
+    EVENTS_FILE,
+    atomic_write,
+    group_events_by_date,
+    load_from_file,
+)
+
+# names for the files
+SNAPSHOT_FILE = "clubs.snapshot"
+DESCRIPTIONS_FILE = "descriptions.bin"
+
+# change this when the contents of the snapshot change
+SNAPSHOT_VERSION = 2
+
+# magic, version, source digest, payload digest, payload length
+MAGIC = b"UCFSNAP\0"
+HEADER = struct.Struct("<8sI16s16sQ")
+
+# magic, version, source digest, number of descriptions
+# then one offset per description (and one for the end), then the text
+DESCRIPTIONS_MAGIC = b"UCFDESC\0"
+DESCRIPTIONS_HEADER = struct.Struct("<8sI16sQ")
+DESCRIPTIONS_DIGEST_AT = struct.calcsize("<8sI")
+OFFSET = struct.Struct("<Q")
+
+# the last snapshot read, so every view shares one read of the file
+_cache = {"signature": None, "snapshot": None}
+
+# the open descriptions file, with the source digest it was made for
+_descriptions = {"digest": None, "blob": None}
+
+
+def source_digest(sources: tuple = (CLUBS_FILE, EVENTS_FILE)) -> bytes:
+    """
+    Makes a short fingerprint of the JSON files from their size and last
+    modified time, so a stale snapshot can be found without reading them.
+
+    :param sources: The names of the files the snapshot is made from.
+    :return: The fingerprint as 16 bytes.
+    """
+    parts = []
+    for filename in sources:
+        try:
+            stat = os.stat(filename)
+            parts.append(f"{filename}:{stat.st_size}:{stat.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append(f"{filename}:missing")
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).digest()
+
+
+def build_snapshot(clubs: list, events: list) -> dict:
+    """
+    Builds the snapshot contents from the club and event dictionaries.
+
+    :param clubs: The list of club dictionaries from clubs.json.
+    :param events: The list of event dictionaries from events.json.
+    :return: A dictionary with the columns and indexes. The descriptions
+    are kept apart, since write_snapshot puts them in their own file.
+    """
+    by_category = {}
+    related = {}
+
+    # campuses and categories repeat a lot, so each is stored only once
+    # (in new dictionaries, the ones passed in are left as they are)
+    clubs = [
+        {
+            **club,
+            "campus": sys.intern(club["campus"]),
+            "categories": [sys.intern(c) for c in club["categories"]],
+        }
+        for club in clubs
+    ]
+
+    # the campus None holds the clubs from every campus
+    for position, club in enumerate(clubs):
+        for campus in (None, club["campus"]):
+            for category in club["categories"]:
+                if (campus, category) not in by_category:
+                    by_category[(campus, category)] = array("I")
+                    related[(campus, category)] = set()
+                by_category[(campus, category)].append(position)
+                related[(campus, category)].update(club["categories"])
+
+    return {
+        "columns": {
+            key: [club[key] for club in clubs]
+            for key in (
+                "name",
+                "campus",
+                "contacts",
+                "categories",
+                "events",
+                "original_url",
+                "is_favourited",
+            )
+        },
+        "by_category": by_category,
+        "related": related,
+        "search_names": [club["name"].lower() for club in clubs],
+        "descriptions": [club["description"] for club in clubs],
+        "events": events,
+        "events_by_date": group_events_by_date(events),
+    }
+
+
+def write_snapshot(
+    snapshot: dict,
+    filename: str = SNAPSHOT_FILE,
+    sources: tuple = (CLUBS_FILE, EVENTS_FILE),
+    digest: bytes = None,
+) -> None:
+    """
+    Writes the snapshot for the current JSON files, and the descriptions
+    to DESCRIPTIONS_FILE.
+
+    :param snapshot: The snapshot from build_snapshot.
+    :param filename: The name of the snapshot file.
+    :param sources: The names of the files the snapshot is made from.
+    :param digest: The source_digest taken before the JSON files were read.
+    If the files change while the snapshot is built, it will then be stale.
+    """
+    if digest is None:
+        digest = source_digest(sources)
+
+    # the descriptions are written first, so they are there for the snapshot
+    snapshot = dict(snapshot)
+    write_descriptions(snapshot.pop("descriptions"), digest)
+    write_snapshot_file(snapshot, filename, digest)
+
+
+def write_snapshot_file(snapshot: dict, filename: str, digest: bytes) -> None:
+    """
+    Writes the snapshot file, without the descriptions.
+
+    :param snapshot: The snapshot, without the descriptions.
+    :param filename: The name of the snapshot file.
+    :param digest: The source_digest of the JSON files it was made from.
+    """
+    payload = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    header = HEADER.pack(
+        MAGIC,
+        SNAPSHOT_VERSION,
+        digest,
+        hashlib.blake2b(payload, digest_size=16).digest(),
+        len(payload),
+    )
+
+    # a half written file is never read
+    with atomic_write(filename) as f:
+        f.write(header)
+        f.write(payload)
+
+    # the snapshot is already in memory, so it does not need to be read back
+    stat = os.stat(filename)
+    _cache["signature"] = (filename, stat.st_size, stat.st_mtime_ns, digest)
+    _cache["snapshot"] = snapshot
+
+
+def encode_descriptions(descriptions: list) -> tuple:
+    """
+    Turns the descriptions into the bytes of a descriptions file, after its
+    header.
+
+    :param descriptions: The list of descriptions, in club order.
+    :return: A tuple of the table of where each starts, as bytes, and the
+    list of UTF-8 descriptions.
+    """
+    encoded = [description.encode("utf-8") for description in descriptions]
+
+    offsets = [0]
+    for text in encoded:
+        offsets.append(offsets[-1] + len(text))
+    return struct.pack(f"<{len(offsets)}Q", *offsets), encoded
+
+
+def descriptions_digest(descriptions: list) -> bytes:
+    """
+    Makes a fingerprint of the descriptions, the same one
+    DescriptionBlob.text_digest gives for the file written from them.
+
+    :param descriptions: The list of descriptions, in club order.
+    :return: The fingerprint as 16 bytes.
+    """
+    table, encoded = encode_descriptions(descriptions)
+    digest = hashlib.blake2b(table, digest_size=16)
+    for text in encoded:
+        digest.update(text)
+    return digest.digest()
+
+
+def write_descriptions(
+    descriptions: list, digest: bytes, filename: str = DESCRIPTIONS_FILE
+) -> None:
+    """
+    Writes the descriptions as UTF-8 text with a table of where each starts.
+
+    :param descriptions: The list of descriptions, in club order.
+    :param digest: The source_digest of the JSON files they came from.
+    :param filename: The name of the descriptions file.
+    """
+    table, encoded = encode_descriptions(descriptions)
+
+    with atomic_write(filename) as f:
+        f.write(
+            DESCRIPTIONS_HEADER.pack(
+                DESCRIPTIONS_MAGIC, SNAPSHOT_VERSION, digest, len(encoded)
+            )
+        )
+        f.write(table)
+        f.writelines(encoded)
+
+
+class DescriptionBlob:
+    """
+    The DescriptionBlob class. It reads descriptions from a memory-mapped
+    descriptions file. Nothing is decoded until a description is asked for,
+    and the operating system only loads the pages that are read.
+
+    Attributes:
+    digest: The source_digest of the JSON files the file was made from.
+    count: The number of descriptions.
+    """
+
+    def __init__(self, filename: str = DESCRIPTIONS_FILE):
+        """
+        Constructor for the DescriptionBlob class.
+        Raises ValueError if the file is not a descriptions file.
+        """
+        with open(filename, "rb") as f:
+            self.__mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, digest, count = DESCRIPTIONS_HEADER.unpack_from(
+            self.__mapped
+        )
+        self.__table = DESCRIPTIONS_HEADER.size
+        self.__text = self.__table + (count + 1) * OFFSET.size
+        if (
+            magic != DESCRIPTIONS_MAGIC
+            or version != SNAPSHOT_VERSION
+            or len(self.__mapped) < self.__text
+        ):
+            raise ValueError(f"{filename} is not a descriptions file")
+
+        self.digest = digest
+        self.count = count
+        self.__text_digest = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def text_digest(self) -> bytes:
+        """
+        Makes a fingerprint of the descriptions from the bytes in the file,
+        without decoding them. It is only worked out once.
+
+        :return: The same fingerprint as descriptions_digest.
+        """
+        if self.__text_digest is None:
+            with memoryview(self.__mapped) as view:
+                with view[self.__table :] as text:
+                    digest = hashlib.blake2b(text, digest_size=16)
+            self.__text_digest = digest.digest()
+        return self.__text_digest
+
+    def get(self, position: int) -> str:
+        """
+        Reads and decodes one description.
+
+        :param position: The position of the club in the snapshot.
+        :return: The description.
+        """
+        table = self.__table + position * OFFSET.size
+        start = OFFSET.unpack_from(self.__mapped, table)[0]
+        end = OFFSET.unpack_from(self.__mapped, table + OFFSET.size)[0]
+        return self.__mapped[self.__text + start : self.__text + end].decode(
+            "utf-8"
+        )
+
+
+def load_descriptions(filename: str = DESCRIPTIONS_FILE) -> DescriptionBlob:
+    """
+    Opens the descriptions file if it matches the current JSON files.
+    The same open file is shared until the JSON files change.
+
+    :param filename: The name of the descriptions file.
+    :return: The DescriptionBlob, or None if it is missing or stale.
+    """
+    digest = source_digest()
+    if _descriptions["digest"] != digest:
+        try:
+            blob = DescriptionBlob(filename)
+        except (FileNotFoundError, ValueError, struct.error):
+            return None
+        if blob.digest != digest:
+            return None
+        _descriptions["digest"] = digest
+        _descriptions["blob"] = blob
+    return _descriptions["blob"]
+
+
+def load_snapshot(
+    filename: str = SNAPSHOT_FILE,
+    sources: tuple = (CLUBS_FILE, EVENTS_FILE),
+    digest: bytes = None,
+) -> dict:
+    """
+    Loads the snapshot if it is still up to date with the JSON files.
+    The file is memory-mapped and unpickled straight from the mapping.
+
+    :param filename: The name of the snapshot file.
+    :param sources: The names of the files the snapshot is made from.
+    :param digest: The source_digest the snapshot has to be for, the one
+    of the files as they are now if not given.
+    :return: The snapshot dictionary, or None if it is missing or stale.
+    """
+    if digest is None:
+        digest = source_digest(sources)
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+
+    # the same file was already read
+    signature = (filename, stat.st_size, stat.st_mtime_ns, digest)
+    if _cache["signature"] == signature:
+        return _cache["snapshot"]
+
+    if stat.st_size < HEADER.size:
+        return None
+
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            magic, version, source, checksum, length = HEADER.unpack_from(
+                mapped
+            )
+            if (
+                magic != MAGIC
+                or version != SNAPSHOT_VERSION
+                or source != digest
+                or length != len(mapped) - HEADER.size
+            ):
+                return None
+
+            with memoryview(mapped) as view, view[HEADER.size :] as payload:
+                if (
+                    hashlib.blake2b(payload, digest_size=16).digest()
+                    != checksum
+                ):
+                    return None
+                snapshot = pickle.loads(payload)
+
+    _cache["signature"] = signature
+    _cache["snapshot"] = snapshot
+    return snapshot
+
+
+def refresh_snapshot() -> dict:
+    """
+    Loads the snapshot, or rebuilds it from the JSON files if it or the
+    descriptions file is stale, so the next start up is fast again.
+
+    :return: The snapshot dictionary.
+    """
+    snapshot = load_snapshot()
+    if snapshot is None or load_descriptions() is None:
+        snapshot = rebuild_snapshot()
+    return snapshot
+
+
+def rebuild_snapshot() -> dict:
+    """
+    Builds the snapshot from the JSON files and writes it.
+
+    :return: The snapshot dictionary, with the descriptions still in it.
+    """
+    digest = source_digest()
+    snapshot = build_snapshot(
+        load_from_file(CLUBS_FILE), load_from_file(EVENTS_FILE)
+    )
+    write_snapshot(snapshot, digest=digest)
+    return snapshot
+
+
+def update_favourites(
+    before: bytes,
+    favourites: dict,
+    filename: str = SNAPSHOT_FILE,
+    descriptions_filename: str = DESCRIPTIONS_FILE,
+) -> bool:
+    """
+    Keeps the snapshot up to date after only favourites were written to
+    clubs.json, so the next start up does not have to rebuild it. Call it
+    right after the write, holding data_lock.
+
+    :param before: The source_digest from before the write.
+    :param favourites: A dictionary of original_url -> is_favourited.
+    :param filename: The name of the snapshot file.
+    :param descriptions_filename: The name of the descriptions file.
+    :return: True if the snapshot was updated, False if it was already
+    stale before the write.
+    """
+    snapshot = load_snapshot(filename, digest=before)
+    if snapshot is None:
+        return False
+    columns = snapshot["columns"]
+    positions = {url: i for i, url in enumerate(columns["original_url"])}
+    if any(url not in positions for url in favourites):
+        return False
+    try:
+        with open(descriptions_filename, "rb") as f:
+            header = f.read(DESCRIPTIONS_HEADER.size)
+        magic, version, digest, count = DESCRIPTIONS_HEADER.unpack(header)
+    except (FileNotFoundError, struct.error):
+        return False
+    if (
+        magic != DESCRIPTIONS_MAGIC
+        or version != SNAPSHOT_VERSION
+        or digest != before
+    ):
+        return False
+
+    # a new column, since the snapshot in memory can be in use
+    is_favourited = list(columns["is_favourited"])
+    for url, value in favourites.items():
+        is_favourited[positions[url]] = value
+    snapshot = {
+        **snapshot,
+        "columns": {**columns, "is_favourited": is_favourited},
+    }
+
+    after = source_digest()
+    write_snapshot_file(snapshot, filename, after)
+    # the descriptions did not change, only the files they are for
+    with open(descriptions_filename, "r+b") as f:
+        f.seek(DESCRIPTIONS_DIGEST_AT)
+        f.write(after)
+        f.flush()
+        os.fsync(f.fileno())
+    blob = _descriptions["blob"]
+    if blob is not None and _descriptions["digest"] == before:
+        blob.digest = after
+        _descriptions["digest"] = after
+    return True
@@ -12,13 +12,14 @@ Purpose: This program shows the starting screen/homepage. Users can choose to
  refresh the database or skip the refresh and go to the list view.
 
 Date Created: 2024-11-13
-Date Last Modified: 2024-12-05
+Date Last Modified: 2026-10-19
 """
 
 from tkinter import ttk
 from Database import *
 from Club_View import *
 from List_View import *
+from Snapshot import refresh_snapshot
 import time
 
 
@@ -50,12 +51,12 @@ class Start_View(ttk.Frame):
         if check_files():
             # Refresh the database if files exist
             clubs, events = refresh_database()
+            club_count, event_count = len(clubs), len(events)
         else:
-            # Load clubs and events from files if they exist
-            clubs = load_from_file(CLUBS_FILE)
-            events = load_from_file(EVENTS_FILE)
-            clubs = [Club(**club) for club in clubs]
-            events = [Event(**event) for event in events]
+            # The snapshot is read on start up anyway and has both lists
+            snapshot = refresh_snapshot()
+            club_count = len(snapshot["columns"]["name"])
+            event_count = len(snapshot["events"])
 
         # Display the current status of the database
         status = ttk.Label(
@@ -67,7 +68,7 @@ class Start_View(ttk.Frame):
         status.pack(padx=20, pady=10)
         num_clubs = ttk.Label(
             self,
-            text=f"--- {len(clubs)} clubs ---",
+            text=f"--- {club_count} clubs ---",
             wraplength=200,
             width=30,
             style="Title.TLabel",
@@ -76,7 +77,7 @@ class Start_View(ttk.Frame):
         num_clubs.pack(padx=20, pady=10)
         num_events = ttk.Label(
             self,
-            text=f"--- {len(events)} events ---",
+            text=f"--- {event_count} events ---",
             wraplength=200,
             width=30,
             style="Title.TLabel",
@@ -0,0 +1,362 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program suggests club names and event titles while the user
+types. Every word of every name is put in a prefix tree (trie), and each
+node of the tree keeps the best few names under it, so a keystroke only
+walks down the tree. A word with one typo (a letter missing, extra, wrong or
+swapped) is still found through an index of every word with one letter
+deleted. A search stops when it runs out of time, so typing never lags.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import bisect
+import heapq
+import re
+import time
+from array import array
+from Database import load_event_store
+from Club_Store import club_store
+
+# how many suggestions to give
+LIMIT = 8
+
+# the longest a suggestion may take, after this the results so far are used
+LATENCY_BUDGET_MS = 5
+
+# words shorter than this are not corrected, too many words are one typo away
+MIN_TYPO_LENGTH = 3
+
+WORD = re.compile(r"[a-z0-9]+")
+
+# past this many words starting with the last word typed, the entries are
+# checked one at a time instead
+MAX_PREFIX_WORDS = 64
+
+# keys in a trie node that no letter uses: the best entries under the node,
+# and the entries with the word that ends at the node
+TOP = ""
+END = "$"
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """
+    Checks if two words are the same except for one letter that is missing,
+    extra, different, or swapped with the next one.
+
+    :param a: A word.
+    :param b: Another word.
+    :return: True if they are at most one edit apart.
+    """
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+
+    # skip the start they have in common
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+
+    if len(a) < len(b):
+        return a[i:] == b[i + 1 :]
+    return a[i + 1 :] == b[i + 1 :] or (
+        a[i + 2 :] == b[i + 2 :] and a[i : i + 2] == b[i : i + 2][::-1]
+    )
+
+
+class TypeAheadIndex:
+    """
+    The TypeAheadIndex class. It suggests labels (club names or event
+    titles) that have words starting with what was typed.
+
+    Attributes:
+    key: What the index was made from, so it is only made again when that
+    changes.
+    entries: The list of (label, value) tuples, best first: shorter labels,
+    then in alphabetical order.
+    entry_words: For each entry, the set of its words.
+    postings: A dictionary of word -> array of the entries with the word.
+    posting_sets: The same with sets, to find entries with several words.
+    words: The sorted list of words, to find the words with a prefix.
+    trie: The prefix tree of the words. Each node is a dictionary of letter
+    -> node, TOP -> list of the best entries with a word under the node, and
+    END -> the postings of the word that ends at the node, if there is one.
+    deletes: A dictionary of word with one letter deleted -> list of words.
+    """
+
+    def __init__(self, limit: int = LIMIT):
+        """
+        Constructor for the TypeAheadIndex class.
+        """
+        self.limit = limit
+        self.key = None
+        self.entries = []
+        self.entry_words = []
+        self.postings = {}
+        self.posting_sets = {}
+        self.words = []
+        self.trie = {TOP: []}
+        self.deletes = {}
+
+    def build(self, items: list, key=None) -> None:
+        """
+        Makes the index.
+
+        :param items: A list of (label, value) tuples. The value is given
+        back with the label when it is suggested.
+        :param key: What the items were made from.
+        """
+        entries = sorted(
+            items, key=lambda item: (len(item[0]), item[0].lower())
+        )
+
+        # the entries are added best first, so every postings list is too
+        entry_words = []
+        postings = {}
+        for number, (label, value) in enumerate(entries):
+            words = set(WORD.findall(label.lower()))
+            entry_words.append(words)
+            for word in words:
+                if word not in postings:
+                    postings[word] = array("I")
+                postings[word].append(number)
+
+        trie = {TOP: []}
+        for word, numbers in postings.items():
+            node = trie
+            for letter in word:
+                node = node.setdefault(letter, {TOP: []})
+            node[END] = numbers
+
+        deletes = {}
+        for word in postings:
+            if len(word) >= MIN_TYPO_LENGTH and not word.isdigit():
+                for i in range(len(word)):
+                    deletes.setdefault(word[:i] + word[i + 1 :], []).append(
+                        word
+                    )
+
+        self.fill_top(trie)
+        self.entries = entries
+        self.words = sorted(postings)
+        self.posting_sets = {
+            word: frozenset(numbers) for word, numbers in postings.items()
+        }
+        self.entry_words = entry_words
+        self.postings = postings
+        self.trie = trie
+        self.deletes = deletes
+        self.key = key
+
+    def fill_top(self, node: dict) -> list:
+        """
+        Works out the best entries under each node of the trie, starting
+        from the leaves.
+
+        :param node: A trie node.
+        :return: The list of the best entries under the node.
+        """
+        lists = []
+        for letter, child in node.items():
+            if letter == END:
+                lists.append(child[: self.limit])
+            elif letter != TOP:
+                lists.append(self.fill_top(child))
+        top = []
+        for number in heapq.merge(*lists):
+            if not top or top[-1] != number:
+                top.append(number)
+                if len(top) == self.limit:
+                    break
+        node[TOP] = top
+        return top
+
+    def find_node(self, prefix: str) -> dict:
+        """
+        Walks down the trie.
+
+        :param prefix: The start of a word.
+        :return: The node for the prefix, or None if no word starts with it.
+        """
+        node = self.trie
+        for letter in prefix:
+            node = node.get(letter)
+            if node is None:
+                return None
+        return node
+
+    def typo_words(self, word: str) -> list:
+        """
+        Finds the words that are one typo away from a word.
+
+        :param word: The typed word.
+        :return: A list of words in the index.
+        """
+        if len(word) < MIN_TYPO_LENGTH:
+            return []
+
+        # the typed word with a letter deleted can match a word (an extra
+        # letter) or a word with a letter deleted (a wrong or swapped letter)
+        candidates = set(self.deletes.get(word, []))
+        for i in range(len(word)):
+            deleted = word[:i] + word[i + 1 :]
+            if deleted in self.postings:
+                candidates.add(deleted)
+            candidates.update(self.deletes.get(deleted, []))
+        return [c for c in candidates if within_one_edit(word, c)]
+
+    def matching_words(self, word: str) -> list:
+        """
+        Gets the words a whole typed word could be.
+
+        :param word: The typed word.
+        :return: The word itself if it is in the index, otherwise the words
+        one typo away.
+        """
+        if word in self.postings:
+            return [word]
+        return self.typo_words(word)
+
+    def suggest(self, text: str, limit: int = None) -> list:
+        """
+        Suggests labels for what was typed. The last word typed only has to
+        be the start of a word, the ones before it have to be whole words.
+        With one word, the suggestions come straight from the trie.
+
+        :param text: The text typed so far.
+        :param limit: The most suggestions, self.limit if not given.
+        :return: A list of (label, value) tuples, best first.
+        """
+        limit = limit or self.limit
+        deadline = time.perf_counter() + LATENCY_BUDGET_MS / 1000
+        words = WORD.findall(text.lower())
+        if not words:
+            return []
+        *whole, prefix = words
+
+        # the words the last one could be, if it has a typo
+        node = self.find_node(prefix)
+        typos = self.typo_words(prefix)
+
+        if not whole:
+            numbers = list(node[TOP][:limit]) if node else []
+            if len(numbers) < limit and typos:
+                for number in heapq.merge(
+                    *[self.postings[word] for word in typos]
+                ):
+                    if number not in numbers:
+                        numbers.append(number)
+                        if len(numbers) == limit:
+                            break
+            return [self.entries[number] for number in numbers]
+
+        # the entries with all the whole words (or a word one typo away)
+        options = [self.matching_words(word) for word in whole]
+        if not all(options):
+            return []
+        sets = sorted(
+            (self.entries_with(option) for option in options), key=len
+        )
+        candidates = sets[0].intersection(*sets[1:])
+
+        # and a word starting with the last one, found with set
+        # intersections unless too many words start with it
+        starting = self.words_starting(prefix) + typos
+        if len(starting) <= MAX_PREFIX_WORDS:
+            matched = set()
+            for word in starting:
+                matched |= candidates & self.posting_sets[word]
+            numbers = heapq.nsmallest(limit, matched)
+        else:
+            numbers = []
+            for count, number in enumerate(sorted(candidates)):
+                if count % 256 == 0 and time.perf_counter() > deadline:
+                    break
+                words_in_entry = self.entry_words[number]
+                if any(
+                    word.startswith(prefix) for word in words_in_entry
+                ) or words_in_entry.intersection(typos):
+                    numbers.append(number)
+                    if len(numbers) == limit:
+                        break
+        return [self.entries[number] for number in numbers]
+
+    def entries_with(self, words: list) -> set:
+        """
+        Gets the entries with any of some words.
+
+        :param words: The list of words.
+        :return: The set of entry numbers. Do not change it, it can be
+        shared with the index.
+        """
+        if len(words) == 1:
+            return self.posting_sets[words[0]]
+        return set().union(*[self.posting_sets[word] for word in words])
+
+    def words_starting(self, prefix: str) -> list:
+        """
+        Gets the words that start with a prefix.
+
+        :param prefix: The start of a word.
+        :return: The list of words.
+        """
+        words = []
+        i = bisect.bisect_left(self.words, prefix)
+        while i < len(self.words) and self.words[i].startswith(prefix):
+            words.append(self.words[i])
+            i += 1
+        return words
+
+
+# the indexes for club names and event titles, made when first needed
+club_names = TypeAheadIndex()
+event_titles = TypeAheadIndex()
+
+
+def suggest_clubs(text: str, limit: int = LIMIT) -> list:
+    """
+    Suggests clubs by name.
+
+    :param text: The text typed so far.
+    :param limit: The most suggestions.
+    :return: A list of (club name, original url) tuples.
+    """
+    club_store.refresh()
+    if club_names.key != club_store.loads:
+        club_names.build(
+            [
+                (club.get_name(), club.get_original_url())
+                for club in club_store.clubs
+            ],
+            club_store.loads,
+        )
+    return club_names.suggest(text, limit)
+
+
+def suggest_events(text: str, limit: int = LIMIT) -> list:
+    """
+    Suggests events by title.
+
+    :param text: The text typed so far.
+    :param limit: The most suggestions.
+    :return: A list of (event title, event dictionary) tuples.
+    """
+    events = load_event_store()
+    if event_titles.key is not events:
+        event_titles.build(
+            [(event.get("title", ""), event) for event in events.values()],
+            events,
+        )
+    return event_titles.suggest(text, limit)
@@ -0,0 +1,443 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program keeps the favourite clubs of many users, for when the
+data is shared instead of used by one person. Each club gets a small number
+(its club id) the first time it is favourited, saved in club_ids.json, and
+ids are never reused, so they stay the same when the clubs are scraped
+again. Each user's favourites are a compressed Bitmap of club ids, all of
+them in one binary file. The club data itself is never copied.
+
+A change only adds one record, with the new favourites of that user, to the
+end of the file, so it does not depend on how many users there are. The
+file is written again without the old records once they take up most of it.
+
+The clubs the app shows as favourites (is_favourited in clubs.json) are the
+ones of the person using the app, APP_USER. Each time a favourite is written
+to clubs.json, the favourites of APP_USER are saved here too, and the API
+answers /favourites from this file. import_favourites copies them to another
+user.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import getpass
+import os
+import struct
+from Bitmap import Bitmap
+from Database import (
+    atomic_write,
+    data_lock,
+    load_from_file,
+    record_change,
+    write_data_file,
+)
+
+# names for the files
+USER_FAVOURITES_FILE = "user_favourites.bin"
+CLUB_IDS_FILE = "club_ids.json"
+
+# the user the favourites of the person using the app are kept for
+try:
+    APP_USER = getpass.getuser()
+except (OSError, KeyError):
+    APP_USER = "app"
+
+# change this when the layout of the file changes
+USER_FAVOURITES_VERSION = 2
+
+# magic, version
+# then one record per change: length of the name, length of the bitmap, the
+# name in UTF-8 and the bitmap from Bitmap.to_bytes of all the favourites of
+# the user. A later record for a user replaces the earlier ones.
+MAGIC = b"UCFUSER\0"
+HEADER = struct.Struct("<8sI")
+USER = struct.Struct("<HI")
+
+# the file is written again with one record per user when it is this many
+# times bigger than those records, and at least COMPACT_MIN_BYTES
+COMPACT_RATIO = 2
+COMPACT_MIN_BYTES = 64 * 1024
+
+
+class UserFavourites:
+    """
+    The UserFavourites class.
+
+    Attributes:
+    filename: The name of the user favourites file.
+    ids_filename: The name of the club ids file.
+    signature: The sizes and last modified times of both files when they
+    were read, so they are only read again when they change.
+    users: A dictionary of user name -> Bitmap of the club ids they
+    favourited.
+    sizes: A dictionary of user name -> size of the user's newest record.
+    position: How much of the file was read, 0 if it has to be written
+    again, e.g. because it is missing or damaged.
+    inode: The inode of the file that was read, so a file that was written
+    again is read from the start.
+    urls: The list of original urls, where the position is the club id.
+    ids: A dictionary of original_url -> club id.
+    """
+
+    def __init__(
+        self,
+        filename: str = USER_FAVOURITES_FILE,
+        ids_filename: str = CLUB_IDS_FILE,
+    ):
+        """
+        Constructor for the UserFavourites class. Nothing is read until the
+        favourites are first needed.
+        """
+        self.filename = filename
+        self.ids_filename = ids_filename
+        self.signature = None
+        self.users = {}
+        self.sizes = {}
+        self.position = 0
+        self.inode = None
+        self.urls = []
+        self.ids = {}
+
+    def get_signature(self) -> tuple:
+        """
+        Gets the last modified time and size of both files.
+
+        :return: A tuple, with None for a missing file.
+        """
+        signature = []
+        for filename in (self.filename, self.ids_filename):
+            try:
+                stat = os.stat(filename)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def refresh(self) -> None:
+        """
+        Reads the files again if they changed, e.g. in another app. Only the
+        records added to the favourites file since it was read are read.
+        """
+        if self.get_signature() == self.signature:
+            return
+        with data_lock():
+            signature = self.get_signature()
+            old = self.signature or (False, False)
+            if signature[1] != old[1]:
+                self.urls = (
+                    load_from_file(self.ids_filename)
+                    if os.path.exists(self.ids_filename)
+                    else []
+                )
+                self.ids = {url: i for i, url in enumerate(self.urls)}
+            if signature[0] != old[0]:
+                self.read_users()
+        self.signature = signature
+
+    def read_users(self) -> None:
+        """
+        Reads the records added to the favourites file since it was last
+        read, or the whole file if it was written again. A missing, damaged
+        or foreign file counts as no favourites, and is written again on the
+        next change.
+        """
+        try:
+            with open(self.filename, "rb") as f:
+                stat = os.fstat(f.fileno())
+                start = 0
+                if (
+                    self.position
+                    and stat.st_ino == self.inode
+                    and stat.st_size >= self.position
+                ):
+                    start = self.position
+                f.seek(start)
+                data = f.read()
+        except FileNotFoundError:
+            self.users, self.sizes, self.position = {}, {}, 0
+            return
+
+        users, sizes = (self.users, self.sizes) if start else ({}, {})
+        offset = 0
+        if not start:
+            try:
+                magic, version = HEADER.unpack_from(data)
+            except struct.error:
+                magic = version = None
+            if magic != MAGIC or version != USER_FAVOURITES_VERSION:
+                self.users, self.sizes, self.position = {}, {}, 0
+                return
+            offset = HEADER.size
+
+        with memoryview(data) as view:
+            while offset + USER.size <= len(data):
+                name_length, bitmap_length = USER.unpack_from(data, offset)
+                name_end = offset + USER.size + name_length
+                end = name_end + bitmap_length
+                # a record cut off by a crash is written over next time
+                if end > len(data):
+                    break
+                try:
+                    name = bytes(view[offset + USER.size : name_end])
+                    name = name.decode("utf-8")
+                    users[name] = Bitmap.from_bytes(view[name_end:end])
+                except (ValueError, struct.error):
+                    break
+                sizes[name] = end - offset
+                offset = end
+
+        self.users = users
+        self.sizes = sizes
+        self.position = start + offset
+        self.inode = stat.st_ino
+
+    def record(self, user: str) -> bytes:
+        """
+        Makes the record of a user's favourites.
+
+        :param user: The user name.
+        :return: The record as bytes.
+        """
+        encoded_name = user.encode("utf-8")
+        encoded = self.users[user].to_bytes()
+        return (
+            USER.pack(len(encoded_name), len(encoded)) + encoded_name + encoded
+        )
+
+    def save_ids(self) -> None:
+        """
+        Writes the club ids file. Hold data_lock when calling this. It does
+        not use save_to_file, since favourites are saved while the writer
+        thread is writing clubs.json and holds its lock.
+        """
+        write_data_file(self.ids_filename, self.urls)
+        record_change(self.ids_filename)
+
+    def save(self, new_ids: bool) -> None:
+        """
+        Writes the favourites of every user, one record each. Hold data_lock
+        when calling this, after refresh, so changes from other apps are
+        kept.
+
+        :param new_ids: True if clubs were given ids since the ids file was
+        read, so it is written too.
+        """
+        if new_ids:
+            self.save_ids()
+
+        sizes = {}
+        with atomic_write(self.filename) as f:
+            f.write(HEADER.pack(MAGIC, USER_FAVOURITES_VERSION))
+            for name in self.users:
+                record = self.record(name)
+                f.write(record)
+                sizes[name] = len(record)
+        record_change(self.filename)
+
+        self.sizes = sizes
+        self.position = HEADER.size + sum(sizes.values())
+        self.inode = os.stat(self.filename).st_ino
+        self.signature = self.get_signature()
+
+    def append(self, user: str, new_ids: bool) -> None:
+        """
+        Adds the record of one user to the end of the file, or writes the
+        whole file if it is mostly old records. Hold data_lock when calling
+        this, after refresh.
+
+        :param user: The user name.
+        :param new_ids: True if clubs were given ids since the ids file was
+        read, so it is written too.
+        """
+        record = self.record(user)
+        size = self.position + len(record)
+        used = (
+            HEADER.size
+            + sum(self.sizes.values())
+            - self.sizes.get(user, 0)
+            + len(record)
+        )
+        if not self.position or (
+            size > COMPACT_MIN_BYTES and size > COMPACT_RATIO * used
+        ):
+            self.save(new_ids)
+            return
+
+        if new_ids:
+            self.save_ids()
+        with open(self.filename, "r+b") as f:
+            # anything after position is a record cut off by a crash
+            f.seek(self.position)
+            f.write(record)
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+        record_change(self.filename)
+
+        self.sizes[user] = len(record)
+        self.position = size
+        self.signature = self.get_signature()
+
+    def change(self, user: str, add: list = (), remove: list = ()) -> None:
+        """
+        Adds and removes favourite clubs of a user, and saves them.
+
+        :param user: The user name.
+        :param add: The original urls of the clubs to add.
+        :param remove: The original urls of the clubs to remove.
+        """
+        with data_lock():
+            self.refresh()
+            count = len(self.urls)
+            bitmap = self.users.setdefault(user, Bitmap())
+            for url in add:
+                if url not in self.ids:
+                    self.ids[url] = len(self.urls)
+                    self.urls.append(url)
+                bitmap.add(self.ids[url])
+            for url in remove:
+                if url in self.ids:
+                    bitmap.discard(self.ids[url])
+            self.append(user, len(self.urls) != count)
+
+    def favourite(self, user: str, url: str) -> None:
+        """
+        Adds a club to a user's favourites.
+
+        :param user: The user name.
+        :param url: The original url of the club.
+        """
+        self.change(user, add=[url])
+
+    def unfavourite(self, user: str, url: str) -> None:
+        """
+        Removes a club from a user's favourites.
+
+        :param user: The user name.
+        :param url: The original url of the club.
+        """
+        self.change(user, remove=[url])
+
+    def get(self, user: str) -> Bitmap:
+        """
+        Gets the club ids a user favourited.
+
+        :param user: The user name.
+        :return: The Bitmap, empty for an unknown user. Do not change it,
+        since it is shared.
+        """
+        self.refresh()
+        return self.users.get(user, Bitmap())
+
+    def to_urls(self, bitmap: Bitmap) -> list:
+        """
+        Turns club ids back into original urls.
+
+        :param bitmap: A Bitmap of club ids.
+        :return: The list of original urls, in club id order.
+        """
+        return [self.urls[club_id] for club_id in bitmap]
+
+    def favourites(self, user: str) -> list:
+        """
+        Gets the favourite clubs of a user.
+
+        :param user: The user name.
+        :return: The list of original urls.
+        """
+        return self.to_urls(self.get(user))
+
+    def common_favourites(self, users: list) -> list:
+        """
+        Gets the clubs that every one of some users favourited, e.g. the
+        clubs all my friends like. The smallest set is started from.
+
+        :param users: The list of user names.
+        :return: The list of original urls.
+        """
+        bitmaps = sorted((self.get(user) for user in users), key=len)
+        if not bitmaps:
+            return []
+        common = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            common = common & bitmap
+            if not common.containers:
+                break
+        return self.to_urls(common)
+
+    def any_favourites(self, users: list) -> list:
+        """
+        Gets the clubs that any of some users favourited.
+
+        :param users: The list of user names.
+        :return: The list of original urls.
+        """
+        found = Bitmap()
+        for user in users:
+            found = found | self.get(user)
+        return self.to_urls(found)
+
+    def favourite_counts(self, users: list = None) -> dict:
+        """
+        Counts how many users favourited each club.
+
+        :param users: The list of user names, every user if not given.
+        :return: A dictionary of original url -> count, without the clubs
+        no one favourited.
+        """
+        self.refresh()
+        if users is None:
+            users = list(self.users)
+        counts = [0] * len(self.urls)
+        for user in users:
+            for club_id in self.users.get(user, ()):
+                counts[club_id] += 1
+        return {url: count for url, count in zip(self.urls, counts) if count}
+
+    def import_favourites(self, user: str, clubs: list) -> None:
+        """
+        Copies the clubs favourited in the app to a user.
+
+        :param user: The user name.
+        :param clubs: The list of Club objects, e.g. club_store.get_clubs().
+        """
+        self.change(
+            user,
+            add=[
+                club.get_original_url()
+                for club in clubs
+                if club.get_is_favourited()
+            ],
+        )
+
+
+# The one set of user favourites shared by every view
+user_favourites = UserFavourites()
+
+
+def save_favourites(clubs: list, changes: dict) -> None:
+    """
+    Saves the favourites of the person using the app, when favourites are
+    written to clubs.json. Every favourite club is added, so the clubs
+    favourited before this file was used are kept too.
+
+    :param clubs: The list of club dictionaries, as they are being written.
+    :param changes: A dictionary of original_url -> is_favourited of the
+    clubs that changed.
+    """
+    user_favourites.change(
+        APP_USER,
+        add=[
+            club["original_url"] for club in clubs if club.get("is_favourited")
+        ],
+        remove=[url for url, favourite in changes.items() if not favourite],
+    )
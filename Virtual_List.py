@@ -0,0 +1,139 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program is a scrollable list that only makes widgets for the
+rows that can be seen. When the list scrolls, the same row widgets are moved
+and filled with the next items, so long lists cost no more than short ones.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+from tkinter import *
+from tkinter import ttk
+
+
+class VirtualList(ttk.Frame):
+    """
+    A class to represent a virtualized, scrollable list of rows.
+    """
+
+    def __init__(self, parent, make_row, fill_row, row_height=30, **kwargs):
+        """
+        Initialize the VirtualList frame.
+
+        :param parent: The parent widget.
+        :param make_row: A function that takes a parent and returns a new row
+        widget. It is only called when more rows fit on the screen.
+        :param fill_row: A function that takes a row widget and an item and
+        shows the item in the row.
+        :param row_height: The height of every row in pixels.
+        :param kwargs: Extra options for the canvas, e.g. width and height.
+        """
+        ttk.Frame.__init__(self, parent, style="TFrame")
+        self.make_row = make_row
+        self.fill_row = fill_row
+        self.row_height = row_height
+
+        self.items = []
+        self.rows = []  # (canvas window id, row widget) for each made row
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        # The canvas scrolls one row at a time
+        self.canvas = Canvas(
+            self,
+            bg="white",
+            highlightthickness=0,
+            yscrollincrement=row_height,
+            **kwargs,
+        )
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+
+        # Add a scrollbar
+        self.scrollbar = Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        # Make more rows if the list gets taller
+        self.canvas.bind("<Configure>", lambda e: self.render())
+        self.bind_scroll(self.canvas)
+
+    def bind_scroll(self, widget):
+        """
+        Let the mouse wheel scroll the list while over a widget.
+
+        :param widget: The widget to bind.
+        """
+        widget.bind("<MouseWheel>", self.on_mouse_wheel)  # Windows and Mac
+        widget.bind("<Button-4>", self.on_mouse_wheel)  # Linux scroll up
+        widget.bind("<Button-5>", self.on_mouse_wheel)  # Linux scroll down
+
+    def on_mouse_wheel(self, event):
+        """
+        Scroll the list with the mouse wheel.
+
+        :param event: The event that triggered the method.
+        """
+        if event.num == 4 or event.delta > 0:
+            self.yview("scroll", -1, "units")
+        else:
+            self.yview("scroll", 1, "units")
+
+    def yview(self, *args):
+        """
+        Scroll the canvas and show the items that scrolled into view.
+
+        :param args: The scroll arguments from the scrollbar.
+        """
+        self.canvas.yview(*args)
+        self.render()
+
+    def set_items(self, items):
+        """
+        Replace every item in the list at once and scroll back to the top.
+
+        :param items: The list of items to show.
+        """
+        self.items = items if isinstance(items, list) else list(items)
+        self.canvas.configure(
+            scrollregion=(0, 0, 0, len(self.items) * self.row_height)
+        )
+        self.canvas.yview_moveto(0)
+        self.render()
+
+    def render(self):
+        """
+        Fill the row widgets with the items that can be seen.
+        """
+        width = self.canvas.winfo_width()
+
+        # One extra row for the one that is half scrolled into view
+        needed = self.canvas.winfo_height() // self.row_height + 2
+        while len(self.rows) < needed:
+            row = self.make_row(self.canvas)
+            self.bind_scroll(row)
+            for child in row.winfo_children():
+                self.bind_scroll(child)
+            window = self.canvas.create_window(
+                0, 0, window=row, anchor="nw", height=self.row_height
+            )
+            self.rows.append((window, row))
+
+        first = int(self.canvas.canvasy(0)) // self.row_height
+        for offset, (window, row) in enumerate(self.rows):
+            index = first + offset
+            if index < len(self.items):
+                self.canvas.coords(window, 0, index * self.row_height)
+                self.canvas.itemconfigure(window, state="normal", width=width)
+                self.fill_row(row, self.items[index])
+            else:
+                self.canvas.itemconfigure(window, state="hidden")
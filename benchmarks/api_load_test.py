@@ -0,0 +1,212 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program load tests the HTTP API. It starts Api_Server on fake
+clubs and events in a temporary folder, then many clients each send one
+request after another over a kept open connection for a few seconds. It
+reports the requests per second and the median, 90th and 99th percentile
+time of a request. A third of the requests send the ETag they got before,
+like a client checking for changes.
+
+Run it from the project folder with:
+    python -m benchmarks.api_load_test
+    python -m benchmarks.api_load_test --clients 50 --seconds 10
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from Database import migrate_events, save_to_file
+from benchmarks.synthetic import CAMPUSES, CATEGORIES, make_clubs
+
+PATHS = (
+    ["/clubs", "/clubs?limit=200", "/categories", "/events?limit=100"]
+    + [f"/clubs?campus={campus.replace(' ', '%20')}" for campus in CAMPUSES]
+    + [
+        f"/clubs?category={category.replace(' ', '%20').replace('&', '%26')}"
+        for category in CATEGORIES[:6]
+    ]
+    + ["/clubs?keyword=chess", "/clubs?favourite=true"]
+    + ["/events?from=2024-10-01&to=2024-10-31"]
+    + [f"/clubs/club-{i}" for i in range(0, 1000, 50)]
+)
+
+
+def free_port() -> int:
+    """
+    Finds a port nothing is listening on.
+
+    :return: The port.
+    """
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def request(reader, writer, path: str, etag: str = None) -> tuple:
+    """
+    Sends one request and reads the answer.
+
+    :param reader: The asyncio StreamReader of the connection.
+    :param writer: The asyncio StreamWriter of the connection.
+    :param path: The path and query.
+    :param etag: The ETag to send in If-None-Match, if any.
+    :return: A tuple of the status code and the ETag of the answer.
+    """
+    lines = [
+        f"GET {path} HTTP/1.1",
+        "Host: 127.0.0.1",
+        "Accept-Encoding: gzip",
+    ]
+    if etag:
+        lines.append(f"If-None-Match: {etag}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+    await writer.drain()
+
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    status = int(head.split(" ", 2)[1])
+    headers = {}
+    for line in head.split("\r\n")[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers.get("etag")
+
+
+async def client(port: int, deadline: float, seed: int, results: dict):
+    """
+    Sends requests one after another until the deadline.
+
+    :param port: The port of the server.
+    :param deadline: The time.perf_counter() to stop at.
+    :param seed: The random seed for this client.
+    :param results: A dictionary to add the times and status counts to.
+    """
+    rng = random.Random(seed)
+    etags = {}
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < deadline:
+            path = rng.choice(PATHS)
+            etag = etags.get(path) if rng.random() < 1 / 3 else None
+            start = time.perf_counter()
+            status, etags[path] = await request(reader, writer, path, etag)
+            results["times"].append((time.perf_counter() - start) * 1000)
+            results["status"][status] = results["status"].get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_clients(port: int, clients: int, seconds: float) -> dict:
+    """
+    Runs the clients at the same time.
+
+    :param port: The port of the server.
+    :param clients: How many clients.
+    :param seconds: How long to send requests for.
+    :return: A dictionary with the request times and status counts.
+    """
+    results = {"times": [], "status": {}}
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(
+        *[client(port, deadline, i, results) for i in range(clients)]
+    )
+    return results
+
+
+def wait_for_server(port: int, server, timeout: float = 60) -> None:
+    """
+    Waits until the server accepts connections.
+
+    :param port: The port of the server.
+    :param server: The server subprocess.
+    :param timeout: The most seconds to wait.
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("the server stopped")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("the server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the HTTP API.")
+    parser.add_argument("--clubs", type=int, default=10000)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    project_folder = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder:
+        # the fake data, with the events moved to events.json
+        os.chdir(folder)
+        try:
+            save_to_file(
+                "clubs.json", make_clubs(args.clubs, events_per_club=2)
+            )
+            save_to_file("events.json", [])
+            migrate_events()
+        finally:
+            os.chdir(project_folder)
+
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "Api_Server", "--port", str(port)],
+            cwd=folder,
+            env={
+                **os.environ,
+                "PYTHONPATH": os.pathsep.join(
+                    [project_folder, os.environ.get("PYTHONPATH", "")]
+                ),
+            },
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            wait_for_server(port, server)
+            results = asyncio.run(
+                run_clients(port, args.clients, args.seconds)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+    times = sorted(results["times"])
+    print(
+        f"{args.clubs} clubs, {args.clients} clients, {args.seconds:g} s, "
+        f"status counts {dict(sorted(results['status'].items()))}"
+    )
+    print(f"{len(times) / args.seconds:.0f} requests/s")
+    print(
+        f"p50 {statistics.median(times):.2f} ms, "
+        f"p90 {times[int(len(times) * 0.9)]:.2f} ms, "
+        f"p99 {times[int(len(times) * 0.99)]:.2f} ms, "
+        f"max {times[-1]:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program times how long the calendar takes to work out a month
+as the number of events grows. It compares the old scan over every event
+for every day with the date index. If a display is available, it also times
+a full ClubEventCalendar.displayCalendar and a Next/Previous month flip, and
+checks that flipping does not create new widgets.
+
+Run it from the project folder with:
+    python -m benchmarks.calendar_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from Calendar_View import EventIndex, MonthModelCache
+from benchmarks.synthetic import make_events
+
+EVENT_COUNTS = [100, 1000, 10000, 100000]
+YEAR, MONTH = 2024, 10
+REPEATS = 5
+
+
+def scan_month(events, year, month):
+    """
+    The old way: for every day, format the date and compare it to every event.
+
+    :param events: The list of event dictionaries.
+    :param year: The year of the month.
+    :param month: The month (1 to 12).
+    :return: A list with one list of events per day of the month.
+    """
+    firstDay = datetime(year, month, 1)
+    daysInMonth = (
+        firstDay.replace(month=month % 12 + 1, day=1) - timedelta(days=1)
+    ).day
+    month_events = []
+    for day in range(1, daysInMonth + 1):
+        formattedDate = datetime(year, month, day).strftime("%d %B, %Y")
+        month_events.append(
+            [event for event in events if event.get("date") == formattedDate]
+        )
+    return month_events
+
+
+def best_time(function):
+    """
+    Run a function a few times and keep the fastest time.
+
+    :param function: The function to time.
+    :return: The fastest time in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def count_widgets(widget):
+    """
+    Count a widget and everything inside it.
+
+    :param widget: The Tk widget to count from.
+    :return: The number of widgets.
+    """
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def wait_until_drawn(calendar):
+    """
+    Let Tk run until the calendar has drawn the month it is on, since the
+    month may still be made by the background thread.
+
+    :param calendar: The ClubEventCalendar.
+    """
+    while calendar.pendingMonth is not None:
+        calendar.update()
+    calendar.update_idletasks()
+
+
+def draw(calendar):
+    """
+    Display the current month and wait until it is drawn.
+
+    :param calendar: The ClubEventCalendar.
+    """
+    calendar.displayCalendar()
+    wait_until_drawn(calendar)
+
+
+def time_flips(calendar, flips=24):
+    """
+    Time flipping forward and back through the months.
+
+    :param calendar: The ClubEventCalendar to flip.
+    :param flips: The number of flips in each direction.
+    :return: A (mean ms per flip, widgets created) tuple.
+    """
+    calendar.update_idletasks()
+    widgets = count_widgets(calendar.calendarFrame)
+    start = time.perf_counter()
+    for _ in range(flips):
+        calendar.nextMonth()
+        wait_until_drawn(calendar)
+    for _ in range(flips):
+        calendar.previousMonth()
+        wait_until_drawn(calendar)
+    elapsed = (time.perf_counter() - start) * 1000 / (2 * flips)
+    return elapsed, count_widgets(calendar.calendarFrame) - widgets
+
+
+def make_calendar():
+    """
+    Make a hidden ClubEventCalendar, if there is a display to draw on.
+
+    :return: A (root, calendar) tuple, or (None, None) without a display.
+    """
+    try:
+        from tkinter import Tk
+        from Calendar_View import ClubEventCalendar
+
+        root = Tk()
+    except Exception:
+        return None, None
+    root.withdraw()
+    return root, ClubEventCalendar(root)
+
+
+def main():
+    root, calendar = make_calendar()
+    if calendar is None:
+        print("No display found, skipping the full render timings.\n")
+
+    print(
+        f"{'events':>8} {'scan ms':>10} {'index ms':>10} "
+        f"{'build ms':>10} {'render ms':>10} {'flip ms':>10} {'new widgets':>12}"
+    )
+    with tempfile.TemporaryDirectory() as folder:
+        for count in EVENT_COUNTS:
+            events = make_events(count)
+            filename = os.path.join(folder, f"events_{count}.json")
+            with open(filename, "w") as f:
+                json.dump(events, f)
+
+            index = EventIndex(filename)
+            start = time.perf_counter()
+            index.refresh()
+            build = (time.perf_counter() - start) * 1000
+
+            scan = best_time(lambda: scan_month(events, YEAR, MONTH))
+            indexed = best_time(lambda: index.eventsForMonth(YEAR, MONTH))
+
+            render, flip, created = "-", "-", "-"
+            if calendar is not None:
+                calendar.eventIndex = index
+                calendar.monthModels = MonthModelCache(index)
+                calendar.currentYear, calendar.currentMonth = YEAR, MONTH
+                render = f"{best_time(lambda: draw(calendar)):.2f}"
+                # The first pass may grow the label pools, so time the second
+                time_flips(calendar)
+                flip, created = time_flips(calendar)
+                flip = f"{flip:.2f}"
+
+            print(
+                f"{count:>8} {scan:>10.2f} {indexed:>10.3f} "
+                f"{build:>10.2f} {render:>10} {flip:>10} {created:>12}"
+            )
+
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
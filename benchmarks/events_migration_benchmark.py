@@ -0,0 +1,81 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program runs the one-time event migration on fake data, where
+every event is saved both inside its club and in events.json, and reports how
+much smaller the files get and how much faster the clubs file is to write.
+
+Run it from the project folder with:
+    python -m benchmarks.events_migration_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import os
+import tempfile
+import time
+
+from Database import load_from_file, migrate_events, save_to_file
+from benchmarks.synthetic import make_clubs
+
+CLUB_COUNTS = [1000, 10000]
+EVENTS_PER_CLUB = 5
+
+
+def time_write(filename: str) -> float:
+    """
+    Times writing a file back with the same data.
+
+    :param filename: The name of the file.
+    :return: The time in seconds.
+    """
+    data = load_from_file(filename)
+    start = time.perf_counter()
+    save_to_file(filename, data)
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'clubs':>7} {'events':>7} {'MB before':>10} {'MB after':>9} "
+        f"{'write ms before':>16} {'write ms after':>15}"
+    )
+    for count in CLUB_COUNTS:
+        clubs = make_clubs(count, events_per_club=EVENTS_PER_CLUB)
+        events = [event for club in clubs for event in club["events"]]
+
+        with tempfile.TemporaryDirectory() as folder:
+            clubs_file = os.path.join(folder, "clubs.json")
+            events_file = os.path.join(folder, "events.json")
+            save_to_file(clubs_file, clubs)
+            save_to_file(events_file, events)
+            # the time a favourite toggle takes to write the clubs file
+            write_before = time_write(clubs_file)
+
+            report = migrate_events(clubs_file, events_file)
+            write_after = time_write(clubs_file)
+
+            # every event is still there once, and every club points to it
+            migrated = load_from_file(events_file)
+            assert len(migrated) == len(events)
+            assert migrate_events(clubs_file, events_file) is None
+
+        print(
+            f"{count:>7} {len(events):>7} "
+            f"{report['bytes_before'] / 1024 / 1024:>10.1f} "
+            f"{report['bytes_after'] / 1024 / 1024:>9.1f} "
+            f"{write_before * 1000:>16.1f} "
+            f"{write_after * 1000:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
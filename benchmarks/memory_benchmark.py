@@ -0,0 +1,104 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program measures how much memory (resident set size) the clubs
+take once they are loaded, at 10k and 100k fake clubs. It compares loading
+clubs.json into Club objects the old way with the ClubStore, which leaves the
+descriptions in the memory-mapped descriptions file.
+
+Run it from the project folder with:
+    python -m benchmarks.memory_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.synthetic import make_clubs
+
+CLUB_COUNTS = [10000, 100000]
+
+# Runs in a fresh process inside the data folder and prints the RSS growth
+MEASURE_SCRIPT = """
+import gc, json, sys
+sys.path.insert(0, sys.argv[2])
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * __import__("os").sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+from Database import Club, load_from_file
+from Club_Store import ClubStore
+gc.collect()
+before = rss_mb()
+if sys.argv[1] == "json":
+    clubs = [Club(**club) for club in load_from_file("clubs.json")]
+    names = [club.get_name() for club in clubs]
+else:
+    store = ClubStore()
+    names = [club.get_name() for club in store.get_clubs()]
+gc.collect()
+print(json.dumps({"clubs": len(names), "rss_mb": rss_mb() - before}))
+"""
+
+
+def measure(mode, folder):
+    """
+    Load the clubs in a new process and measure the memory it took.
+
+    :param mode: "json" for the old way, "store" for the ClubStore.
+    :param folder: The folder with the data files.
+    :return: The dictionary printed by the process.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT, mode, os.getcwd()],
+        cwd=folder,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    if not os.path.exists("/proc/self/statm"):
+        print("This benchmark reads /proc/self/statm, so it needs Linux.")
+        return
+
+    print(
+        f"{'clubs':>8} {'json MB':>10} {'store MB':>10} {'json file MB':>13}"
+    )
+    for count in CLUB_COUNTS:
+        with tempfile.TemporaryDirectory() as folder:
+            with open(os.path.join(folder, "clubs.json"), "w") as f:
+                json.dump(make_clubs(count), f)
+            with open(os.path.join(folder, "events.json"), "w") as f:
+                json.dump([], f)
+
+            # the first store load writes the snapshot and descriptions file
+            measure("store", folder)
+
+            size = os.path.getsize(os.path.join(folder, "clubs.json"))
+            old = measure("json", folder)["rss_mb"]
+            new = measure("store", folder)["rss_mb"]
+            print(
+                f"{count:>8} {old:>10.1f} {new:>10.1f} "
+                f"{size / 1024 / 1024:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
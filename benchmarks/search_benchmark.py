@@ -0,0 +1,91 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program compares searching 10k and 100k fake clubs with
+filter_keywords, which reads every club, to the BM25 search index, which
+only reads the clubs that have one of the words. It reports the time to make
+the index and the median time of a search with each.
+
+Run it from the project folder with:
+    python -m benchmarks.search_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import os
+import statistics
+import tempfile
+import time
+
+from Database import filter_keywords, save_to_file
+from Club_Store import club_store
+from Club_Search import search_index
+from benchmarks.synthetic import make_clubs
+
+CLUB_COUNTS = [10000, 100000]
+QUERIES = ["data", "science club", "robotics volunteer", "zzz"]
+RUNS = 5
+
+
+def median_ms(function):
+    """
+    Run a function a few times and time it.
+
+    :param function: The function to run.
+    :return: The median time in milliseconds.
+    """
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    start_folder = os.getcwd()
+    print(
+        f"{'clubs':>7} {'query':>20} {'matches':>8} "
+        f"{'scan ms':>9} {'bm25 ms':>9}"
+    )
+    for count in CLUB_COUNTS:
+        with tempfile.TemporaryDirectory() as folder:
+            # the store and index use the files in the current folder
+            os.chdir(folder)
+            try:
+                save_to_file("clubs.json", make_clubs(count))
+                save_to_file("events.json", [])
+                clubs = club_store.get_clubs()
+
+                start = time.perf_counter()
+                search_index.refresh()
+                build_ms = (time.perf_counter() - start) * 1000
+                print(
+                    f"{count:>7} {'(index build)':>20} {'':>8} {'':>9} "
+                    f"{build_ms:>9.1f}"
+                )
+
+                for query in QUERIES:
+                    matches = len(filter_keywords(clubs, query.split()))
+                    scan_ms = median_ms(
+                        lambda: filter_keywords(clubs, query.split())
+                    )
+                    bm25_ms = median_ms(lambda: search_index.search(query))
+                    print(
+                        f"{count:>7} {query:>20} {matches:>8} "
+                        f"{scan_ms:>9.1f} {bm25_ms:>9.1f}"
+                    )
+            finally:
+                os.chdir(start_folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program compares the file formats save_to_file can write. For
+the real clubs.json and for 100k fake clubs, it times saving and loading in
+each format and reports the size of the file.
+
+Run it from the project folder with:
+    python -m benchmarks.serialization_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import os
+import tempfile
+import time
+
+from Database import (
+    CLUBS_FILE,
+    SAVE_FORMATS,
+    load_from_file,
+    optional_module,
+    save_to_file,
+)
+from benchmarks.synthetic import make_clubs
+
+SYNTHETIC_CLUBS = 100000
+
+
+def best_time(function, repeats):
+    """
+    Run a function a few times and keep the fastest time.
+
+    :param function: The function to time.
+    :param repeats: How many times to run it.
+    :return: The fastest time in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def compare_formats(name, data, repeats):
+    """
+    Print the save time, load time and size of the data in each format.
+
+    :param name: The name of the data, for the heading.
+    :param data: The list to save.
+    :param repeats: How many times to time each format.
+    """
+    print(f"\n{name} ({len(data)} clubs)")
+    print(f"{'format':>13} {'save ms':>10} {'load ms':>10} {'MB':>8}")
+    with tempfile.TemporaryDirectory() as folder:
+        for file_format in SAVE_FORMATS:
+            if file_format.startswith("msgpack") and not optional_module(
+                "msgpack"
+            ):
+                print(f"{file_format:>13} {'msgpack is not installed':>30}")
+                continue
+
+            filename = os.path.join(folder, f"clubs.{file_format}")
+            save = best_time(
+                lambda: save_to_file(filename, data, file_format), repeats
+            )
+            load = best_time(lambda: load_from_file(filename), repeats)
+            size = os.path.getsize(filename) / 1024 / 1024
+            print(
+                f"{file_format:>13} {save:>10.2f} {load:>10.2f} {size:>8.2f}"
+            )
+
+
+def main():
+    print(f"orjson installed: {optional_module('orjson') is not None}")
+    compare_formats(CLUBS_FILE, load_from_file(CLUBS_FILE), repeats=20)
+    compare_formats("synthetic", make_clubs(SYNTHETIC_CLUBS), repeats=2)
+
+
+if __name__ == "__main__":
+    main()
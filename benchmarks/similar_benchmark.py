@@ -0,0 +1,84 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program times working out the similar clubs of 10k and 100k
+fake clubs: making the TF-IDF vectors, then finding the neighbours. At 10k
+the hashed search is also compared to comparing every pair, by how similar
+the clubs it finds are on average.
+
+Run it from the project folder with:
+    python -m benchmarks.similar_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import time
+
+import numpy
+
+from Similar_Clubs import (
+    EXACT_LIMIT,
+    embed_clubs,
+    nearest_exact,
+    nearest_hashed,
+)
+from benchmarks.synthetic import make_clubs
+
+CLUB_COUNTS = [10000, 100000]
+
+
+def mean_similarity(vectors, neighbours) -> float:
+    """
+    Works out how similar the clubs found are to their club on average.
+
+    :param vectors: The club vectors.
+    :param neighbours: The positions of the similar clubs of each club.
+    :return: The average cosine similarity.
+    """
+    found = neighbours >= 0
+    rows = numpy.nonzero(found)[0]
+    return float(
+        numpy.einsum(
+            "ij,ij->i", vectors[rows], vectors[neighbours[found]]
+        ).mean()
+    )
+
+
+def main():
+    print(
+        f"{'clubs':>7} {'method':>8} {'embed s':>9} {'search s':>9} "
+        f"{'mean sim':>9}"
+    )
+    for count in CLUB_COUNTS:
+        clubs = make_clubs(count)
+
+        start = time.perf_counter()
+        vectors = embed_clubs(
+            [club["categories"] for club in clubs],
+            [club["description"] for club in clubs],
+        )
+        embed_s = time.perf_counter() - start
+
+        methods = [("hashed", nearest_hashed)]
+        if count <= EXACT_LIMIT:
+            methods.insert(0, ("exact", nearest_exact))
+        for name, method in methods:
+            start = time.perf_counter()
+            neighbours = method(vectors)
+            search_s = time.perf_counter() - start
+            print(
+                f"{count:>7} {name:>8} {embed_s:>9.2f} {search_s:>9.2f} "
+                f"{mean_similarity(vectors, neighbours):>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
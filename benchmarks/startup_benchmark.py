@@ -0,0 +1,91 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program times how long the app takes to start. Each run is a
+fresh Python process, so nothing is already imported or loaded. It reports
+the import time of the main program, which heavy modules got imported, and
+(if a display is available) the time until the first frame is drawn.
+
+Run it from the project folder with:
+    python -m benchmarks.startup_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+
+# Runs in a fresh process and prints its timings as JSON
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import Final_PY_Hundey_Zhang_Zhao as main
+imported = time.perf_counter()
+result = {
+    "import_ms": (imported - start) * 1000,
+    "scraper_imported": "requests" in sys.modules or "bs4" in sys.modules,
+    "first_frame_ms": None,
+}
+try:
+    app = main.MainApp()
+except Exception:
+    app = None  # No display to draw on
+if app is not None:
+    app.update()
+    result["first_frame_ms"] = (time.perf_counter() - start) * 1000
+    result["frames_built"] = len(app.frames)
+    app.destroy()
+print(json.dumps(result))
+"""
+
+
+def run_once():
+    """
+    Start the app once in a new process.
+
+    :return: The dictionary of timings from the process.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    results = [run_once() for _ in range(RUNS)]
+
+    imports = [result["import_ms"] for result in results]
+    print(
+        f"import time (ms): median {statistics.median(imports):.1f}, "
+        f"min {min(imports):.1f}, max {max(imports):.1f}"
+    )
+    print(f"scraper modules imported: {results[0]['scraper_imported']}")
+
+    frames = [result["first_frame_ms"] for result in results]
+    if None in frames:
+        print("time to first frame: skipped, no display found")
+    else:
+        print(
+            f"time to first frame (ms): median "
+            f"{statistics.median(frames):.1f}, min {min(frames):.1f}"
+        )
+        print(f"frames built at startup: {results[0]['frames_built']}")
+
+
+if __name__ == "__main__":
+    main()
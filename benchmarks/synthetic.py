@@ -0,0 +1,110 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program makes fake clubs and events in the same shape as
+clubs.json and events.json, so the benchmarks can run at any size.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import random
+from datetime import datetime, timedelta
+
+CAMPUSES = ["St George", "UTSC", "UTM"]
+CATEGORIES = [
+    "Athletics & Recreation",
+    "Spirituality & Faith Communities",
+    "Recognized Student Group",
+    "Academic",
+    "Social",
+    "Work & Career Development",
+    "Community Service",
+    "Culture & Identities",
+    "Student Governments, Councils & Unions",
+    "Leadership",
+    "Course Union",
+    "Hobby & Leisure",
+    "Media",
+    "Arts",
+    "Environment & Sustainability",
+    "Global Interests",
+    "Social Justice & Advocacy",
+    "Politics",
+]
+WORDS = (
+    "student society association club data science art music dance chess "
+    "debate robotics film health wellness community culture engineering "
+    "business finance coding volunteer outdoor hiking photography language "
+    "research medicine law politics environment sustainability games"
+).split()
+
+
+def make_events(count, seed=0, start=datetime(2024, 9, 1), days=365):
+    """
+    Make a list of fake event dictionaries.
+
+    :param count: The number of events to make.
+    :param seed: The random seed, so runs are repeatable.
+    :param start: The first date an event can be on.
+    :param days: The number of days the events are spread over.
+    :return: A list of event dictionaries.
+    """
+    rng = random.Random(seed)
+    events = []
+    for i in range(count):
+        date = start + timedelta(days=rng.randrange(days))
+        events.append(
+            {
+                "club": f"Club {rng.randrange(max(count // 3, 1))}",
+                "date": date.strftime("%d %B, %Y"),
+                "original_url": f"https://sop.utoronto.ca/event/event-{i}/",
+                "title": " ".join(rng.choices(WORDS, k=3)).title(),
+                "description": " ".join(rng.choices(WORDS, k=25)),
+            }
+        )
+    return events
+
+
+def make_clubs(count, seed=0, events_per_club=0, description_words=120):
+    """
+    Make a list of fake club dictionaries.
+
+    :param count: The number of clubs to make.
+    :param seed: The random seed, so runs are repeatable.
+    :param events_per_club: The number of events nested in each club.
+    :param description_words: The number of words in each description.
+    :return: A list of club dictionaries.
+    """
+    rng = random.Random(seed)
+    clubs = []
+    for i in range(count):
+        name = " ".join(rng.choices(WORDS, k=3)).title() + f" {i}"
+        events = make_events(events_per_club, seed=seed + i)
+        for number, event in enumerate(events):
+            event["club"] = name
+            event["original_url"] = (
+                f"https://sop.utoronto.ca/event/club-{i}-event-{number}/"
+            )
+        clubs.append(
+            {
+                "name": name,
+                "campus": rng.choice(CAMPUSES),
+                "description": " ".join(
+                    rng.choices(WORDS, k=description_words)
+                ),
+                "contacts": [f"mailto:club{i}@utoronto.ca"],
+                "categories": rng.sample(CATEGORIES, rng.randint(1, 4)),
+                "events": events,
+                "original_url": f"https://sop.utoronto.ca/group/club-{i}/",
+                "is_favourited": rng.random() < 0.05,
+            }
+        )
+    return clubs
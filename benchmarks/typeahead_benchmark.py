@@ -0,0 +1,94 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program checks that club name suggestions stay within the
+latency budget at 100k fake clubs. It types club names one key at a time,
+some of them with a typo, asks for suggestions after every key, and reports
+the median and 99th percentile time. It exits with an error if the 99th
+percentile is over LATENCY_BUDGET_MS.
+
+Run it from the project folder with:
+    python -m benchmarks.typeahead_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import random
+import statistics
+import sys
+import time
+
+from Type_Ahead import LATENCY_BUDGET_MS, TypeAheadIndex
+from benchmarks.synthetic import make_clubs
+
+CLUB_COUNT = 100000
+TYPED_NAMES = 500
+
+
+def add_typo(rng, text):
+    """
+    Swap, drop or change one letter of a word in the text.
+
+    :param rng: The random number generator.
+    :param text: The text.
+    :return: The text with one typo.
+    """
+    i = rng.randrange(1, len(text) - 1)
+    kind = rng.choice(["swap", "drop", "change"])
+    if kind == "swap":
+        return text[:i] + text[i + 1] + text[i] + text[i + 2 :]
+    if kind == "drop":
+        return text[:i] + text[i + 1 :]
+    return text[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + text[i + 1 :]
+
+
+def main():
+    rng = random.Random(0)
+    clubs = make_clubs(CLUB_COUNT, description_words=0)
+    items = [(club["name"], club["original_url"]) for club in clubs]
+
+    index = TypeAheadIndex()
+    start = time.perf_counter()
+    index.build(items)
+    print(
+        f"index for {CLUB_COUNT} clubs made in "
+        f"{time.perf_counter() - start:.2f} s"
+    )
+
+    times = []
+    empty = 0
+    for _ in range(TYPED_NAMES):
+        # the words of a name, without the number at the end
+        name = rng.choice(items)[0].rsplit(" ", 1)[0]
+        if rng.random() < 0.3:
+            name = add_typo(rng, name)
+        for end in range(1, len(name) + 1):
+            start = time.perf_counter()
+            results = index.suggest(name[:end])
+            times.append((time.perf_counter() - start) * 1000)
+            empty += not results
+
+    times.sort()
+    p50 = statistics.median(times)
+    p99 = times[int(len(times) * 0.99)]
+    print(f"{len(times)} keystrokes, {empty} without suggestions")
+    print(
+        f"p50 {p50:.3f} ms, p99 {p99:.3f} ms, max {times[-1]:.3f} ms, "
+        f"budget {LATENCY_BUDGET_MS} ms"
+    )
+
+    if p99 > LATENCY_BUDGET_MS:
+        print("FAILED: the 99th percentile is over the budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
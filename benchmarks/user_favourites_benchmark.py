@@ -0,0 +1,132 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program checks that the user favourites scale to tens of
+thousands of users. It makes fake users with a few favourites each, popular
+clubs more often, and reports the size of the file next to the same
+favourites as JSON lists of urls, the time to read it, and the time of the
+set operations.
+
+Run it from the project folder with:
+    python -m benchmarks.user_favourites_benchmark
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from Bitmap import Bitmap
+from Database import data_lock
+from User_Favourites import UserFavourites
+
+USER_COUNT = 20000
+CLUB_COUNT = 5000
+FRIENDS = 10
+RUNS = 20
+
+
+def median_ms(function):
+    """
+    Run a function a few times and time it.
+
+    :param function: The function to run.
+    :return: The median time in milliseconds.
+    """
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    rng = random.Random(0)
+    urls = [
+        f"https://sop.utoronto.ca/group/club-{i}/" for i in range(CLUB_COUNT)
+    ]
+    # a few clubs are liked by many people, most by a few
+    weights = [1 / (i + 1) for i in range(CLUB_COUNT)]
+    favourites = {
+        f"user{i}": set(
+            rng.choices(range(CLUB_COUNT), weights, k=rng.randint(1, 40))
+        )
+        for i in range(USER_COUNT)
+    }
+
+    start_folder = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder:
+        # the favourites use the files in the current folder
+        os.chdir(folder)
+        try:
+            store = UserFavourites()
+            with data_lock():
+                store.urls = urls
+                store.ids = {url: i for i, url in enumerate(urls)}
+                store.users = {
+                    user: Bitmap(ids) for user, ids in favourites.items()
+                }
+                store.save(new_ids=True)
+
+            size = os.path.getsize(store.filename)
+            as_json = len(
+                json.dumps(
+                    {
+                        user: [urls[i] for i in sorted(ids)]
+                        for user, ids in favourites.items()
+                    }
+                )
+            )
+            print(f"{USER_COUNT} users, {CLUB_COUNT} clubs")
+            print(
+                f"file {size / 1024:.0f} KB, as JSON url lists "
+                f"{as_json / 1024:.0f} KB"
+            )
+
+            start = time.perf_counter()
+            store = UserFavourites()
+            store.refresh()
+            print(f"read in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+            friends = rng.sample(sorted(favourites), FRIENDS)
+            print(
+                f"liked by all {FRIENDS} friends: "
+                f"{median_ms(lambda: store.common_favourites(friends)):.3f} ms"
+            )
+            print(
+                f"liked by any of {FRIENDS} friends: "
+                f"{median_ms(lambda: store.any_favourites(friends)):.3f} ms"
+            )
+            start = time.perf_counter()
+            counts = store.favourite_counts()
+            print(
+                f"counts per club for every user: "
+                f"{(time.perf_counter() - start) * 1000:.0f} ms, "
+                f"most liked club has {max(counts.values())}"
+            )
+
+            start = time.perf_counter()
+            store.favourite("user0", urls[-1])
+            print(
+                f"one favourite saved in "
+                f"{(time.perf_counter() - start) * 1000:.0f} ms"
+            )
+        finally:
+            os.chdir(start_folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program sets up the tests. The modules are in the project
+folder, not a package, and the data files are found from the working folder,
+so each test runs in its own empty folder. Run the tests from the project
+folder with:
+    python -m pytest -q
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def data_folder(tmp_path, monkeypatch):
+    """
+    Runs a test in an empty folder, so it never touches the real data files.
+
+    :return: The folder.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,103 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests how the HTTP API cuts lists into pages, and that
+following the cursors gives every item once.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import json
+from urllib.parse import quote
+
+import pytest
+
+from Api_Server import MAX_PAGE_SIZE, PAGE_SIZE, ApiError, ClubApi
+from Database import migrate_events, save_to_file
+from benchmarks.synthetic import make_clubs
+
+
+def all_pages(api: ClubApi, items: list, version: str, **params) -> list:
+    """
+    Follows the cursors from the first page to the last.
+
+    :param api: The ClubApi.
+    :param items: The whole list.
+    :param version: The data version.
+    :param params: The query parameters, e.g. limit.
+    :return: The list of pages.
+    """
+    params = {name: [str(value)] for name, value in params.items()}
+    pages = [api.page(items, params, version)]
+    while pages[-1]["next_cursor"] is not None:
+        params["cursor"] = [pages[-1]["next_cursor"]]
+        pages.append(api.page(items, params, version))
+    return pages
+
+
+@pytest.mark.parametrize("count", [0, 1, PAGE_SIZE, PAGE_SIZE + 1, 237])
+@pytest.mark.parametrize("limit", [1, 7, PAGE_SIZE, MAX_PAGE_SIZE])
+def test_the_pages_hold_every_item_once(count, limit):
+    items = list(range(count))
+    pages = all_pages(ClubApi(), items, "v1", limit=limit)
+
+    assert [item for page in pages for item in page["items"]] == items
+    assert all(len(page["items"]) == limit for page in pages[:-1])
+    assert all(page["total"] == count for page in pages)
+    assert len(pages) == max(1, -(-count // limit))
+
+
+def test_the_default_page_size():
+    page = ClubApi().page(list(range(PAGE_SIZE * 2)), {}, "v1")
+    assert page["items"] == list(range(PAGE_SIZE))
+
+
+@pytest.mark.parametrize("limit", ["0", str(MAX_PAGE_SIZE + 1), "ten"])
+def test_a_bad_limit_is_refused(limit):
+    with pytest.raises(ApiError) as error:
+        ClubApi().page([1, 2, 3], {"limit": [limit]}, "v1")
+    assert error.value.status == 400
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", "djE6eA==", "Zm9v"])
+def test_a_bad_cursor_is_refused(cursor):
+    with pytest.raises(ApiError) as error:
+        ClubApi().page([1, 2, 3], {"cursor": [cursor]}, "v1")
+    assert error.value.status == 400
+
+
+def test_a_cursor_from_other_data_is_gone():
+    api = ClubApi()
+    first = api.page(list(range(10)), {"limit": ["3"]}, "v1")
+    params = {"cursor": [first["next_cursor"]]}
+
+    with pytest.raises(ApiError) as error:
+        api.page(list(range(10)), params, "v2")
+    assert error.value.status == 410
+
+
+def test_paging_through_the_clubs():
+    save_to_file("clubs.json", make_clubs(30, events_per_club=1))
+    save_to_file("events.json", [])
+    migrate_events("clubs.json", "events.json")
+
+    api = ClubApi()
+    names = []
+    target = "/clubs?limit=7"
+    while target:
+        status, headers, body = api.handle("GET", target, {})
+        assert status == 200
+        page = json.loads(body)
+        names.extend(club["name"] for club in page["items"])
+        cursor = page["next_cursor"]
+        target = cursor and f"/clubs?limit=7&cursor={quote(cursor)}"
+
+    assert len(names) == len(set(names)) == page["total"] == 30
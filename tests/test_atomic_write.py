@@ -0,0 +1,68 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests atomic_write, which replaces a file in one step
+so a crash never leaves it half written.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import os
+
+import pytest
+
+from Database import atomic_write
+
+
+def test_writes_a_new_file(data_folder):
+    with atomic_write("clubs.json") as f:
+        f.write(b"[]")
+
+    assert (data_folder / "clubs.json").read_bytes() == b"[]"
+    assert os.listdir(data_folder) == ["clubs.json"]
+
+
+def test_replaces_the_file_and_keeps_its_permissions(data_folder):
+    path = data_folder / "clubs.json"
+    path.write_bytes(b"old")
+    path.chmod(0o600)
+
+    with atomic_write("clubs.json") as f:
+        f.write(b"new")
+
+    assert path.read_bytes() == b"new"
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_the_old_file_stays_until_the_block_ends(data_folder):
+    path = data_folder / "clubs.json"
+    path.write_bytes(b"old")
+
+    with atomic_write("clubs.json") as f:
+        f.write(b"new")
+        assert path.read_bytes() == b"old"
+
+    assert path.read_bytes() == b"new"
+
+
+def test_an_error_keeps_the_old_file_and_removes_the_temporary_one(
+    data_folder,
+):
+    path = data_folder / "clubs.json"
+    path.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_write("clubs.json") as f:
+            f.write(b"half")
+            raise RuntimeError("crash")
+
+    assert path.read_bytes() == b"old"
+    assert os.listdir(data_folder) == ["clubs.json"]
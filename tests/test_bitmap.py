@@ -0,0 +1,112 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests the Bitmap against Python sets of the same
+numbers, with containers that are arrays and containers that are bits.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import random
+
+import pytest
+
+from Bitmap import ARRAY_LIMIT, CONTAINER_SIZE, Bitmap
+
+
+def random_numbers(rng: random.Random) -> set:
+    """
+    Makes numbers spread over a few containers: one with few numbers (an
+    array), one with many (bits) and one in a far away container.
+
+    :param rng: The random number generator.
+    :return: A set of numbers.
+    """
+    few = rng.sample(range(CONTAINER_SIZE), rng.randrange(1, 100))
+    many = rng.sample(
+        range(CONTAINER_SIZE, 2 * CONTAINER_SIZE),
+        rng.randrange(ARRAY_LIMIT - 50, ARRAY_LIMIT + 3000),
+    )
+    far = rng.sample(range(60000 * CONTAINER_SIZE, 2**32), 20)
+    return set(few) | set(many) | set(far)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_a_set(seed):
+    rng = random.Random(seed)
+    a, b = random_numbers(rng), random_numbers(rng)
+    bitmap_a, bitmap_b = Bitmap(a), Bitmap(b)
+
+    assert list(bitmap_a) == sorted(a)
+    assert len(bitmap_a) == len(a)
+    assert list(bitmap_a & bitmap_b) == sorted(a & b)
+    assert list(bitmap_a | bitmap_b) == sorted(a | b)
+    assert list(bitmap_a - bitmap_b) == sorted(a - b)
+    assert bitmap_a.intersection_len(bitmap_b) == len(a & b)
+    for number in rng.sample(range(2 * CONTAINER_SIZE), 1000):
+        assert (number in bitmap_a) == (number in a)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_add_and_discard_match_a_set(seed):
+    rng = random.Random(seed)
+    numbers = set()
+    bitmap = Bitmap()
+    # enough numbers in one container to turn it into bits and back
+    for _ in range(3 * ARRAY_LIMIT):
+        number = rng.randrange(2 * ARRAY_LIMIT)
+        if rng.random() < 0.6:
+            numbers.add(number)
+            bitmap.add(number)
+        else:
+            numbers.discard(number)
+            bitmap.discard(number)
+    assert list(bitmap) == sorted(numbers)
+    assert bitmap == Bitmap(numbers)
+
+
+def test_a_container_turns_into_bits_and_back():
+    bitmap = Bitmap(range(ARRAY_LIMIT))
+    assert not isinstance(bitmap.containers[0], int)
+
+    bitmap.add(ARRAY_LIMIT)
+    assert isinstance(bitmap.containers[0], int)
+
+    bitmap.discard(0)
+    assert not isinstance(bitmap.containers[0], int)
+    assert list(bitmap) == list(range(1, ARRAY_LIMIT + 1))
+
+
+def test_empty_containers_are_removed():
+    bitmap = Bitmap([5, CONTAINER_SIZE + 5])
+    bitmap.discard(5)
+    assert list(bitmap.containers) == [1]
+    assert not bitmap - Bitmap([CONTAINER_SIZE + 5])
+    assert Bitmap() == Bitmap([1]) & Bitmap([2])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_to_bytes_and_back(seed):
+    numbers = random_numbers(random.Random(seed))
+    data = Bitmap(numbers).to_bytes()
+
+    assert Bitmap.from_bytes(data) == Bitmap(numbers)
+    assert list(Bitmap.from_bytes(memoryview(data))) == sorted(numbers)
+    assert Bitmap.from_bytes(Bitmap().to_bytes()) == Bitmap()
+
+
+def test_results_do_not_share_containers():
+    a = Bitmap([1, 2])
+    b = Bitmap([CONTAINER_SIZE + 1])
+    union = a | b
+    union.add(3)
+    (a - b).add(4)
+    assert list(a) == [1, 2]
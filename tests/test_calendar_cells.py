@@ -0,0 +1,145 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests that flipping through the months of the calendar
+reuses its day cells and event labels, and that they show the right days and
+events. It needs a display, and is skipped without one.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from benchmarks.synthetic import make_events
+
+tkinter = pytest.importorskip("tkinter")
+
+# the first month with events, and how many months to flip through
+YEAR, MONTH = 2024, 9
+FLIPS = 12
+
+
+@pytest.fixture
+def calendar():
+    """
+    Makes a calendar for some events.
+
+    :return: The ClubEventCalendar, on the first month with events.
+    """
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        pytest.skip("no display")
+    events = make_events(300)
+    with open("events.json", "w") as f:
+        json.dump(events, f)
+
+    from Calendar_View import ClubEventCalendar
+
+    calendar = ClubEventCalendar(root)
+    show(calendar, YEAR, MONTH)
+    yield calendar
+    root.destroy()
+
+
+def show(calendar, year: int, month: int) -> None:
+    """
+    Shows a month and lets Tk run until it is drawn, since the month can be
+    made in the background.
+
+    :param calendar: The ClubEventCalendar.
+    :param year: The year.
+    :param month: The month (1 to 12).
+    """
+    calendar.currentYear, calendar.currentMonth = year, month
+    calendar.displayCalendar()
+    title = datetime(year, month, 1).strftime("%B %Y")
+    deadline = time.monotonic() + 10
+    while calendar.monthYearLabel.cget("text") != title:
+        assert time.monotonic() < deadline
+        calendar.update()
+    calendar.update_idletasks()
+
+
+def all_widgets(widget) -> list:
+    """
+    Gets a widget and everything in it.
+
+    :param widget: A Tk widget.
+    :return: The list of widgets.
+    """
+    widgets = [widget]
+    for child in widget.winfo_children():
+        widgets.extend(all_widgets(child))
+    return widgets
+
+
+def flip(calendar) -> None:
+    """
+    Goes forward FLIPS months and back again.
+
+    :param calendar: The ClubEventCalendar.
+    """
+    for _ in range(FLIPS):
+        year, month = divmod(
+            calendar.currentYear * 12 + calendar.currentMonth, 12
+        )
+        show(calendar, year, month + 1)
+    for _ in range(FLIPS):
+        year, month = divmod(
+            calendar.currentYear * 12 + calendar.currentMonth - 2, 12
+        )
+        show(calendar, year, month + 1)
+
+
+def test_flipping_reuses_the_cells(calendar):
+    flip(calendar)
+    widgets = all_widgets(calendar)
+    flip(calendar)
+    after = all_widgets(calendar)
+    assert len(after) == len(widgets)
+    assert all(a is b for a, b in zip(after, widgets))
+
+
+def test_the_cells_show_the_days_and_their_events(calendar):
+    for offset in range(FLIPS):
+        year, month = divmod(YEAR * 12 + MONTH - 1 + offset, 12)
+        month += 1
+        show(calendar, year, month)
+
+        shown = []
+        for cell in calendar.dayCells:
+            if not cell["frame"].winfo_manager():
+                continue
+            labels = cell["events"][: cell["shown"]]
+            assert all(label.winfo_manager() for label in labels)
+            shown.append(
+                (
+                    int(cell["label"].cget("text")),
+                    [label.cget("text") for label in labels],
+                )
+            )
+
+        days = [
+            (day, [event["title"] for event in events])
+            for day, events in enumerate(
+                calendar.eventIndex.eventsForMonth(year, month), start=1
+            )
+        ]
+        assert shown == days
+
+        # the 1st is in the column of its weekday, Monday first
+        visible = [c["frame"].winfo_manager() for c in calendar.dayCells]
+        assert visible.index("grid") == datetime(year, month, 1).weekday()
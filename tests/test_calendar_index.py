@@ -0,0 +1,82 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests the calendar's events grouped by date against
+going through every event, and that the events are only grouped again when
+the events file changes.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import json
+from datetime import datetime
+
+from Calendar_View import EventIndex, buildEventIndex
+from benchmarks.synthetic import make_events
+
+# not the app's events file, so the calendar reads this file itself
+FILENAME = "calendar_events.json"
+
+
+def write_events(events: list) -> None:
+    """
+    Writes events to the test file.
+
+    :param events: The list of event dictionaries.
+    """
+    with open(FILENAME, "w") as f:
+        json.dump(events, f)
+
+
+def events_on(events: list, year: int, month: int, day: int) -> list:
+    """
+    Finds the events on a day by going through every event.
+
+    :param events: The list of event dictionaries.
+    :param year: The year.
+    :param month: The month (1 to 12).
+    :param day: The day of the month.
+    :return: The list of events, in the same order as events.
+    """
+    date = datetime(year, month, day).strftime("%d %B, %Y")
+    return [event for event in events if event.get("date") == date]
+
+
+def test_every_month_matches_going_through_the_events():
+    events = make_events(400, days=120)
+    events.append({"title": "No date"})
+    events.append({"title": "Bad date", "date": "sometime soon"})
+    write_events(events)
+    index = EventIndex(FILENAME)
+
+    for year, month in [(2024, m) for m in range(8, 13)] + [(2025, 1)]:
+        days = index.eventsForMonth(year, month)
+        for day, day_events in enumerate(days, start=1):
+            assert day_events == events_on(events, year, month, day)
+    assert sum(len(day) for day in buildEventIndex(events).values()) == 400
+
+
+def test_the_events_are_only_grouped_again_when_the_file_changes():
+    write_events(make_events(50))
+    index = EventIndex(FILENAME)
+    assert index.refresh()
+    assert not index.refresh()
+
+    events = make_events(60, seed=1)
+    write_events(events)
+    assert index.refresh()
+    assert index.getEvents() == events
+
+
+def test_a_missing_file_has_no_events():
+    index = EventIndex(FILENAME)
+    assert index.getEvents() == []
+    assert index.eventsForMonth(2024, 2) == [[] for _ in range(29)]
@@ -0,0 +1,156 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests that the query engine finds the same clubs as
+checking every club against the whole query, whichever index it starts
+from, and that explain counts the clubs it finds.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import random
+from datetime import date, datetime
+
+import pytest
+
+from Club_Query import ClubQuery, QueryEngine
+from Club_Store import ClubStore
+from Database import make_event_id, save_to_file
+from benchmarks.synthetic import CAMPUSES, CATEGORIES, WORDS, make_clubs
+
+
+@pytest.fixture
+def engine():
+    """
+    Writes some clubs with events and makes a query engine for them.
+
+    :return: A (query engine, dictionary of original url -> list of event
+    dates) tuple.
+    """
+    clubs = make_clubs(300, events_per_club=2)
+    dates = {
+        club["original_url"]: [
+            datetime.strptime(event["date"], "%d %B, %Y").date()
+            for event in club["events"]
+        ]
+        for club in clubs
+    }
+    # the events are kept apart from the clubs, by id
+    events = []
+    for club in clubs:
+        for event in club["events"]:
+            event["event_id"] = make_event_id(event)
+            events.append(event)
+        club["events"] = [event["event_id"] for event in club["events"]]
+    save_to_file("clubs.json", clubs)
+    save_to_file("events.json", events)
+    store = ClubStore()
+    store.refresh()
+    return QueryEngine(store), dates
+
+
+def random_query(rng) -> ClubQuery:
+    """
+    Makes a query with a random mix of parts.
+
+    :param rng: The random number generator.
+    :return: The ClubQuery.
+    """
+    events_from = events_to = None
+    if rng.random() < 0.3:
+        events_from = date(2024, rng.randint(9, 12), rng.randint(1, 28))
+    if rng.random() < 0.3:
+        events_to = date(2025, rng.randint(1, 8), rng.randint(1, 28))
+    return ClubQuery(
+        campus=rng.choice([None, None] + CAMPUSES),
+        all_categories=rng.sample(CATEGORIES, rng.choice([0, 0, 1, 2])),
+        any_categories=rng.sample(CATEGORIES, rng.choice([0, 0, 2, 4])),
+        keywords=rng.sample(WORDS, rng.choice([0, 0, 1, 2])),
+        favourite=rng.choice([None, None, True, False]),
+        events_from=events_from,
+        events_to=events_to,
+    )
+
+
+def matches(club, query: ClubQuery, dates: list) -> bool:
+    """
+    Checks a club against every part of a query.
+
+    :param club: The Club object.
+    :param query: The ClubQuery.
+    :param dates: The dates of the club's events.
+    :return: True if the club matches.
+    """
+    categories = club.get_categories()
+    text = (club.get_name() + " " + club.get_description()).lower()
+    return (
+        query.campus in (None, club.get_campus())
+        and all(c in categories for c in query.all_categories)
+        and (
+            not query.any_categories
+            or any(c in categories for c in query.any_categories)
+        )
+        and (not query.keywords or any(k in text for k in query.keywords))
+        and query.favourite in (None, club.get_is_favourited())
+        and (
+            not query.has_dates()
+            or any(
+                (query.events_from is None or day >= query.events_from)
+                and (query.events_to is None or day <= query.events_to)
+                for day in dates
+            )
+        )
+    )
+
+
+def test_queries_find_the_same_clubs_as_checking_every_club(engine):
+    engine, dates = engine
+    rng = random.Random(0)
+    sources = set()
+    for _ in range(300):
+        query = random_query(rng)
+        expected = [
+            club
+            for club in engine.store.clubs
+            if matches(club, query, dates[club.get_original_url()])
+        ]
+        assert list(engine.run(query)) == expected
+        sources.add(engine.plan(query)["source"]["name"].split()[0])
+
+    # every kind of index was started from at least once
+    assert sources == {
+        "all",
+        "any",
+        "campus",
+        "category",
+        "events",
+        "favourites",
+    }
+
+
+def test_the_smallest_index_is_started_from(engine):
+    engine, dates = engine
+    query = ClubQuery(campus="UTM", all_categories=[CATEGORIES[0]])
+    plan = engine.plan(query)
+    category = len(engine.store.by_category[("UTM", CATEGORIES[0])])
+    assert plan["source"]["estimate"] == category
+    assert category < len(engine.by_campus["UTM"])
+
+
+def test_explain_counts_the_clubs_found(engine):
+    engine, dates = engine
+    rng = random.Random(1)
+    for _ in range(20):
+        query = random_query(rng)
+        found = len(list(engine.run(query)))
+        lines = engine.explain(query).splitlines()
+        assert lines[0].startswith("source")
+        assert lines[-1] == f"result  {found} clubs"
@@ -0,0 +1,137 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests the BM25 club search against scoring every club
+with the formula, and that the weights and lengths put the clubs in the
+order they should be in.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import math
+import random
+
+import pytest
+
+from Club_Search import (
+    B,
+    CATEGORY_WEIGHT,
+    DESCRIPTION_WEIGHT,
+    K1,
+    NAME_WEIGHT,
+    SearchIndex,
+    tokenize,
+)
+from Club_Store import ClubStore
+from Database import save_to_file
+from benchmarks.synthetic import WORDS, make_clubs
+
+
+def make_index(clubs: list) -> SearchIndex:
+    """
+    Writes clubs and makes a search index for them.
+
+    :param clubs: The list of club dictionaries.
+    :return: The SearchIndex.
+    """
+    save_to_file("clubs.json", clubs)
+    save_to_file("events.json", [])
+    return SearchIndex(ClubStore())
+
+
+def bm25_scores(clubs: list, text: str) -> list:
+    """
+    Scores every club for some words, straight from the BM25 formula.
+
+    :param clubs: The list of Club objects.
+    :param text: The words searched for.
+    :return: The score of each club, 0 if it has none of the words.
+    """
+    counts = []
+    for club in clubs:
+        club_counts = {}
+        for part, weight in (
+            (club.get_name(), NAME_WEIGHT),
+            (" ".join(club.get_categories()), CATEGORY_WEIGHT),
+            (club.get_description(), DESCRIPTION_WEIGHT),
+        ):
+            for word in tokenize(part):
+                club_counts[word] = club_counts.get(word, 0) + weight
+        counts.append(club_counts)
+    lengths = [sum(club_counts.values()) for club_counts in counts]
+    average = sum(lengths) / len(lengths)
+
+    scores = []
+    for club_counts, length in zip(counts, lengths):
+        score = 0.0
+        for word in set(tokenize(text)):
+            having = sum(word in other for other in counts)
+            if word not in club_counts:
+                continue
+            idf = math.log(1 + (len(counts) - having + 0.5) / (having + 0.5))
+            count = club_counts[word]
+            score += idf * (
+                count
+                * (K1 + 1)
+                / (count + K1 * (1 - B + B * length / average))
+            )
+        scores.append(score)
+    return scores
+
+
+@pytest.mark.parametrize("k", [1, 5, 20])
+def test_the_best_clubs_match_the_formula(k):
+    index = make_index(make_clubs(200, description_words=40))
+    rng = random.Random(0)
+    for _ in range(30):
+        text = " ".join(rng.sample(WORDS, rng.randint(1, 3)))
+        results = index.search(text, k)
+        clubs = index.store.clubs
+        scores = bm25_scores(clubs, text)
+        best = sorted((s for s in scores if s > 0), reverse=True)[:k]
+
+        assert len(results) == len(best)
+        for (club, score), expected in zip(results, best):
+            assert score == pytest.approx(expected, rel=1e-4)
+            assert score == pytest.approx(scores[clubs.index(club)], rel=1e-4)
+
+
+def test_a_word_counts_more_in_the_name_and_in_shorter_clubs():
+    clubs = make_clubs(4, description_words=20)
+    for club in clubs:
+        club["name"] = "Student Society"
+        club["categories"] = ["Social"]
+        club["description"] = "games " * 20
+    clubs[0]["description"] = "games " * 20 + "chess"
+    clubs[1]["name"] = "Chess Society"
+    clubs[2]["description"] = "games " * 5 + "chess"
+    index = make_index(clubs)
+
+    order = [club for club, score in index.search("chess")]
+    assert order == [index.store.clubs[i] for i in (1, 2, 0)]
+
+
+def test_ties_keep_the_order_of_the_clubs():
+    clubs = make_clubs(6, description_words=20)
+    for club in clubs:
+        club["name"] = "Chess Club"
+        club["categories"] = ["Social"]
+        club["description"] = "chess " * 10
+    index = make_index(clubs)
+    assert [club for club, score in index.search("chess", 4)] == (
+        index.store.clubs[:4]
+    )
+
+
+def test_unknown_words_find_nothing():
+    index = make_index(make_clubs(20))
+    assert index.search("zzzz qqqq") == []
+    assert index.search("") == []
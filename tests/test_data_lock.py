@@ -0,0 +1,173 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests the lock on the data files, the log of changes
+other apps catch up from, and that a favourite made in another app is
+kept and picked up without reloading every club.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from Club_Store import ClubStore
+from Database import (
+    CHANGES_FILE,
+    CLUBS_FILE,
+    EVENTS_FILE,
+    changes_since,
+    data_lock,
+    flush_writes,
+    get_generation,
+    optional_module,
+    read_data_file,
+    record_change,
+    save_to_file,
+    update_later,
+)
+from benchmarks.synthetic import make_clubs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def other_app(code: str) -> subprocess.Popen:
+    """
+    Runs some code in another Python process, in the same folder.
+
+    :param code: The code, with the modules of the project importable.
+    :return: The process, with its output readable from stdout.
+    """
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\nsys.path.insert(0, {ROOT!r})\n" + code,
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def make_files(count: int = 10) -> list:
+    """
+    Writes clubs that are not favourited and an empty events file.
+
+    :param count: The number of clubs.
+    :return: The list of club dictionaries.
+    """
+    clubs = make_clubs(count)
+    for club in clubs:
+        club["is_favourited"] = False
+    save_to_file(CLUBS_FILE, clubs)
+    save_to_file(EVENTS_FILE, [])
+    return clubs
+
+
+def test_changes_are_numbered_and_read_back_in_order():
+    start = get_generation()
+    for i in range(5):
+        assert record_change("test.json", "id", {i: {"n": i}}) == start + i + 1
+
+    changes = changes_since(start)
+    assert [change["generation"] for change in changes] == list(
+        range(start + 1, start + 6)
+    )
+    assert [change["changes"] for change in changes[2:]] == [
+        {str(i): {"n": i}} for i in range(2, 5)
+    ]
+    assert changes_since(start + 5) == []
+
+
+def test_missing_changes_mean_reading_everything_again():
+    record_change("test.json")
+    record_change("test.json")
+    os.remove(CHANGES_FILE)
+    assert changes_since(0) is None
+
+
+def test_the_same_thread_can_take_the_lock_again():
+    with data_lock():
+        with data_lock():
+            record_change("test.json")
+    assert get_generation() == 1
+
+
+@pytest.mark.skipif(
+    optional_module("fcntl") is None, reason="only threads are locked"
+)
+def test_another_app_holding_the_lock_is_waited_for():
+    app = other_app(
+        "import time\n"
+        "from Database import data_lock\n"
+        "with data_lock():\n"
+        "    print('locked', flush=True)\n"
+        "    time.sleep(0.5)\n"
+    )
+    assert app.stdout.readline().strip() == "locked"
+    start = time.perf_counter()
+    with data_lock():
+        waited = time.perf_counter() - start
+    app.wait(timeout=30)
+    assert waited > 0.2
+
+
+def test_favourites_from_two_apps_are_both_kept():
+    clubs = make_files()
+    update_later(
+        CLUBS_FILE,
+        "original_url",
+        clubs[0]["original_url"],
+        {"is_favourited": True},
+    )
+    app = other_app(
+        "from Database import CLUBS_FILE, flush_writes, update_later\n"
+        f"update_later(CLUBS_FILE, 'original_url', "
+        f"{clubs[1]['original_url']!r}, {{'is_favourited': True}})\n"
+        "flush_writes()\n"
+    )
+    assert app.wait(timeout=30) == 0
+    flush_writes()
+
+    favourites = [club["is_favourited"] for club in read_data_file(CLUBS_FILE)]
+    assert favourites[:2] == [True, True]
+    assert not any(favourites[2:])
+
+
+def test_a_favourite_is_picked_up_without_reloading():
+    clubs = make_files()
+    store = ClubStore()
+    store.refresh()
+    loaded = store.clubs
+
+    app = other_app(
+        "from Database import CLUBS_FILE, flush_writes, update_later\n"
+        f"update_later(CLUBS_FILE, 'original_url', "
+        f"{clubs[2]['original_url']!r}, {{'is_favourited': True}})\n"
+        "flush_writes()\n"
+    )
+    assert app.wait(timeout=30) == 0
+
+    assert store.refresh()
+    assert store.clubs is loaded
+    assert [club.get_is_favourited() for club in store.clubs].count(True) == 1
+    assert store.by_url[clubs[2]["original_url"]].get_is_favourited()
+
+    # any other change reloads the clubs
+    clubs[0]["name"] = "Renamed Club"
+    save_to_file(CLUBS_FILE, clubs)
+    assert store.refresh()
+    assert store.clubs is not loaded
+    assert store.clubs[0].get_name() == "Renamed Club"
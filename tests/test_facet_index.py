@@ -0,0 +1,94 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests the category and campus counts against counting
+the clubs one by one, before and after clubs are favourited.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import random
+
+from Club_Store import ClubStore
+from Database import save_to_file
+from Facet_Index import FacetIndex
+from benchmarks.synthetic import make_clubs
+
+
+def make_index() -> tuple:
+    """
+    Writes some clubs and makes a store and facet index for them.
+
+    :return: A (store, facet index) tuple.
+    """
+    save_to_file("clubs.json", make_clubs(300))
+    save_to_file("events.json", [])
+    store = ClubStore()
+    return store, FacetIndex(store)
+
+
+def check_counts(store: ClubStore, facets: FacetIndex, rng) -> None:
+    """
+    Compares every kind of count with counting the clubs one by one.
+
+    :param store: The ClubStore.
+    :param facets: The FacetIndex of the store.
+    :param rng: The random number generator that picks the interests.
+    """
+    catalog = store.get_catalog()
+    for campus in [None] + sorted({c.get_campus() for c in store.clubs}):
+        clubs = [c for c in store.clubs if campus in (None, c.get_campus())]
+        assert facets.campus_count(campus) == len(clubs)
+        assert facets.campus_count(campus, True) == sum(
+            c.get_is_favourited() for c in clubs
+        )
+
+        for interests in ([], rng.sample(catalog, 1), rng.sample(catalog, 3)):
+            counts, favourites = facets.counts_with_interests(
+                catalog, campus, interests
+            )
+            for category in catalog:
+                found = [
+                    c
+                    for c in clubs
+                    if category in c.get_categories()
+                    and (
+                        not interests
+                        or set(interests) & set(c.get_categories())
+                    )
+                ]
+                assert counts[category] == len(found)
+                assert favourites[category] == sum(
+                    c.get_is_favourited() for c in found
+                )
+
+
+def test_counts_match_the_clubs():
+    store, facets = make_index()
+    check_counts(store, facets, random.Random(0))
+
+
+def test_favourites_are_counted_without_counting_again():
+    store, facets = make_index()
+    rng = random.Random(1)
+    check_counts(store, facets, rng)
+    loads = facets.loads
+
+    for _ in range(100):
+        club = rng.choice(store.clubs)
+        club.set_is_favourited(not club.get_is_favourited())
+        store.favourite_changed(club)
+        # the same change can be told twice
+        if rng.random() < 0.2:
+            store.favourite_changed(club)
+
+    check_counts(store, facets, rng)
+    assert facets.loads == loads
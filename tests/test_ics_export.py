@@ -0,0 +1,93 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests how the iCalendar export escapes text and folds
+long lines.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import datetime
+
+import pytest
+
+from Ics_Export import LINE_BYTES, escape_text, fold_line, ics_lines
+
+
+def unfold(text: str) -> str:
+    """
+    Joins folded lines again, the way a calendar app reads them.
+
+    :param text: The folded lines.
+    :return: The lines, with CRLF line endings.
+    """
+    return text.replace("\r\n ", "")
+
+
+@pytest.mark.parametrize(
+    "text, escaped",
+    [
+        ("plain text", "plain text"),
+        ("a, b; c", "a\\, b\\; c"),
+        ("back\\slash", "back\\\\slash"),
+        ("one\ntwo\r\nthree", "one\\ntwo\\nthree"),
+        ("\\n is not a new line", "\\\\n is not a new line"),
+    ],
+)
+def test_escape_text(text, escaped):
+    assert escape_text(text) == escaped
+
+
+def test_a_short_line_is_not_folded():
+    line = "x" * LINE_BYTES
+    assert fold_line(line) == line + "\r\n"
+
+
+@pytest.mark.parametrize("length", [LINE_BYTES + 1, 200, 1000])
+@pytest.mark.parametrize("letter", ["x", "é", "€", "🎉"])
+def test_a_long_line_is_folded(length, letter):
+    line = "DESCRIPTION:" + letter * length
+    folded = fold_line(line)
+
+    assert folded.endswith("\r\n")
+    assert unfold(folded) == line + "\r\n"
+    parts = folded[:-2].split("\r\n")
+    assert len(parts) > 1
+    assert all(part.startswith(" ") for part in parts[1:])
+    # encoding each part shows no character was split
+    assert all(len(part.encode("utf-8")) <= LINE_BYTES for part in parts)
+
+
+def test_ics_lines():
+    event = {
+        "event_id": "abc",
+        "club": "Chess Club",
+        "title": "Games, snacks; fun",
+        "description": "Bring a board.\n" + "Long text " * 20,
+        "original_url": "https://sop.utoronto.ca/event/games/",
+    }
+    date = datetime.datetime(2024, 10, 31)
+    stamp = datetime.datetime(2024, 10, 1, 12, 30)
+    text = "".join(ics_lines([(date, event)], stamp))
+
+    assert all(
+        len(line.encode("utf-8")) <= LINE_BYTES for line in text.split("\r\n")
+    )
+    lines = unfold(text).split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-2:] == ["END:VCALENDAR", ""]
+    assert "UID:abc@sop.utoronto.ca" in lines
+    assert "DTSTAMP:20241001T123000Z" in lines
+    assert "DTSTART;VALUE=DATE:20241031" in lines
+    assert "DTEND;VALUE=DATE:20241101" in lines
+    assert "SUMMARY:Games\\, snacks\\; fun" in lines
+    description = "Hosted by Chess Club\\n\\nBring a board.\\n"
+    assert f"DESCRIPTION:{description}{'Long text ' * 20}" in lines
@@ -0,0 +1,98 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests iter_json_list, which decodes a JSON list read
+in chunks. Every chunk size is tried, so every item is cut at every place.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import io
+import json
+
+import pytest
+
+from Database import iter_from_file, iter_json_list, save_to_file
+
+ITEMS = [
+    1.5,
+    -0.25e-3,
+    10,
+    0,
+    True,
+    False,
+    None,
+    "",
+    "plain",
+    'quote " and \\ backslash',
+    "commas, brackets ] [ and braces } {",
+    "new\nline\ttab é€\U0001f389",
+    [],
+    {},
+    [1, [2, [3.25, "x"]], {"a": [None]}],
+    {"name": "Chess Club", "events": [{"date": "31 October, 2024"}]},
+    12345678901234567890,
+]
+
+TEXTS = [
+    json.dumps(ITEMS),
+    json.dumps(ITEMS, indent=4),
+    json.dumps(ITEMS, ensure_ascii=False),
+    json.dumps(ITEMS, separators=(",", ":")),
+]
+
+
+def read_all(text: str, chunk_size: int) -> list:
+    """
+    Decodes a JSON list from text, a chunk at a time.
+
+    :param text: The JSON text.
+    :param chunk_size: How many characters to read at a time.
+    :return: The list of items.
+    """
+    return list(iter_json_list(io.StringIO(text), "test.json", chunk_size))
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_every_chunk_size(text):
+    for chunk_size in range(1, len(text) + 2):
+        assert read_all(text, chunk_size) == ITEMS, chunk_size
+
+
+@pytest.mark.parametrize(
+    "text, items",
+    [
+        ("[]", []),
+        ("  [ ]  ", []),
+        ("[1.5]", [1.5]),
+        ("[1.5 , 2e10\n]", [1.5, 2e10]),
+        ("[true,null]", [True, None]),
+        ("[-12]", [-12]),
+    ],
+)
+def test_small_lists(text, items):
+    for chunk_size in range(1, len(text) + 2):
+        assert read_all(text, chunk_size) == items
+
+
+@pytest.mark.parametrize(
+    "text", ["", "{}", "[1,", "[1.5", "[1 2]", "[1.]", '["open]', "[tru]"]
+)
+def test_broken_lists_are_refused(text):
+    for chunk_size in range(1, len(text) + 2):
+        with pytest.raises(ValueError):
+            read_all(text, chunk_size)
+
+
+def test_reading_a_saved_file():
+    items = [{"name": f"Club {i}", "score": i / 3} for i in range(500)]
+    save_to_file("clubs.json", items, "pretty")
+    assert list(iter_from_file("clubs.json", chunk_size=7)) == items
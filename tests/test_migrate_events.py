@@ -0,0 +1,122 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests migrate_events, which moves the events inside
+each club to the events file and leaves the clubs with only event ids, and
+that a club gives its events the same way before and after.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import datetime
+
+from Database import (
+    Club,
+    Event,
+    load_from_file,
+    make_event_id,
+    migrate_events,
+    save_to_file,
+)
+from benchmarks.synthetic import make_clubs, make_events
+
+
+def test_moves_events_out_of_the_clubs():
+    clubs = make_clubs(5, events_per_club=3)
+    save_to_file("clubs.json", clubs)
+    save_to_file("events.json", make_events(2))
+
+    sizes = migrate_events("clubs.json", "events.json")
+
+    assert sizes["bytes_before"] > 0 and sizes["bytes_after"] > 0
+    events = {
+        event["event_id"]: event for event in load_from_file("events.json")
+    }
+    assert len(events) == 2 + 15
+    for club, migrated in zip(clubs, load_from_file("clubs.json")):
+        ids = [make_event_id(event) for event in club["events"]]
+        assert migrated["events"] == ids
+        for event_id, event in zip(ids, club["events"]):
+            assert events[event_id] == {**event, "event_id": event_id}
+
+
+def test_an_event_in_both_files_is_kept_once():
+    clubs = make_clubs(2, events_per_club=2)
+    shared = dict(clubs[0]["events"][0])
+    save_to_file("clubs.json", clubs)
+    save_to_file("events.json", [shared] + make_events(3))
+
+    migrate_events("clubs.json", "events.json")
+
+    # 4 events in the events file and 4 in the clubs, one of them shared
+    ids = [event["event_id"] for event in load_from_file("events.json")]
+    assert len(ids) == len(set(ids)) == 7
+    assert make_event_id(shared) in ids
+
+
+def test_an_empty_events_file():
+    clubs = make_clubs(3, events_per_club=2)
+    save_to_file("clubs.json", clubs)
+    save_to_file("events.json", [])
+
+    assert migrate_events("clubs.json", "events.json") is not None
+    assert len(load_from_file("events.json")) == 6
+    assert all(
+        isinstance(event_id, str)
+        for club in load_from_file("clubs.json")
+        for event_id in club["events"]
+    )
+
+
+def test_migrated_files_are_left_alone():
+    save_to_file("clubs.json", make_clubs(3, events_per_club=2))
+    save_to_file("events.json", [])
+    migrate_events("clubs.json", "events.json")
+    clubs = load_from_file("clubs.json")
+    events = load_from_file("events.json")
+
+    assert migrate_events("clubs.json", "events.json") is None
+    assert load_from_file("clubs.json") == clubs
+    assert load_from_file("events.json") == events
+
+
+def test_clubs_without_events_are_not_migrated():
+    clubs = make_clubs(3)
+    save_to_file("clubs.json", clubs)
+    save_to_file("events.json", [])
+
+    assert migrate_events("clubs.json", "events.json") is None
+    assert load_from_file("clubs.json") == clubs
+
+
+def test_get_events_gives_dictionaries_for_every_kind_of_event():
+    nested = make_events(3)
+    stored = {**nested[0], "event_id": make_event_id(nested[0])}
+    save_to_file("events.json", [stored])
+    club_dict = make_clubs(1)[0]
+    event = Event(
+        "Chess Club",
+        datetime.datetime(2024, 10, 31),
+        "https://sop.utoronto.ca/event/games/",
+        "Games",
+        "Bring a board.",
+    )
+    club = Club(
+        **{**club_dict, "events": [stored["event_id"], nested[1], event]}
+    )
+
+    events = club.get_events()
+    assert events == [
+        stored,
+        {**nested[1], "event_id": make_event_id(nested[1])},
+        event.to_dict(),
+    ]
+    assert [e["event_id"] for e in events] == club.get_event_ids()
@@ -0,0 +1,103 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests that the query cache works a result out once
+per data version, and drops the least recently used results when full.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+from Query_Cache import QueryCache
+
+
+class Counter:
+    """
+    Counts how many times each result is worked out.
+
+    Attributes:
+    calls: A dictionary of key -> number of times it was worked out.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the Counter class.
+        """
+        self.calls = {}
+
+    def compute(self, key):
+        """
+        Makes a function that works out the result of a key.
+
+        :param key: The key.
+        :return: A function with no arguments.
+        """
+
+        def result():
+            self.calls[key] = self.calls.get(key, 0) + 1
+            return [key]
+
+        return result
+
+
+def test_a_result_is_worked_out_once_per_version():
+    cache = QueryCache()
+    counter = Counter()
+
+    first = cache.get(("clubs", "UTM"), 1, counter.compute("UTM"))
+    assert cache.get(("clubs", "UTM"), 1, counter.compute("UTM")) is first
+    assert counter.calls == {"UTM": 1}
+
+    assert cache.get(("clubs", "UTM"), 2, counter.compute("UTM")) == ["UTM"]
+    assert counter.calls == {"UTM": 2}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_the_least_recently_used_result_is_dropped():
+    cache = QueryCache(capacity=3)
+    counter = Counter()
+    for key in "abc":
+        cache.get((key,), 1, counter.compute(key))
+    cache.get(("a",), 1, counter.compute("a"))
+    cache.get(("d",), 1, counter.compute("d"))
+
+    # b was used least recently, a was used again
+    for key in "acd":
+        cache.get((key,), 1, counter.compute(key))
+    assert counter.calls == {"a": 1, "b": 1, "c": 1, "d": 1}
+    cache.get(("b",), 1, counter.compute("b"))
+    assert counter.calls["b"] == 2
+    assert cache.stats()["size"] == 3
+    assert cache.stats()["evictions"] == 2
+
+
+def test_a_result_made_for_an_old_version_is_not_kept():
+    cache = QueryCache()
+    counter = Counter()
+
+    def slow():
+        # the data changes while the result is worked out
+        cache.get(("other",), 2, counter.compute("other"))
+        return counter.compute("old")()
+
+    assert cache.get(("old",), 1, slow) == ["old"]
+    cache.get(("old",), 2, counter.compute("old"))
+    assert counter.calls["old"] == 2
+
+
+def test_invalidate_drops_every_result():
+    cache = QueryCache()
+    counter = Counter()
+    cache.get(("a",), 1, counter.compute("a"))
+    cache.invalidate()
+    cache.get(("a",), 1, counter.compute("a"))
+    assert counter.calls == {"a": 2}
+    assert cache.stats()["hit_rate"] == 0.0
@@ -0,0 +1,92 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests that the startup snapshot is only used while it
+matches the JSON files, and that favouriting a club keeps it up to date.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+from Database import (
+    CLUBS_FILE,
+    EVENTS_FILE,
+    flush_writes,
+    load_from_file,
+    save_to_file,
+    update_later,
+)
+from Snapshot import (
+    build_snapshot,
+    load_descriptions,
+    load_snapshot,
+    rebuild_snapshot,
+)
+from benchmarks.synthetic import make_clubs
+
+
+def make_files(count: int = 20) -> list:
+    """
+    Writes clubs without events and an empty events file, and builds the
+    snapshot from them.
+
+    :param count: The number of clubs.
+    :return: The list of club dictionaries.
+    """
+    clubs = make_clubs(count)
+    save_to_file(CLUBS_FILE, clubs)
+    save_to_file(EVENTS_FILE, [])
+    rebuild_snapshot()
+    return clubs
+
+
+def test_the_snapshot_matches_the_files():
+    clubs = make_files()
+    snapshot = load_snapshot()
+
+    assert snapshot["columns"]["name"] == [club["name"] for club in clubs]
+    blob = load_descriptions()
+    assert [blob.get(i) for i in range(len(blob))] == [
+        club["description"] for club in clubs
+    ]
+
+
+def test_a_favourite_keeps_the_snapshot_up_to_date():
+    clubs = make_files()
+    for club in clubs[:3]:
+        update_later(
+            CLUBS_FILE,
+            "original_url",
+            club["original_url"],
+            {"is_favourited": not club["is_favourited"]},
+        )
+    flush_writes()
+
+    snapshot = load_snapshot()
+    assert snapshot is not None and load_descriptions() is not None
+    rebuilt = build_snapshot(load_from_file(CLUBS_FILE), [])
+    assert snapshot["columns"] == rebuilt["columns"]
+    assert snapshot["columns"]["is_favourited"][:3] == [
+        not club["is_favourited"] for club in clubs[:3]
+    ]
+
+
+def test_other_changes_make_the_snapshot_stale():
+    clubs = make_files()
+    clubs[0]["name"] = "Renamed Club"
+    save_to_file(CLUBS_FILE, clubs)
+    assert load_snapshot() is None
+
+    make_files()
+    update_later(
+        CLUBS_FILE, "original_url", clubs[1]["original_url"], {"name": "New"}
+    )
+    flush_writes()
+    assert load_snapshot() is None
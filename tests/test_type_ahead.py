@@ -0,0 +1,130 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests the type-ahead suggestions against going through
+every label, that a word with one typo (a letter deleted, added, changed or
+swapped) is still found, and that a label deleted from the items is no
+longer suggested.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import random
+
+import pytest
+
+from Type_Ahead import LIMIT, WORD, TypeAheadIndex, within_one_edit
+from benchmarks.synthetic import WORDS
+
+
+def make_items(count: int, seed: int = 0) -> list:
+    """
+    Makes labels of random words, each with a number as its value.
+
+    :param count: The number of labels.
+    :param seed: The random seed.
+    :return: A list of (label, value) tuples.
+    """
+    rng = random.Random(seed)
+    return [
+        (" ".join(rng.choices(WORDS, k=rng.randint(1, 4))).title(), i)
+        for i in range(count)
+    ]
+
+
+def expected(items: list, text: str, limit: int = LIMIT) -> list:
+    """
+    Finds the suggestions by going through every label, for text without
+    typos.
+
+    :param items: The list of (label, value) tuples.
+    :param text: The text typed.
+    :param limit: The most suggestions.
+    :return: The list of (label, value) tuples, best first.
+    """
+    *whole, prefix = WORD.findall(text.lower())
+    found = [
+        item
+        for item in items
+        if set(whole) <= set(WORD.findall(item[0].lower()))
+        and any(
+            word.startswith(prefix) for word in WORD.findall(item[0].lower())
+        )
+    ]
+    found.sort(key=lambda item: (len(item[0]), item[0].lower()))
+    return found[:limit]
+
+
+def labels(items: list) -> list:
+    """
+    :param items: A list of (label, value) tuples.
+    :return: The labels.
+    """
+    return [label for label, value in items]
+
+
+def test_prefixes_match_going_through_every_label():
+    items = make_items(2000)
+    index = TypeAheadIndex()
+    index.build(items)
+    for word in WORDS:
+        for end in range(1, len(word) + 1):
+            prefix = word[:end]
+            assert labels(index.suggest(prefix)) == labels(
+                expected(items, prefix)
+            ), prefix
+
+
+def test_several_words_match_going_through_every_label():
+    items = make_items(2000)
+    index = TypeAheadIndex()
+    index.build(items)
+    rng = random.Random(1)
+    for _ in range(200):
+        *whole, last = rng.sample(WORDS, rng.randint(2, 3))
+        text = " ".join(whole + [last[: rng.randint(1, len(last))]])
+        assert labels(index.suggest(text)) == labels(expected(items, text))
+
+
+@pytest.mark.parametrize(
+    "typed",
+    ["robtics", "robbotics", "robotucs", "rbootics"],
+    ids=["deleted", "added", "changed", "swapped"],
+)
+def test_a_word_with_one_typo_is_found(typed):
+    assert within_one_edit(typed, "robotics")
+    index = TypeAheadIndex()
+    index.build([("Robotics Club", 1), ("Chess Club", 2)])
+    assert index.suggest(typed) == [("Robotics Club", 1)]
+    assert index.suggest("club " + typed) == [("Robotics Club", 1)]
+
+
+def test_short_words_are_not_corrected():
+    index = TypeAheadIndex()
+    index.build([("Art Club", 1)])
+    assert index.suggest("at") == []
+    assert index.suggest("art") == [("Art Club", 1)]
+
+
+def test_a_deleted_label_is_no_longer_suggested():
+    items = make_items(500)
+    index = TypeAheadIndex()
+    index.build(items, key=1)
+    first = index.suggest("chess")
+    assert first
+
+    # the best label for the prefix is deleted, the next ones move up
+    items.remove(first[0])
+    index.build(items, key=2)
+    assert index.key == 2
+    assert first[0] not in index.suggest("chess")
+    assert index.suggest("chess") == expected(items, "chess")
+    assert index.suggest("ches", 3) == expected(items, "ches", 3)
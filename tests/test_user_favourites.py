@@ -0,0 +1,98 @@
+"""
+University of Toronto
+Faculty of Information
+Bachelor of Information
+INF452: Information Design Studio V: Coding
+
+Student Name: Caitlyn Hundey, Mary Zhao, Qing Zhang
+
+Final Project
+
+Purpose: This program tests that favouriting a club in the app saves the
+favourites of the person using the app for every user, and that the API
+answers /favourites from them.
+
+Date Created: 2026-10-19
+Date Last Modified: 2026-10-19
+"""
+
+import json
+
+import pytest
+
+from Api_Server import ApiError, ClubApi
+from Club_Store import club_store
+from Database import flush_writes, save_to_file
+from User_Favourites import APP_USER, UserFavourites, user_favourites
+from benchmarks.synthetic import make_clubs
+
+
+def make_clubs_file(count: int = 20) -> list:
+    """
+    Writes clubs that are not favourited and an empty events file.
+
+    :param count: The number of clubs.
+    :return: The list of Club objects.
+    """
+    clubs = make_clubs(count)
+    for club in clubs:
+        club["is_favourited"] = False
+    save_to_file("clubs.json", clubs)
+    save_to_file("events.json", [])
+    return club_store.get_clubs()
+
+
+def get_favourites(target: str) -> list:
+    """
+    Asks the API for one page of favourites.
+
+    :param target: The path and query.
+    :return: The list of (name, users) tuples.
+    """
+    status, headers, body = ClubApi().handle("GET", target, {})
+    assert status == 200
+    return [
+        (club["name"], club["users"]) for club in json.loads(body)["items"]
+    ]
+
+
+def test_favouriting_in_the_app_is_saved_for_the_app_user():
+    clubs = make_clubs_file()
+    for club in clubs[:4]:
+        club.favourite()
+    clubs[1].unfavourite()
+    flush_writes()
+
+    expected = [clubs[i].get_original_url() for i in (0, 2, 3)]
+    assert sorted(user_favourites.favourites(APP_USER)) == sorted(expected)
+    # read again from the files, as another app would
+    assert sorted(UserFavourites().favourites(APP_USER)) == sorted(expected)
+
+
+def test_the_api_answers_the_favourites_of_users():
+    clubs = make_clubs_file()
+    clubs[0].favourite()
+    clubs[1].favourite()
+    flush_writes()
+    user_favourites.favourite("friend", clubs[1].get_original_url())
+    user_favourites.favourite("friend", clubs[2].get_original_url())
+
+    names = [club.get_name() for club in clubs]
+    target = f"/favourites?user={APP_USER}&user=friend"
+    assert get_favourites(target) == [(names[1], 2)]
+    assert get_favourites(target + "&match=any") == [
+        (names[0], 1),
+        (names[1], 2),
+        (names[2], 1),
+    ]
+
+    # the answer changes with the favourites
+    user_favourites.unfavourite("friend", clubs[1].get_original_url())
+    assert get_favourites(target) == []
+
+
+@pytest.mark.parametrize("query", ["", "?user=a&match=some"])
+def test_a_bad_favourites_query_is_refused(query):
+    with pytest.raises(ApiError) as error:
+        ClubApi().route("/favourites" + query, "v1")
+    assert error.value.status == 400